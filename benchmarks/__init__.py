@@ -0,0 +1,180 @@
+"""
+Provides a small benchmark harness for contracts.
+"""
+
+import gc
+import json
+import platform
+import statistics
+import sys
+import time
+import tracemalloc
+
+
+class Benchmark(object):
+    """
+    A named operation to be timed.
+    :param str name: The name of the benchmark, e.g. `dump/string`.
+    :param func: A callable without arguments running the operation once.
+    :param str group: The group of the benchmark, `contracts` or `marshmallow`.
+    """
+
+    def __init__(self, name, func, group='contracts'):
+        self.name = name
+        self.func = func
+        self.group = group
+
+    def __repr__(self):
+        return '<Benchmark(name={0!r}, group={1!r})>'.format(self.name, self.group)
+
+
+def measure(benchmark, repeat=5, min_time=0.1, warmup=0.05):
+    """
+    Runs `benchmark` and returns its statistics.
+
+    The operation is warmed up for `warmup` seconds, then the number of iterations that
+    takes about `min_time` seconds is timed `repeat` times, the allocations are measured
+    in a separate run as tracing slows down the operation.
+    """
+    func = benchmark.func
+
+    deadline = time.perf_counter() + warmup
+    loops = 0
+    while True:
+        func()
+        loops += 1
+        if time.perf_counter() >= deadline:
+            break
+
+    elapsed = warmup / loops
+    number = max(1, int(min_time / elapsed)) if elapsed > 0 else 1
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            start = time.perf_counter_ns()
+            for _ in range(number):
+                func()
+            timings.append((time.perf_counter_ns() - start) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    blocks, size = allocations(func)
+
+    return {
+        'name': benchmark.name,
+        'group': benchmark.group,
+        'loops': number,
+        'repeat': repeat,
+        'min_ns': min(timings),
+        'mean_ns': statistics.mean(timings),
+        'median_ns': statistics.median(timings),
+        'stdev_ns': statistics.stdev(timings) if len(timings) > 1 else 0.0,
+        'alloc_blocks': blocks,
+        'alloc_peak_bytes': size,
+    }
+
+
+def allocations(func):
+    """
+    Returns the number of memory blocks held by the result of `func` and the peak
+    of memory allocated while running it once.
+    """
+    func()
+    tracemalloc.start()
+    try:
+        tracemalloc.clear_traces()
+        tracemalloc.reset_peak()
+        result = func()
+        peak = tracemalloc.get_traced_memory()[1]
+        blocks = sum(stat.count for stat in tracemalloc.take_snapshot().statistics('filename'))
+    finally:
+        tracemalloc.stop()
+
+    del result
+    return blocks, peak
+
+
+def run(benchmarks, repeat=5, min_time=0.1, warmup=0.05, out=None):
+    """
+    Measures every benchmark and returns the results, printing each one to `out` if given.
+    Benchmarks raising an unexpected error are recorded with the `error` instead of the timings.
+    """
+    results = []
+
+    for benchmark in benchmarks:
+        try:
+            result = measure(benchmark, repeat, min_time, warmup)
+        except Exception as e:
+            result = {'name': benchmark.name, 'group': benchmark.group, 'error': repr(e)}
+
+        results.append(result)
+
+        if out is not None:
+            out.write(format_result(result) + '\n')
+            out.flush()
+
+    return results
+
+
+def format_result(result, baseline=None):
+    if 'error' in result:
+        return '{0:<12} {1:<40} failed: {2}'.format(result['group'], result['name'], result['error'])
+
+    line = '{0:<12} {1:<40} {2:>14} ns/op {3:>8} blocks {4:>10} B peak'.format(
+        result['group'], result['name'], '{0:,.0f}'.format(result['min_ns']),
+        result['alloc_blocks'], result['alloc_peak_bytes'])
+
+    if baseline is not None and 'error' not in baseline:
+        line += '  {0:+.1%}'.format(result['min_ns'] / baseline['min_ns'] - 1)
+
+    return line
+
+
+def metadata():
+    return {
+        'python': sys.version.split()[0],
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%S'),
+    }
+
+
+def save(path, results):
+    with open(path, 'w') as f:
+        json.dump({'metadata': metadata(), 'results': results}, f, indent=2)
+
+
+def load(path):
+    with open(path) as f:
+        return json.load(f)['results']
+
+
+def compare(results, baseline, threshold=0.1):
+    """
+    Compares `results` with `baseline` by the minimum time per operation and
+    returns the lines of the report along with the names of the regressions,
+    the benchmarks slower than `threshold`, failing or missing from `results`.
+    """
+    baseline = {(result['group'], result['name']): result for result in baseline}
+    lines = []
+    regressions = []
+
+    for result in results:
+        previous = baseline.pop((result['group'], result['name']), None)
+        lines.append(format_result(result, previous))
+
+        if 'error' in result:
+            regressions.append(result['name'])
+        elif previous is not None and 'error' not in previous and \
+                result['min_ns'] > previous['min_ns'] * (1 + threshold):
+            regressions.append(result['name'])
+
+    for group, name in baseline:
+        lines.append('{0:<12} {1:<40} missing'.format(group, name))
+        regressions.append(name)
+
+    return lines, regressions
@@ -0,0 +1,61 @@
+"""
+Runs the benchmarks, e.g. `python -m benchmarks --output results.json --baseline baseline.json`.
+
+The cold start is measured by `python -m benchmarks -k "startup/*"`, which times
+importing contracts in a new interpreter and defining a contract class.
+"""
+
+import argparse
+import fnmatch
+import sys
+
+from . import compare, load, run, save
+from .cases import contract_benchmarks, marshmallow_benchmarks, startup_benchmarks, threaded_benchmarks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks', description='Benchmarks contracts.')
+    parser.add_argument('-k', '--filter', action='append',
+                        help='only runs the benchmarks whose names match this pattern, e.g. "dump/*"')
+    parser.add_argument('--marshmallow', action='store_true', help='also runs the marshmallow benchmarks')
+    parser.add_argument('--repeat', type=int, default=5, help='the number of timed runs of each benchmark')
+    parser.add_argument('--min-time', type=float, default=0.1, help='the minimum duration of each run, in seconds')
+    parser.add_argument('--warmup', type=float, default=0.05, help='the warmup duration, in seconds')
+    parser.add_argument('-o', '--output', help='writes the results as JSON to this file')
+    parser.add_argument('-b', '--baseline', help='compares the results with a previous JSON output')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='the slowdown over the baseline reported as a regression, default 0.1 (10%%)')
+    args = parser.parse_args(argv)
+
+    benchmarks = contract_benchmarks() + threaded_benchmarks() + startup_benchmarks()
+
+    if args.marshmallow:
+        benchmarks += marshmallow_benchmarks()
+
+    if args.filter:
+        benchmarks = [b for b in benchmarks if any(fnmatch.fnmatch(b.name, f) for f in args.filter)]
+
+    results = run(benchmarks, args.repeat, args.min_time, args.warmup,
+                  out=None if args.baseline else sys.stdout)
+
+    if args.output:
+        save(args.output, results)
+
+    if args.baseline:
+        # only the baseline benchmarks selected by the options are expected in the results.
+        baseline = [result for result in load(args.baseline)
+                    if (args.marshmallow or result['group'] != 'marshmallow') and
+                    (not args.filter or any(fnmatch.fnmatch(result['name'], f) for f in args.filter))]
+
+        lines, regressions = compare(results, baseline, args.threshold)
+        print('\n'.join(lines))
+
+        if regressions:
+            print('\nregressions: ' + ', '.join(regressions))
+            return 1
+
+    return 1 if any('error' in result for result in results) else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
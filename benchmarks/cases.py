@@ -0,0 +1,272 @@
+"""
+Provides the benchmarks of contracts and, when installed, marshmallow.
+"""
+
+import subprocess
+import sys
+
+from concurrent.futures import ThreadPoolExecutor
+
+from datetime import date, datetime
+from uuid import UUID
+
+from contracts import Contract, fields
+from contracts.exceptions import ValidationError
+
+from . import Benchmark
+
+
+MANY_SIZE = 1000
+NESTED_DEPTHS = (1, 3, 5)
+THREADS = 4
+
+
+FIELDS = {
+    'boolean': (fields.Boolean, True, 'true'),
+    'date': (fields.Date, date(2017, 5, 20), '2017-05-20'),
+    'datetime': (fields.DateTime, datetime(2017, 5, 20, 13, 10, 5), '2017-05-20T13:10:05'),
+    'float': (fields.Float, 1.5, '1.5'),
+    'integer': (fields.Integer, 1234, '1234'),
+    'list': (lambda: fields.List(fields.Integer()), [1, 2, 3, 4], ['1', '2', '3', '4']),
+    'string': (fields.String, 'abcdefghijklmnopqrstuvwxyz', 'abcdefghijklmnopqrstuvwxyz'),
+    'uuid': (fields.UUID, UUID('825d7aeb-05a9-45b5-a5b7-05df87923cda'), '825d7aeb-05a9-45b5-a5b7-05df87923cda'),
+}
+
+
+class NestedContract(Contract):
+    property1 = fields.String()
+    property2 = fields.String()
+
+
+class FullContract(Contract):
+    boolean = fields.Boolean()
+    date = fields.Date()
+    datetime = fields.DateTime()
+    float = fields.Float()
+    integer = fields.Integer()
+    list = fields.List(fields.Integer())
+    string = fields.String()
+    uuid = fields.UUID()
+    nested = fields.Nested(NestedContract)
+
+
+DUMP_DATA = dict({name: value for name, (_, value, _) in FIELDS.items()},
+                 nested={'property1': '123', 'property2': '456'})
+
+LOAD_DATA = dict({name: value for name, (_, _, value) in FIELDS.items()},
+                 nested={'property1': '123', 'property2': '456'})
+
+INVALID_DATA = {'boolean': 'abc', 'float': 'abc', 'integer': 'abc', 'list': [1, 'a'], 'string': None,
+                'uuid': 'abc', 'nested': 1}
+
+
+def field_contract(name):
+    field, _, _ = FIELDS[name]
+    return type(name.title() + 'Contract', (Contract,), {'value': field()})
+
+
+def nested_contract(depth):
+    contract = NestedContract
+
+    for level in range(depth):
+        contract = type('Nested%dContract' % (level + 1), (Contract,), {
+            'value': fields.Integer(), 'nested': fields.Nested(contract)})
+
+    return contract
+
+
+def nested_data(depth):
+    data = {'property1': '123', 'property2': '456'}
+
+    for _ in range(depth):
+        data = {'value': 1, 'nested': data}
+
+    return data
+
+
+def define_contract():
+    """
+    Defines a contract equivalent to `FullContract`, as done when a module with contracts is imported.
+    """
+    return type('DefinedContract', (Contract,), {
+        'boolean': fields.Boolean(),
+        'date': fields.Date(),
+        'datetime': fields.DateTime(),
+        'float': fields.Float(min_value=0),
+        'integer': fields.Integer(min_value=0, max_value=100),
+        'list': fields.List(fields.Integer()),
+        'string': fields.String(max_length=100, error_messages={'blank': 'Required.'}),
+        'uuid': fields.UUID(),
+        'nested': fields.Nested(NestedContract),
+    })
+
+
+def import_contracts():
+    """
+    Imports contracts in a new interpreter, which includes the interpreter startup.
+    """
+    subprocess.run([sys.executable, '-c', 'import contracts'], check=True)
+
+
+def startup_benchmarks():
+    """
+    Returns the benchmarks of the cold start, `startup/import` imports contracts in
+    a new interpreter and `startup/define` defines a contract class and creates the
+    first instance, which prepares its fields.
+    """
+    return [
+        Benchmark('startup/import', import_contracts),
+        Benchmark('startup/define', lambda: define_contract()()),
+    ]
+
+
+def _failing(func):
+    def run():
+        try:
+            func()
+        except ValidationError:
+            pass
+    return run
+
+
+def contract_benchmarks():
+    benchmarks = []
+
+    for name, (_, dump_value, load_value) in sorted(FIELDS.items()):
+        contract = field_contract(name)()
+        dump_data = {'value': dump_value}
+        load_data = {'value': load_value}
+        benchmarks.append(Benchmark('dump/' + name, lambda c=contract, d=dump_data: c.dump(d)))
+        benchmarks.append(Benchmark('load/' + name, lambda c=contract, d=load_data: c.load(d)))
+
+    contract = FullContract()
+    many_contract = FullContract(many=True)
+    dump_many = [DUMP_DATA] * MANY_SIZE
+    load_many = [LOAD_DATA] * MANY_SIZE
+
+    benchmarks += [
+        Benchmark('init', FullContract),
+        Benchmark('init/many', lambda: FullContract(many=True)),
+        Benchmark('dump', lambda: contract.dump(DUMP_DATA)),
+        Benchmark('load', lambda: contract.load(LOAD_DATA)),
+        Benchmark('dump/many[%d]' % MANY_SIZE, lambda: many_contract.dump(dump_many)),
+        Benchmark('load/many[%d]' % MANY_SIZE, lambda: many_contract.load(load_many)),
+    ]
+
+    json_many = many_contract.dump_json(dump_many)
+    binary_many = many_contract.dump_binary(dump_many)
+
+    columns = list(LOAD_DATA)
+    rows = [tuple(LOAD_DATA.values())] * MANY_SIZE
+
+    benchmarks.append(Benchmark('load_rows[%d]' % MANY_SIZE, lambda: contract.load_rows(rows, columns)))
+
+    benchmarks += [
+        Benchmark('dump_json/many[%d]' % MANY_SIZE, lambda: many_contract.dump_json(dump_many)),
+        Benchmark('load_json/many[%d]' % MANY_SIZE, lambda: many_contract.load_json(json_many)),
+        Benchmark('dump_binary/many[%d]' % MANY_SIZE, lambda: many_contract.dump_binary(dump_many)),
+        Benchmark('load_binary/many[%d]' % MANY_SIZE, lambda: many_contract.load_binary(binary_many)),
+    ]
+
+    for depth in NESTED_DEPTHS:
+        nested = nested_contract(depth)()
+        data = nested_data(depth)
+        benchmarks.append(Benchmark('dump/nested[%d]' % depth, lambda c=nested, d=data: c.dump(d)))
+        benchmarks.append(Benchmark('load/nested[%d]' % depth, lambda c=nested, d=data: c.load(d)))
+
+    only = {'integer', 'string', 'nested.property1'}
+    exclude = {'date', 'datetime', 'uuid', 'nested.property2'}
+    only_contract = FullContract(only=only)
+    exclude_contract = FullContract(exclude=exclude)
+
+    benchmarks += [
+        Benchmark('init/only', lambda: FullContract(only=only)),
+        Benchmark('init/exclude', lambda: FullContract(exclude=exclude)),
+        Benchmark('dump/only', lambda: only_contract.dump(DUMP_DATA)),
+        Benchmark('dump/exclude', lambda: exclude_contract.dump(DUMP_DATA)),
+        Benchmark('dump/only-per-call', lambda: contract.dump(DUMP_DATA, only=only)),
+        Benchmark('load/only', lambda: only_contract.load(LOAD_DATA)),
+        Benchmark('load/exclude', lambda: exclude_contract.load(LOAD_DATA)),
+    ]
+
+    invalid_many = [INVALID_DATA] * MANY_SIZE
+
+    benchmarks += [
+        Benchmark('load/errors', _failing(lambda: contract.load(INVALID_DATA))),
+        Benchmark('load/errors-messages', _failing(lambda: _messages(contract.load, INVALID_DATA))),
+        Benchmark('load/errors/many[%d]' % MANY_SIZE, _failing(lambda: many_contract.load(invalid_many))),
+    ]
+
+    return benchmarks
+
+
+def threaded(func, items):
+    """
+    Runs `func` over `items` split between `THREADS` threads sharing the same contract.
+    """
+    chunks = [items[index::THREADS] for index in range(THREADS)]
+
+    def run():
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            for _ in executor.map(lambda chunk: [func(item) for item in chunk], chunks):
+                pass
+    return run
+
+
+def threaded_benchmarks():
+    """
+    Returns the throughput of a single shared contract dumping and loading
+    `MANY_SIZE` items from `THREADS` threads, e.g. a contract of a web server.
+    """
+    contract = FullContract()
+
+    return [
+        Benchmark('threaded/dump[%d]' % MANY_SIZE, threaded(contract.dump, [DUMP_DATA] * MANY_SIZE)),
+        Benchmark('threaded/load[%d]' % MANY_SIZE, threaded(contract.load, [LOAD_DATA] * MANY_SIZE)),
+    ]
+
+
+def _messages(load, data):
+    try:
+        load(data)
+    except ValidationError as e:
+        return e.messages
+
+
+def marshmallow_benchmarks():
+    """
+    Returns the benchmarks of marshmallow schemas equivalent to `FullContract`,
+    or an empty list when marshmallow is not installed.
+    """
+    try:
+        from marshmallow import Schema, fields as mmfields
+    except ImportError:
+        return []
+
+    class NestedSchema(Schema):
+        property1 = mmfields.String()
+        property2 = mmfields.String()
+
+    class FullSchema(Schema):
+        boolean = mmfields.Boolean()
+        date = mmfields.Date()
+        datetime = mmfields.DateTime()
+        float = mmfields.Float()
+        integer = mmfields.Integer()
+        list = mmfields.List(mmfields.Integer())
+        string = mmfields.String()
+        uuid = mmfields.UUID()
+        nested = mmfields.Nested(NestedSchema)
+
+    schema = FullSchema()
+    many_schema = FullSchema(many=True)
+    dump_many = [DUMP_DATA] * MANY_SIZE
+    load_many = [LOAD_DATA] * MANY_SIZE
+
+    return [
+        Benchmark('init', FullSchema, 'marshmallow'),
+        Benchmark('dump', lambda: schema.dump(DUMP_DATA), 'marshmallow'),
+        Benchmark('load', lambda: schema.load(LOAD_DATA), 'marshmallow'),
+        Benchmark('dump/many[%d]' % MANY_SIZE, lambda: many_schema.dump(dump_many), 'marshmallow'),
+        Benchmark('load/many[%d]' % MANY_SIZE, lambda: many_schema.load(load_many), 'marshmallow'),
+    ]
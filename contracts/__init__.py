@@ -1 +1,3 @@
+from .cache import DumpCache
 from .contract import Contract, Context
+from .profiling import Profiler, profile
@@ -0,0 +1,41 @@
+"""
+Encodes and decodes a compact binary format driven by the contract plans.
+"""
+
+from .contract cimport BaseContract, Context, FieldPlan
+from .fields cimport Field, List
+
+
+cdef class BinarySchema(object):
+    cdef public list fields
+    cdef public bytes fingerprint
+    cdef int[:] kinds
+    cdef int[:] load_kinds
+    cdef int[:] dump_indexes
+    cdef Py_ssize_t bitmap_size
+    cdef bint supports_dump
+    cdef bint supports_load
+
+
+cdef class BinaryReader(object):
+    cdef object source
+    cdef const unsigned char[:] data
+    cdef Py_ssize_t length
+    cdef Py_ssize_t position
+
+
+cdef BinarySchema get_schema(BaseContract contract)
+
+cdef write_document(BaseContract contract, object data, bytearray buffer, Context context)
+cdef write_many(BaseContract contract, object data, bytearray buffer, Context context)
+cdef write_record(BaseContract contract, object data, bytearray buffer, Context context)
+cdef int write_field(Field field, int kind, object value, bytearray buffer, Context context) except -1
+cdef write_any(object value, bytearray buffer)
+
+cdef object read_document(BaseContract contract, object data, Context context)
+cdef object read_many(BaseContract contract, BinaryReader reader, Context context)
+cdef object read_record(BaseContract contract, BinaryReader reader, Context context)
+cdef object read_field(Field field, int kind, int load_kind, BinaryReader reader, Context context)
+cdef object read_list(List field, BinaryReader reader, Context context)
+cdef object read_any(BinaryReader reader)
+cdef skip_field(Field field, int kind, BinaryReader reader)
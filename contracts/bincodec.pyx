@@ -0,0 +1,954 @@
+"""
+Encodes and decodes a compact binary format driven by the contract plans.
+
+Both ends must share the contract, so the fields are written in the order
+they are declared, without keys. A document starts with the 8-byte fingerprint
+of the contract, which is checked on load, followed by a record, or the varint
+count of the records for `many` contracts.
+
+A record starts with a bitmap with 2 bits per field, telling whether the field is
+missing, None, has a value or has an extended value, followed by the values of the
+fields that have one:
+
+- integers and dates (as ordinals) are zigzag varints
+- floats are 8 bytes, little-endian
+- booleans are a single byte
+- strings are the varint length followed by the UTF-8 bytes
+- UUIDs are 16 bytes, big-endian
+- datetimes are a byte telling whether it is aware, followed by
+  the microseconds since the epoch, in UTC for the aware ones, as a zigzag varint
+- nested fields are records, or the varint count of the records when `many`
+- lists are the varint count of the items, each one preceded by a byte telling whether it is None,
+  has a value or has an extended value
+- the other fields are their dumped values, each one preceded by a byte telling its type
+
+Extended values are the ones that do not fit the encoding of their field, like the integers
+wider than 64 bits, and are written like the values of the other fields.
+"""
+
+cimport cython
+import uuid
+
+from cpython cimport array
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE, PyByteArray_Resize
+from cpython.datetime cimport date, datetime, timedelta, import_datetime, timedelta_new
+from cpython.datetime cimport timedelta_days, timedelta_seconds, timedelta_microseconds
+from cpython.long cimport PyLong_AsLongLongAndOverflow
+from cpython.object cimport PyObject_GenericSetAttr
+from cpython.unicode cimport PyUnicode_AsUTF8String, PyUnicode_DecodeUTF8
+from libc.stdint cimport uint64_t
+from libc.string cimport memcmp, memcpy, memset
+
+from . import timezone
+from .contract cimport Accessor, BaseContract, Context, FieldPlan
+from .contract cimport PRE_DUMP_INDEX, PRE_DUMP_MANY_INDEX, POST_DUMP_INDEX, POST_DUMP_MANY_INDEX
+from .contract cimport PRE_LOAD_INDEX, PRE_LOAD_MANY_INDEX, POST_LOAD_INDEX, POST_LOAD_MANY_INDEX
+from .exceptions cimport ContractError, ValidationError
+from .fields cimport Field, List, Nested, field_kind, load_kind, load_value
+from .fields cimport KIND_FIELD, KIND_BOOLEAN, KIND_DATE, KIND_DATETIME, KIND_FLOAT, KIND_INTEGER, KIND_LIST
+from .fields cimport KIND_NESTED, KIND_STRING, KIND_UUID
+from .utils cimport missing
+
+import_datetime()
+
+
+# The version of the format, part of the fingerprints.
+cdef str FORMAT_VERSION = '1'
+
+cdef Py_ssize_t FINGERPRINT_SIZE = 8
+
+cdef enum:
+    STATE_MISSING = 0
+    STATE_NONE = 1
+    STATE_VALUE = 2
+    STATE_EXTENDED = 3
+
+# The flags that precede the items of the lists.
+cdef enum:
+    ITEM_NONE = 0
+    ITEM_VALUE = 1
+    ITEM_EXTENDED = 2
+
+# The types of the values written by `write_any`.
+cdef enum:
+    TYPE_NONE = 0
+    TYPE_FALSE = 1
+    TYPE_TRUE = 2
+    TYPE_INT = 3
+    TYPE_FLOAT = 4
+    TYPE_STR = 5
+    TYPE_LIST = 6
+    TYPE_DICT = 7
+    TYPE_BIG_INT = 8
+
+cdef object EPOCH = datetime(1970, 1, 1)
+cdef object EPOCH_UTC = datetime(1970, 1, 1, tzinfo=timezone.utc)
+cdef object EPOCH_DATE = date(1970, 1, 1)
+cdef long long EPOCH_ORDINAL = EPOCH_DATE.toordinal()
+cdef long long MICROSECONDS_PER_DAY = 86400000000LL
+
+cdef object UUID_TYPE = uuid.UUID
+cdef object UUID_SAFE = uuid.SafeUUID.unknown
+
+# The plans whose schemas are being built, for contracts nested in themselves.
+cdef set BUILDING = set()
+
+
+cdef class BinarySchema(object):
+    """
+    The binary layout of a contract plan, built once per plan. All the fields
+    are written so the dump and load ends agree, the load only fields are
+    always missing on dump and the dump only fields are skipped on load.
+    """
+
+    def __init__(self, BaseContract contract):
+        cdef FieldPlan plan = contract._plan
+
+        self.fields = list(plan.fields.values())
+        self.kinds = _int_array([field_kind(field) for field in self.fields])
+        self.load_kinds = _int_array([load_kind(field) for field in self.fields])
+        self.dump_indexes = _int_array([_index_of(plan.dump_fields, field) for field in self.fields])
+        self.bitmap_size = (len(self.fields) + 3) // 4
+
+        self.supports_dump = plan.hooks[POST_DUMP_INDEX] == 0 and plan.hooks[POST_DUMP_MANY_INDEX] == 0
+        self.supports_load = plan.hooks[PRE_LOAD_INDEX] == 0 and plan.hooks[PRE_LOAD_MANY_INDEX] == 0
+
+        BUILDING.add(plan)
+
+        try:
+            description = ';'.join([FORMAT_VERSION] + [_describe(field) for field in self.fields])
+        finally:
+            BUILDING.discard(plan)
+
+        # hashlib is slow to import, so it is only imported by the contracts using the binary format.
+        import hashlib
+
+        self.fingerprint = hashlib.blake2b(description.encode('utf-8'), digest_size=FINGERPRINT_SIZE).digest()
+
+    def __repr__(self):
+        return '<BinarySchema(fingerprint={0!r})>'.format(self.fingerprint.hex())
+
+
+cdef BinarySchema get_schema(BaseContract contract):
+    cdef FieldPlan plan = contract._plan
+
+    if plan.binary_schema is None:
+        plan.binary_schema = BinarySchema(contract)
+
+    return <BinarySchema>plan.binary_schema
+
+
+cdef str _describe(Field field):
+    cdef int kind = field_kind(field)
+    cdef BaseContract contract
+
+    description = '{0}:{1}:{2}'.format(field.name, type(field).__name__, kind)
+
+    if kind == KIND_NESTED:
+        contract = (<Nested>field)._get_instance()
+
+        if contract._plan in BUILDING:
+            return '{0}:{1}.{2}'.format(description, type(contract).__module__, type(contract).__qualname__)
+
+        return '{0}:{1}:{2}'.format(description, contract.many, get_schema(contract).fingerprint.hex())
+
+    if kind == KIND_LIST:
+        return '{0}[{1}]'.format(description, _describe((<List>field).child))
+
+    return description
+
+
+cdef object _int_array(list values):
+    return array.array('i', values)
+
+
+cdef int _index_of(list fields, Field field):
+    for index, item in enumerate(fields):
+        if item is field:
+            return index
+    return -1
+
+
+cdef inline _check_dump(BaseContract contract, BinarySchema schema):
+    if not schema.supports_dump:
+        raise ValueError('{0} has post dump hooks, which are not supported by the binary format'.format(
+            type(contract).__name__))
+
+
+cdef inline _check_load(BaseContract contract, BinarySchema schema):
+    if not schema.supports_load:
+        raise ValueError('{0} has pre load hooks, which are not supported by the binary format'.format(
+            type(contract).__name__))
+
+
+cdef write_document(BaseContract contract, object data, bytearray buffer, Context context):
+    _write_bytes(buffer, get_schema(contract).fingerprint)
+
+    if contract.many:
+        write_many(contract, data, buffer, context)
+    else:
+        write_record(contract, data, buffer, context)
+
+
+cdef write_many(BaseContract contract, object data, bytearray buffer, Context context):
+    _check_dump(contract, get_schema(contract))
+
+    if contract._hooks[PRE_DUMP_MANY_INDEX] == 1:
+        data = contract._pre_dump_many(data, context)
+
+    # the count is written ahead of the records.
+    if not isinstance(data, (list, tuple)):
+        data = list(data)
+
+    _write_varint(buffer, len(data))
+
+    for item in data:
+        context.contract_data = item
+
+        write_record(contract, item, buffer, context)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef write_record(BaseContract contract, object data, bytearray buffer, Context context):
+    cdef BinarySchema schema = get_schema(contract)
+
+    _check_dump(contract, schema)
+
+    if contract._hooks[PRE_DUMP_INDEX] == 1:
+        data = contract._pre_dump(data, context)
+
+    cdef FieldPlan plan = contract._plan
+    cdef list fields = schema.fields
+    cdef int[:] kinds = schema.kinds
+    cdef int[:] dump_indexes = schema.dump_indexes
+
+    cdef Accessor accessor = plan.dump_accessor(data)
+    cdef object source = accessor.source(data)
+
+    cdef Py_ssize_t start = PyByteArray_GET_SIZE(buffer)
+    cdef Py_ssize_t index
+    cdef int dump_index
+    cdef int state
+    cdef int kind
+    cdef Field field
+    cdef object value
+
+    # the bitmap is filled as the values are written.
+    PyByteArray_Resize(buffer, start + schema.bitmap_size)
+    memset(PyByteArray_AS_STRING(buffer) + start, 0, schema.bitmap_size)
+
+    for index in range(len(fields)):
+        dump_index = dump_indexes[index]
+
+        if dump_index < 0:
+            continue
+
+        value = accessor.get(data, source, dump_index)
+        field = <Field>fields[index]
+        kind = kinds[index]
+
+        # generic fields may skip the value, so it is dumped before writing it.
+        # they may also override `dump`, so they receive the missing and None values too.
+        if kind == KIND_FIELD:
+            value = field.dump(value, context)
+
+            if value is missing:
+                continue
+
+        elif value is missing:
+            continue
+
+        if value is None:
+            state = STATE_NONE
+        else:
+            state = write_field(field, kind, value, buffer, context)
+
+        PyByteArray_AS_STRING(buffer)[start + index // 4] |= <char>(state << ((index % 4) * 2))
+
+
+cdef int write_field(Field field, int kind, object value, bytearray buffer, Context context) except -1:
+    """
+    Writes the value of the given field, `value` must not be None or missing.
+    Generic fields are expected to be dumped already.
+
+    Returns `STATE_EXTENDED` when the value does not fit the encoding of the field
+    and was written by `write_any`, `STATE_VALUE` otherwise.
+    """
+    cdef BaseContract contract
+    cdef Field child
+    cdef int child_kind
+    cdef int overflow = 0
+    cdef Py_ssize_t position
+
+    if kind == KIND_INTEGER:
+        if not isinstance(value, int):
+            value = int(value)
+
+        PyLong_AsLongLongAndOverflow(value, &overflow)
+
+        if overflow != 0:
+            write_any(value, buffer)
+            return STATE_EXTENDED
+
+        _write_int(buffer, value)
+
+    elif kind == KIND_STRING:
+        if not isinstance(value, str):
+            value = str(value)
+
+        _write_str(buffer, <str>value)
+
+    elif kind == KIND_FLOAT:
+        if not isinstance(value, float):
+            value = float(value)
+
+        _write_double(buffer, value)
+
+    elif kind == KIND_BOOLEAN:
+        _write_byte(buffer, 1 if field._dump(value, context) else 0)
+
+    elif kind == KIND_UUID:
+        _write_bytes(buffer, (<object>value.int).to_bytes(16, 'big'))
+
+    elif kind == KIND_DATETIME:
+        _write_datetime(buffer, value)
+
+    elif kind == KIND_DATE:
+        if isinstance(value, datetime):
+            value = value.date()
+
+        _write_signed(buffer, (<date>value).toordinal())
+
+    elif kind == KIND_NESTED:
+        contract = (<Nested>field)._get_instance()
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = contract
+        context.contract_data = value
+
+        if contract.many:
+            write_many(contract, value, buffer, context)
+        else:
+            write_record(contract, value, buffer, context)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+    elif kind == KIND_LIST:
+        child = (<List>field).child
+        child_kind = field_kind(child)
+
+        if not isinstance(value, (list, tuple)):
+            value = list(value)
+
+        _write_varint(buffer, len(value))
+
+        for item in value:
+            if child_kind == KIND_FIELD:
+                item = child.dump(item, context)
+
+            if item is None or item is missing:
+                _write_byte(buffer, ITEM_NONE)
+            else:
+                position = PyByteArray_GET_SIZE(buffer)
+                _write_byte(buffer, ITEM_VALUE)
+
+                if write_field(child, child_kind, item, buffer, context) == STATE_EXTENDED:
+                    PyByteArray_AS_STRING(buffer)[position] = ITEM_EXTENDED
+
+    else:
+        write_any(value, buffer)
+
+    return STATE_VALUE
+
+
+cdef write_any(object value, bytearray buffer):
+    """
+    Writes a dumped value preceded by its type, following the same rules of `json.dumps`.
+    """
+    cdef int overflow = 0
+
+    if value is None:
+        _write_byte(buffer, TYPE_NONE)
+
+    elif value is True:
+        _write_byte(buffer, TYPE_TRUE)
+
+    elif value is False:
+        _write_byte(buffer, TYPE_FALSE)
+
+    elif isinstance(value, str):
+        _write_byte(buffer, TYPE_STR)
+        _write_str(buffer, <str>value)
+
+    elif isinstance(value, int):
+        PyLong_AsLongLongAndOverflow(value, &overflow)
+
+        if overflow != 0:
+            _write_byte(buffer, TYPE_BIG_INT)
+            _write_str(buffer, int.__repr__(value))
+        else:
+            _write_byte(buffer, TYPE_INT)
+            _write_int(buffer, value)
+
+    elif isinstance(value, float):
+        _write_byte(buffer, TYPE_FLOAT)
+        _write_double(buffer, value)
+
+    elif isinstance(value, dict):
+        _write_byte(buffer, TYPE_DICT)
+        _write_varint(buffer, len(<dict>value))
+
+        for key, item in (<dict>value).items():
+            write_any(key, buffer)
+            write_any(item, buffer)
+
+    elif isinstance(value, (list, tuple)):
+        _write_byte(buffer, TYPE_LIST)
+        _write_varint(buffer, len(value))
+
+        for item in value:
+            write_any(item, buffer)
+
+    else:
+        raise TypeError('Object of type {0} is not serializable'.format(value.__class__.__name__))
+
+
+cdef inline _write(bytearray buffer, const char* data, Py_ssize_t size):
+    cdef Py_ssize_t length = PyByteArray_GET_SIZE(buffer)
+
+    # bytearray over-allocates when resized, appending is amortized O(1).
+    PyByteArray_Resize(buffer, length + size)
+    memcpy(PyByteArray_AS_STRING(buffer) + length, data, size)
+
+
+cdef inline _write_bytes(bytearray buffer, bytes value):
+    _write(buffer, value, len(value))
+
+
+cdef inline _write_byte(bytearray buffer, unsigned char value):
+    _write(buffer, <char*>&value, 1)
+
+
+cdef inline _write_varint(bytearray buffer, uint64_t value):
+    cdef unsigned char[10] data
+    cdef Py_ssize_t size = 0
+
+    while value >= 0x80:
+        data[size] = <unsigned char>(value & 0x7f) | 0x80
+        value >>= 7
+        size += 1
+
+    data[size] = <unsigned char>value
+
+    _write(buffer, <char*>data, size + 1)
+
+
+cdef inline _write_signed(bytearray buffer, long long value):
+    # zigzag keeps the small negative numbers short.
+    _write_varint(buffer, (<uint64_t>value << 1) ^ <uint64_t>(value >> 63))
+
+
+cdef inline _write_int(bytearray buffer, object value):
+    cdef int overflow = 0
+    cdef long long number = PyLong_AsLongLongAndOverflow(value, &overflow)
+
+    if overflow != 0:
+        raise OverflowError('{0} does not fit in 64 bits'.format(value))
+
+    _write_signed(buffer, number)
+
+
+cdef inline _write_double(bytearray buffer, double value):
+    cdef unsigned char[8] data
+    cdef uint64_t bits
+    cdef int index
+
+    memcpy(&bits, &value, 8)
+
+    for index in range(8):
+        data[index] = <unsigned char>(bits >> (index * 8))
+
+    _write(buffer, <char*>data, 8)
+
+
+cdef inline _write_str(bytearray buffer, str value):
+    cdef bytes data = PyUnicode_AsUTF8String(value)
+
+    _write_varint(buffer, len(data))
+    _write_bytes(buffer, data)
+
+
+cdef inline _write_datetime(bytearray buffer, object value):
+    if not isinstance(value, datetime):
+        # dates are loaded back as naive midnights, like their ISO format.
+        value = datetime((<date>value).year, (<date>value).month, (<date>value).day)
+
+    if value.utcoffset() is None:
+        delta = value - EPOCH
+        _write_byte(buffer, 0)
+    else:
+        delta = value - EPOCH_UTC
+        _write_byte(buffer, 1)
+
+    _write_signed(buffer, (timedelta_days(delta) * 86400LL + timedelta_seconds(delta)) * 1000000LL +
+                  timedelta_microseconds(delta))
+
+
+cdef class BinaryReader(object):
+    """
+    Keeps the position while reading a binary document, the
+    data is read through its buffer without being copied.
+    """
+
+    def __init__(self, object source):
+        self.source = source
+        self.data = source
+        self.length = self.data.shape[0]
+        self.position = 0
+
+    def fail(self, str message):
+        raise ValueError('{0}: position {1}'.format(message, self.position))
+
+
+cdef object read_document(BaseContract contract, object data, Context context):
+    cdef BinaryReader reader = BinaryReader(data)
+    cdef BinarySchema schema = get_schema(contract)
+    cdef Py_ssize_t start = _require(reader, FINGERPRINT_SIZE)
+
+    if memcmp(&reader.data[start], <const char*>schema.fingerprint, FINGERPRINT_SIZE) != 0:
+        raise ValueError('The data was not encoded by the same version of {0}'.format(type(contract).__name__))
+
+    if contract.many:
+        data = read_many(contract, reader, context)
+    else:
+        data = read_record(contract, reader, context)
+
+    if reader.position != reader.length:
+        reader.fail('Extra data')
+
+    return data
+
+
+cdef object read_many(BaseContract contract, BinaryReader reader, Context context):
+    _check_load(contract, get_schema(contract))
+
+    cdef Py_ssize_t count = _read_count(reader)
+    cdef Py_ssize_t index
+    cdef list items = []
+    cdef ContractError errors = None
+
+    # the records are always consumed, so the errors are raised at the end.
+    for index in range(count):
+        try:
+            items.append(read_record(contract, reader, context))
+        except ValidationError as err:
+            if errors is None:
+                errors = ContractError()
+
+            errors._messages[index] = err._messages
+
+    if errors:
+        raise errors
+
+    if contract._hooks[POST_LOAD_MANY_INDEX] == 1:
+        try:
+            items = contract._post_load_many(items, context)
+        except ValidationError as err:
+            raise ContractError([err])
+
+    return items
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object read_record(BaseContract contract, BinaryReader reader, Context context):
+    cdef BinarySchema schema = get_schema(contract)
+
+    _check_load(contract, schema)
+
+    cdef list fields = schema.fields
+    cdef int[:] kinds = schema.kinds
+    cdef int[:] load_kinds = schema.load_kinds
+    cdef Py_ssize_t start = _require(reader, schema.bitmap_size)
+
+    cdef ContractError errors = None
+    cdef dict result = {}
+    cdef object target = contract._new_target()
+    cdef Py_ssize_t index
+    cdef int state
+    cdef Field field
+    cdef object value
+
+    for index in range(len(fields)):
+        field = <Field>fields[index]
+        state = (reader.data[start + index // 4] >> ((index % 4) * 2)) & 3
+
+        if field.dump_only:
+            if state == STATE_VALUE:
+                skip_field(field, kinds[index], reader)
+            elif state == STATE_EXTENDED:
+                read_any(reader)
+
+            continue
+
+        try:
+            if state == STATE_VALUE:
+                value = read_field(field, kinds[index], load_kinds[index], reader, context)
+            elif state == STATE_EXTENDED:
+                value = load_value(field, load_kinds[index], read_any(reader), context)
+            elif state == STATE_NONE:
+                value = field.load(None, context)
+            elif state == STATE_MISSING:
+                if contract.partial:
+                    continue
+
+                value = field.load(missing, context)
+            else:
+                reader.fail('Invalid bitmap')
+        except ValidationError as err:
+            if not err.field_names:
+                err.field_names = [field.name]
+
+            if errors is None:
+                errors = ContractError([err])
+            else:
+                errors.add_error(err)
+
+            continue
+
+        if value is missing:
+            pass
+        elif target is None:
+            result[field.name] = value
+        else:
+            PyObject_GenericSetAttr(target, field.name, value)
+
+    if errors:
+        raise errors
+
+    if target is None:
+        target = result
+
+    if contract._hooks[POST_LOAD_INDEX] == 1:
+        try:
+            target = contract._post_load(target, context)
+        except ValidationError as err:
+            raise ContractError([err])
+
+    return target
+
+
+cdef object read_field(Field field, int kind, int load_kind, BinaryReader reader, Context context):
+    """
+    Reads and loads the value of the given field, the value is always
+    consumed before any validation error is raised.
+    """
+    cdef BaseContract contract
+    cdef object value
+
+    if kind == KIND_NESTED:
+        contract = (<Nested>field)._get_instance()
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = contract
+        context.contract_data = None
+
+        try:
+            if contract.many:
+                value = read_many(contract, reader, context)
+            else:
+                value = read_record(contract, reader, context)
+        finally:
+            context.contract = previous_contract
+            context.contract_data = previous_contract_data
+
+        if field.validators or field._method_validators:
+            field._validate(value, context)
+
+        return value
+
+    if kind == KIND_LIST:
+        return read_list(<List>field, reader, context)
+
+    return load_value(field, load_kind, _read_scalar(kind, reader), context)
+
+
+cdef object read_list(List field, BinaryReader reader, Context context):
+    cdef Field child = field.child
+    cdef int child_kind = field_kind(child)
+    cdef int child_load_kind = load_kind(child)
+    cdef Py_ssize_t count = _read_count(reader)
+    cdef Py_ssize_t index
+    cdef list result = []
+    cdef dict errors = None
+    cdef unsigned char flag
+
+    for index in range(count):
+        flag = reader.data[_require(reader, 1)]
+
+        try:
+            if flag == ITEM_VALUE:
+                result.append(read_field(child, child_kind, child_load_kind, reader, context))
+            elif flag == ITEM_EXTENDED:
+                result.append(load_value(child, child_load_kind, read_any(reader), context))
+            elif flag == ITEM_NONE:
+                result.append(child.load(None, context))
+            else:
+                reader.fail('Invalid list item')
+        except ValidationError as e:
+            if errors is None:
+                errors = {index: e._messages}
+            else:
+                errors[index] = e._messages
+
+    if count == 0 and not field.allow_empty:
+        field._fail('empty')
+
+    if errors:
+        raise ValidationError(errors)
+
+    if field.validators or field._method_validators:
+        field._validate(result, context)
+
+    return result
+
+
+cdef object read_any(BinaryReader reader):
+    """
+    Reads a value written by `write_any`.
+    """
+    cdef unsigned char value_type = reader.data[_require(reader, 1)]
+    cdef Py_ssize_t count
+    cdef dict obj
+    cdef list array
+
+    if value_type == TYPE_NONE:
+        return None
+
+    if value_type == TYPE_FALSE:
+        return False
+
+    if value_type == TYPE_TRUE:
+        return True
+
+    if value_type == TYPE_INT:
+        return _read_signed(reader)
+
+    if value_type == TYPE_FLOAT:
+        return _read_double(reader)
+
+    if value_type == TYPE_STR:
+        return _read_str(reader)
+
+    if value_type == TYPE_LIST:
+        count = _read_count(reader)
+        array = []
+
+        for _ in range(count):
+            array.append(read_any(reader))
+
+        return array
+
+    if value_type == TYPE_DICT:
+        count = _read_count(reader)
+        obj = {}
+
+        for _ in range(count):
+            key = read_any(reader)
+            obj[key] = read_any(reader)
+
+        return obj
+
+    if value_type == TYPE_BIG_INT:
+        return int(_read_str(reader))
+
+    reader.fail('Invalid value type')
+
+
+cdef skip_field(Field field, int kind, BinaryReader reader):
+    """
+    Skips the value of the given field without loading it.
+    """
+    cdef BaseContract contract
+    cdef Field child
+    cdef int child_kind
+    cdef Py_ssize_t count
+    cdef unsigned char flag
+
+    if kind == KIND_NESTED:
+        contract = (<Nested>field)._get_instance()
+
+        if contract.many:
+            for _ in range(_read_count(reader)):
+                _skip_record(contract, reader)
+        else:
+            _skip_record(contract, reader)
+
+    elif kind == KIND_LIST:
+        child = (<List>field).child
+        child_kind = field_kind(child)
+        count = _read_count(reader)
+
+        for _ in range(count):
+            flag = reader.data[_require(reader, 1)]
+
+            if flag == ITEM_VALUE:
+                skip_field(child, child_kind, reader)
+            elif flag == ITEM_EXTENDED:
+                read_any(reader)
+
+    else:
+        _read_scalar(kind, reader)
+
+
+cdef _skip_record(BaseContract contract, BinaryReader reader):
+    cdef BinarySchema schema = get_schema(contract)
+    cdef Py_ssize_t start = _require(reader, schema.bitmap_size)
+    cdef Py_ssize_t index
+    cdef int state
+
+    for index in range(len(schema.fields)):
+        state = (reader.data[start + index // 4] >> ((index % 4) * 2)) & 3
+
+        if state == STATE_VALUE:
+            skip_field(<Field>schema.fields[index], schema.kinds[index], reader)
+        elif state == STATE_EXTENDED:
+            read_any(reader)
+
+
+cdef object _read_scalar(int kind, BinaryReader reader):
+    cdef unsigned char flag
+    cdef long long micros
+    cdef long long days
+
+    if kind == KIND_INTEGER:
+        return _read_signed(reader)
+
+    if kind == KIND_STRING:
+        return _read_str(reader)
+
+    if kind == KIND_FLOAT:
+        return _read_double(reader)
+
+    if kind == KIND_BOOLEAN:
+        return reader.data[_require(reader, 1)] != 0
+
+    if kind == KIND_UUID:
+        return _read_uuid(reader)
+
+    if kind == KIND_DATETIME:
+        flag = reader.data[_require(reader, 1)]
+        micros = _read_signed(reader)
+        days = micros // MICROSECONDS_PER_DAY
+        micros -= days * MICROSECONDS_PER_DAY
+
+        # corrupted values may fall out of the range of the datetimes.
+        try:
+            delta = timedelta_new(days, micros // 1000000, micros % 1000000)
+            return EPOCH_UTC + delta if flag else EPOCH + delta
+        except OverflowError:
+            reader.fail('Invalid datetime')
+
+    if kind == KIND_DATE:
+        days = _read_signed(reader) - EPOCH_ORDINAL
+
+        try:
+            return EPOCH_DATE + timedelta_new(days, 0, 0)
+        except OverflowError:
+            reader.fail('Invalid date')
+
+    return read_any(reader)
+
+
+cdef inline Py_ssize_t _require(BinaryReader reader, Py_ssize_t size) except -1:
+    """
+    Consumes `size` bytes and returns the position where they start.
+    """
+    cdef Py_ssize_t start = reader.position
+
+    if size > reader.length - start:
+        reader.fail('Unexpected end of data')
+
+    reader.position = start + size
+    return start
+
+
+cdef inline uint64_t _read_varint(BinaryReader reader) except? 0:
+    cdef uint64_t value = 0
+    cdef int shift = 0
+    cdef unsigned char c
+
+    while True:
+        if shift > 63:
+            reader.fail('Invalid varint')
+
+        c = reader.data[_require(reader, 1)]
+        value |= <uint64_t>(c & 0x7f) << shift
+
+        if c < 0x80:
+            return value
+
+        shift += 7
+
+
+cdef inline long long _read_signed(BinaryReader reader) except? -1:
+    cdef uint64_t value = _read_varint(reader)
+
+    return <long long>(value >> 1) ^ -<long long>(value & 1)
+
+
+cdef inline Py_ssize_t _read_count(BinaryReader reader) except -1:
+    cdef uint64_t count = _read_varint(reader)
+
+    # every item takes at least a byte, what rejects bogus counts before allocating.
+    if count > <uint64_t>(reader.length - reader.position):
+        reader.fail('Invalid count')
+
+    return <Py_ssize_t>count
+
+
+cdef inline double _read_double(BinaryReader reader) except? -1:
+    cdef Py_ssize_t start = _require(reader, 8)
+    cdef uint64_t bits = 0
+    cdef double value
+    cdef int index
+
+    for index in range(8):
+        bits |= <uint64_t>reader.data[start + index] << (index * 8)
+
+    memcpy(&value, &bits, 8)
+    return value
+
+
+cdef inline object _read_uuid(BinaryReader reader):
+    cdef Py_ssize_t start = _require(reader, 16)
+    cdef uint64_t high = 0
+    cdef uint64_t low = 0
+    cdef int index
+
+    for index in range(8):
+        high = (high << 8) | reader.data[start + index]
+        low = (low << 8) | reader.data[start + 8 + index]
+
+    # the UUID is created without parsing its arguments, the same as `uuid.UUID(int=...)`.
+    value = UUID_TYPE.__new__(UUID_TYPE)
+    PyObject_GenericSetAttr(value, 'int', (<object>high << 64) | low)
+    PyObject_GenericSetAttr(value, 'is_safe', UUID_SAFE)
+    return value
+
+
+cdef inline str _read_str(BinaryReader reader):
+    cdef Py_ssize_t length = _read_count(reader)
+
+    if length == 0:
+        return ''
+
+    cdef Py_ssize_t start = _require(reader, length)
+
+    return PyUnicode_DecodeUTF8(<const char*>&reader.data[start], length, NULL)
@@ -0,0 +1,23 @@
+"""
+Provides bounded caches.
+"""
+
+
+cdef class LRUCache(object):
+    cdef public Py_ssize_t maxsize
+    cdef public Py_ssize_t hits
+    cdef public Py_ssize_t misses
+    cdef object _data
+
+    cpdef object get(self, object key, object default=*)
+    cpdef set(self, object key, object value)
+    cpdef clear(self)
+
+
+cdef class DumpCache(LRUCache):
+    cdef public object key
+    cdef public double ttl
+
+    cdef object make_key(self, object scope, object obj)
+    cdef object lookup(self, object key)
+    cdef store(self, object key, object result)
@@ -0,0 +1,140 @@
+"""
+Provides bounded caches.
+"""
+
+import time
+
+from collections import OrderedDict
+
+from .utils cimport missing
+
+
+cdef object MISSING = object()
+
+
+cdef class LRUCache(object):
+    """
+    A bounded mapping that discards the least recently used items,
+    it can be shared between threads since the items are only
+    looked up, set or discarded by single `OrderedDict` operations.
+    :param int maxsize: The maximum number of items.
+    """
+
+    def __init__(self, Py_ssize_t maxsize):
+        if maxsize <= 0:
+            raise ValueError('maxsize must be greater than 0')
+
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    cpdef object get(self, object key, object default=None):
+        value = self._data.get(key, MISSING)
+
+        if value is MISSING:
+            self.misses += 1
+            return default
+
+        self.hits += 1
+
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            # discarded by another thread in the meantime.
+            pass
+
+        return value
+
+    cpdef set(self, object key, object value):
+        self._data[key] = value
+
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            pass
+
+        while len(self._data) > self.maxsize:
+            try:
+                self._data.popitem(last=False)
+            except KeyError:
+                break
+
+    cpdef clear(self):
+        self._data.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+cdef class DumpCache(LRUCache):
+    """
+    Caches the dumped results of a contract across calls, declared
+    on the contract class as `dump_cache`. The results are shared,
+    so they must not be mutated.
+    :param key: A callable returning the version key of an object, e.g. `(obj.id, obj.updated_at)`,
+        or None when the object must not be cached. The objects with equal keys share the result.
+    :param int maxsize: The maximum number of results.
+    :param float ttl: The number of seconds the results are kept, if given.
+    """
+
+    def __init__(self, object key, Py_ssize_t maxsize=1024, ttl=None):
+        super(DumpCache, self).__init__(maxsize)
+
+        self.key = key
+        self.ttl = ttl or 0
+
+    cdef object make_key(self, object scope, object obj):
+        key = self.key(obj)
+
+        if key is None:
+            return None
+
+        # the scope tells apart the projections of the contract.
+        return scope, key
+
+    cdef object lookup(self, object key):
+        entry = self._data.get(key, MISSING)
+
+        if entry is not MISSING:
+            expires, result = <tuple>entry
+
+            # the hits only depend on the version key, so a re-fetched object shares the result.
+            if expires == 0 or expires > time.monotonic():
+                self.hits += 1
+
+                try:
+                    self._data.move_to_end(key)
+                except KeyError:
+                    pass
+
+                return result
+
+            self._data.pop(key, None)
+
+        self.misses += 1
+        return missing
+
+    cdef store(self, object key, object result):
+        self.set(key, (time.monotonic() + self.ttl if self.ttl > 0 else 0, result))
+
+    def invalidate(self, object obj=None):
+        """
+        Discards the results of the given object in all projections, or all the results if not given.
+        """
+        if obj is None:
+            self._data.clear()
+            return
+
+        key = self.key(obj)
+
+        for cache_key in [cache_key for cache_key in list(self._data) if cache_key[1] == key]:
+            self._data.pop(cache_key, None)
+
+    def stats(self):
+        return {'hits': self.hits, 'misses': self.misses, 'size': len(self._data), 'maxsize': self.maxsize}
@@ -1,7 +1,75 @@
+from .cache cimport DumpCache
+from .exceptions cimport ContractError
+from .profiling cimport Profiler
+
+
+cdef enum:
+    PRE_DUMP_INDEX = 0
+    PRE_DUMP_MANY_INDEX = 1
+    POST_DUMP_INDEX = 2
+    POST_DUMP_MANY_INDEX = 3
+    PRE_LOAD_INDEX = 4
+    PRE_LOAD_MANY_INDEX = 5
+    POST_LOAD_INDEX = 6
+    POST_LOAD_MANY_INDEX = 7
+
+
+cdef enum:
+    ACCESS_ITEM = 0
+    ACCESS_INDEX = 1
+    ACCESS_INSTANCE_DICT = 2
+    ACCESS_DESCRIPTOR = 3
+    ACCESS_ATTRIBUTE = 4
+    ACCESS_POSITION = 5
+
+
 cdef class Context(object):
     cdef public BaseContract contract
     cdef public object contract_data
     cdef public dict _data
+    cdef public int max_errors
+    cdef public int error_count
+    cdef public dict _dumped
+
+
+cdef class FieldPlan(object):
+    cdef public dict fields
+    cdef public set only
+    cdef public set exclude
+    cdef public list dump_fields
+    cdef public list load_fields
+    cdef public list dump_keys
+    cdef public list load_keys
+    cdef public dict load_indexes
+    cdef public DumpCache dump_cache
+    cdef public object binary_schema
+
+    cdef int[:] dump_kinds
+    cdef int[:] load_kinds
+    cdef int[:] hooks
+
+    cdef dict _dump_accessors
+    cdef dict _load_accessors
+    cdef Accessor _dump_accessor
+    cdef Accessor _load_accessor
+    cdef bint _resolved
+
+    cdef Accessor dump_accessor(self, object data)
+    cdef Accessor load_accessor(self, object data)
+    cdef Accessor row_accessor(self, list columns)
+    cdef resolve(self)
+
+
+cdef class Accessor(object):
+    cdef public object type
+    cdef public list names
+    cdef public bint instance_dict
+    cdef int[:] modes
+    cdef int[:] indexes
+    cdef list descriptors
+
+    cdef inline object source(self, object data)
+    cdef inline object get(self, object data, object source, Py_ssize_t index)
 
 
 cdef class BaseContract(object):
@@ -9,12 +77,24 @@ cdef class BaseContract(object):
     cdef public set only
     cdef public set exclude
     cdef public bint partial
-    cdef public dict fields
+    cdef public object load_into
+    cdef public object fields
 
     cdef int[:] _hooks
+    cdef FieldPlan _plan
+    cdef tuple _arguments
+    cdef object _target_type
 
-    cpdef object dump(self, object value, Context context=*)
-    cpdef object load(self, object value, Context context=*)
+    cpdef object dump(self, object value, Context context=*, int workers=*, int chunk_size=*,
+                      set only=*, set exclude=*, bint dedup=*)
+    cpdef object load(self, object value, Context context=*, int workers=*, int chunk_size=*,
+                      set only=*, set exclude=*, bint fail_fast=*, int max_errors=*)
+    cpdef bytes dump_json(self, object value, Context context=*)
+    cpdef dump_json_into(self, object value, bytearray buffer, Context context=*)
+    cpdef object load_json(self, object value, Context context=*)
+    cpdef bytes dump_binary(self, object value, Context context=*)
+    cpdef object load_binary(self, object value, Context context=*)
+    cpdef object load_patch(self, object previous, dict changes, Context context=*)
 
     cpdef _prepare_fields(self)
     cpdef _prepare_nested_fields(self, int option_index, set field_names, dict result)
@@ -29,8 +109,21 @@ cdef class BaseContract(object):
     cpdef object _post_load(self, object data, Context context)
     cpdef object _post_load_many(self, object data, Context context)
 
-    cdef object _get_value(self, object data, str field_name)
-    cdef inline object _dump_many(self, object data, Context context)
-    cdef inline object _dump_single(self, object data, Context context)
-    cdef inline object _load_many(self, object data, Context context)
-    cdef inline object _load_single(self, object data, Context context)
\ No newline at end of file
+    cdef tuple _merge_projection(self, set only, set exclude)
+    cdef FieldPlan _get_plan(self, set only, set exclude)
+    cdef inline object _new_target(self)
+    cdef inline object _dump_many(self, object data, Context context, FieldPlan plan)
+    cdef inline object _dump_single(self, object data, Context context, FieldPlan plan)
+    cdef object _dump_cached(self, object data, Context context, FieldPlan plan)
+    cdef inline object _load_many(self, object data, Context context, FieldPlan plan)
+    cdef ContractError _merge_value_errors(self, ContractError errors, dict value_errors, list indexes,
+                                           Context context)
+    cdef inline object _load_single(self, object data, Context context, FieldPlan plan)
+    cdef inline object _load_accessed(self, object data, Accessor accessor, Context context, FieldPlan plan)
+    cdef object _dump_single_profiled(self, object data, Context context, FieldPlan plan)
+    cdef object _load_single_profiled(self, object data, Context context, FieldPlan plan)
+    cdef object _run_hook(self, int index, object data, Context context)
+
+
+cdef BaseContract get_instance(object cls, bint many, set only, set exclude)
+cdef Profiler set_profiler(Profiler profiler)
@@ -1,8 +1,19 @@
 cimport cython
+import json
+
+import copy
+
+from types import MappingProxyType
 
 from cpython cimport array
+from cpython.object cimport PyObject_GenericGetDict, PyObject_GenericSetAttr, Py_TYPE
+from . cimport bincodec, jsoncodec, parallel
+from .cache cimport DumpCache, LRUCache
 from .exceptions cimport ContractError, ValidationError
-from .fields cimport Field
+from .fields cimport Field, Function, List, Method, Nested, convert_value, dump_value, field_kind, load_kind
+from .fields cimport load_value
+from .fields cimport KIND_BOOLEAN, KIND_FIELD, KIND_FLOAT, KIND_INTEGER
+from .profiling cimport Profiler, now
 from .utils cimport missing
 
 
@@ -13,94 +24,1170 @@ cdef int HOOK_ENABLED = 1
 cdef int HOOK_DISABLED = 0
 cdef int HOOKS_COUNT = len(HOOK_NAMES)
 
-cdef int PRE_DUMP_INDEX = 0
-cdef int PRE_DUMP_MANY_INDEX = 1
-cdef int POST_DUMP_INDEX = 2
-cdef int POST_DUMP_MANY_INDEX = 3
-cdef int PRE_LOAD_INDEX = 4
-cdef int PRE_LOAD_MANY_INDEX = 5
-cdef int POST_LOAD_INDEX = 6
-cdef int POST_LOAD_MANY_INDEX = 7
+# Prepared plans keyed by (contract class, only, exclude).
+cdef LRUCache PLANS = LRUCache(1024)
+
+# Shared contract instances keyed by (contract class, many, only, exclude).
+cdef LRUCache INSTANCES = LRUCache(1024)
+
+# The active profiler, see `contracts.profile`.
+cdef Profiler PROFILER = None
+
+# The record types generated by `BaseContract.record_type` keyed by contract class.
+cdef dict RECORD_TYPES = {}
+
+# The `array` type codes of the typed columns of `dump_columns` by field kind.
+cdef dict COLUMN_TYPECODES = {KIND_INTEGER: 'q', KIND_FLOAT: 'd', KIND_BOOLEAN: 'b'}
+
+cdef array.array MASK_TEMPLATE = array.array('b')
+
+# The NumPy module once imported by `dump_columns`, or False if NumPy is not installed.
+cdef object NUMPY = None
+
+# The maximum number of types with cached accessors per plan.
+cdef Py_ssize_t ACCESSORS_MAXSIZE = 64
+
+cdef object MISSING = object()
+
+
+cdef extern from "Python.h":
+    ctypedef object (*descrgetfunc)(object, object, object)
+
+    ctypedef struct DescriptorType "PyTypeObject":
+        descrgetfunc tp_descr_get
+
+
+@cython.freelist(8)
+cdef class Context(object):
+    """
+    The state of a single dump or load call, created per call so a shared
+    contract can be used from several threads. The contexts are allocated
+    from a free list, so creating one per call does not go through the allocator.
+    """
+
+    def __contains__(self, key):
+        if self._data is None:
+            return False
+
+        return key in self._data
+
+    def __getitem__(self, y):
+        if self._data is None:
+            return None
+
+        return self._data.get(y)
+
+    def __setitem__(self, key, value):
+        if self._data is None:
+            self._data = {}
+
+        self._data[key] = value
+
+    def __reduce__(self):
+        # the contract and its data are only meaningful during a call,
+        # the errors are counted again by each process.
+        return Context, (), (self._data, self.max_errors)
+
+    def __setstate__(self, state):
+        self._data, self.max_errors = state
+
+
+cdef inline Context new_context():
+    # skips the `__init__` lookup of `Context()`, the contexts have no arguments.
+    return Context.__new__(Context)
+
+
+cdef class FieldPlan(object):
+    """
+    The execution plan of a contract, built once the fields are prepared.
+    The fields that are skipped on dump or load are dropped ahead of time
+    and the kind of each field is resolved, so the built-in fields can
+    convert their values without dispatching through `Field.dump`/`Field.load`.
+    """
+
+    def __init__(self, dict fields, set only, set exclude, list hooks):
+        self.fields = fields
+        self.only = only
+        self.exclude = exclude
+        self.hooks = array.array('i', hooks)
+        self.dump_fields = [field for field in fields.values() if not field.load_only]
+        self.load_fields = [field for field in fields.values() if not field.dump_only]
+        self.dump_kinds = array.array('i', [field_kind(field) for field in self.dump_fields])
+        self.load_kinds = array.array('i', [load_kind(field) for field in self.load_fields])
+        self.dump_keys = [json.dumps(field.dump_to).encode('utf-8') + b':' for field in self.dump_fields]
+        self.load_keys = [field.load_from.encode('utf-8') for field in self.load_fields]
+        self.load_indexes = {field.load_from: index for index, field in enumerate(self.load_fields)}
+        self._dump_accessors = {}
+        self._load_accessors = {}
+
+    cdef Accessor dump_accessor(self, object data):
+        """
+        Returns the accessor reading the dump fields from `data`, cached by type.
+        """
+        cls = type(data)
+
+        # the last accessor is read once and checked by its own type, so a
+        # thread replacing it in the meantime cannot pair it with another type.
+        cdef Accessor accessor = self._dump_accessor
+
+        if accessor is not None and accessor.type is cls:
+            return accessor
+
+        accessor = self._dump_accessors.get(cls)
+
+        if accessor is None:
+            if len(self._dump_accessors) >= ACCESSORS_MAXSIZE:
+                self._dump_accessors.clear()
+
+            accessor = Accessor(cls, [field.name for field in self.dump_fields])
+            self._dump_accessors[cls] = accessor
+
+        self._dump_accessor = accessor
+
+        return accessor
+
+    cdef Accessor load_accessor(self, object data):
+        """
+        Returns the accessor reading the load fields from `data`, cached by type.
+        """
+        cls = type(data)
+
+        # the last accessor is read once and checked by its own type, so a
+        # thread replacing it in the meantime cannot pair it with another type.
+        cdef Accessor accessor = self._load_accessor
+
+        if accessor is not None and accessor.type is cls:
+            return accessor
+
+        accessor = self._load_accessors.get(cls)
+
+        if accessor is None:
+            if len(self._load_accessors) >= ACCESSORS_MAXSIZE:
+                self._load_accessors.clear()
+
+            accessor = Accessor(cls, [field.load_from for field in self.load_fields])
+            self._load_accessors[cls] = accessor
+
+        self._load_accessor = accessor
+
+        return accessor
+
+    cdef Accessor row_accessor(self, list columns):
+        """
+        Returns the accessor reading the load fields from rows by their
+        position in `columns`, the fields without a column are missing.
+        """
+        cdef dict positions = {}
+
+        for position, column in enumerate(columns):
+            positions.setdefault(column, position)
+
+        cdef Accessor accessor = Accessor.__new__(Accessor)
+        accessor.type = tuple
+        accessor.names = [field.load_from for field in self.load_fields]
+        accessor.instance_dict = False
+        accessor.descriptors = [None] * len(accessor.names)
+        accessor.modes = array.array('i', [ACCESS_POSITION] * len(accessor.names))
+        accessor.indexes = array.array('i', [positions.get(name, -1) for name in accessor.names])
+
+        return accessor
+
+    cdef resolve(self):
+        """
+        Resolves the nested contracts and compiles the validators of the fields,
+        so the plan is fully built before it is shared between threads.
+        """
+        if self._resolved:
+            return
+
+        # set first, the nested contracts may refer back to this plan.
+        self._resolved = True
+
+        for field in self.fields.values():
+            (<Field>field)._resolve()
+
+
+cdef class Accessor(object):
+    """
+    Reads the values of the fields from the objects of a given type.
+    How each field is read is resolved once per type: dict items, namedtuple
+    indexes, the instance `__dict__`, data descriptors such as slots and
+    properties, or `getattr` when the type customizes the attribute access.
+    """
+
+    def __init__(self, object cls, list names):
+        self.type = cls
+        self.names = names
+        self.instance_dict = False
+        self.descriptors = [None] * len(names)
+
+        cdef list modes = []
+        cdef list indexes = []
+
+        mapping = issubclass(cls, dict)
+        generic = cls.__getattribute__ is not object.__getattribute__
+        tuple_fields = _get_tuple_fields(cls)
+
+        for index, name in enumerate(names):
+            attribute = _get_type_attribute(cls, name)
+            position = -1
+
+            if mapping:
+                mode = ACCESS_ITEM
+            elif generic:
+                mode = ACCESS_ATTRIBUTE
+            elif tuple_fields is not None and name in tuple_fields and attribute is tuple_fields[name]:
+                mode = ACCESS_INDEX
+                position = list(tuple_fields).index(name)
+            elif attribute is not MISSING and _is_data_descriptor(attribute):
+                mode = ACCESS_DESCRIPTOR
+                self.descriptors[index] = attribute
+            elif cls.__dictoffset__ != 0:
+                mode = ACCESS_INSTANCE_DICT
+                self.instance_dict = True
+            else:
+                mode = ACCESS_ATTRIBUTE
+
+            modes.append(mode)
+            indexes.append(position)
+
+        self.modes = array.array('i', modes)
+        self.indexes = array.array('i', indexes)
+
+    def __repr__(self):
+        return '<Accessor(type={0!r})>'.format(self.type)
+
+    cdef inline object source(self, object data):
+        if self.instance_dict:
+            return PyObject_GenericGetDict(data, NULL)
+        return None
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline object get(self, object data, object source, Py_ssize_t index):
+        cdef int mode = self.modes[index]
+        cdef int position
+
+        if mode == ACCESS_ITEM:
+            return (<dict>data).get(self.names[index], missing)
+
+        if mode == ACCESS_INDEX:
+            return (<tuple>data)[self.indexes[index]]
+
+        if mode == ACCESS_POSITION:
+            # rows may be any sequence and may be shorter than the columns.
+            position = self.indexes[index]
+
+            if position < 0 or position >= len(data):
+                return missing
+
+            return data[position]
+
+        if mode == ACCESS_INSTANCE_DICT:
+            value = (<dict>source).get(self.names[index], MISSING)
+
+            if value is not MISSING:
+                return value
+
+        elif mode == ACCESS_DESCRIPTOR:
+            descriptor = self.descriptors[index]
+
+            try:
+                # calls the descriptor straight through its type slot, e.g. slots and properties.
+                return (<DescriptorType*>Py_TYPE(descriptor)).tp_descr_get(descriptor, data, self.type)
+            except AttributeError:
+                return missing
+
+        return getattr(data, self.names[index], missing)
+
+
+cdef object _get_type_attribute(object cls, str name):
+    for base in cls.__mro__:
+        if name in base.__dict__:
+            return base.__dict__[name]
+
+    return MISSING
+
+
+cdef bint _is_data_descriptor(object attribute):
+    attribute_type = type(attribute)
+
+    if not hasattr(attribute_type, '__get__'):
+        return False
+
+    return hasattr(attribute_type, '__set__') or hasattr(attribute_type, '__delete__')
+
+
+cdef dict _get_tuple_fields(object cls):
+    # namedtuples read their fields through descriptors declared next to `_fields`.
+    if not issubclass(cls, tuple):
+        return None
+
+    for base in cls.__mro__:
+        if '_fields' in base.__dict__:
+            return {name: base.__dict__.get(name) for name in base._fields}
+
+    return None
+
+
+cdef class BaseContract(object):
+    default_error_messages = {
+        'invalid': 'Invalid data. Expected a dictionary, but got {datatype}.'
+    }
+
+    _declared_fields = {}
+    _declared_hooks = [HOOK_ENABLED] * HOOKS_COUNT
+
+    # A `DumpCache` sharing the dumped results across calls.
+    dump_cache = None
+
+    def __init__(self, bint many=False, set only=None, set exclude=None, bint partial=False, object load_into=None):
+        """
+        :param bool many: Whether the data is a collection of items.
+        :param set only: The names of the fields to be dumped and loaded, nested fields as `nested.field`.
+        :param set exclude: The names of the fields to be skipped.
+        :param bool partial: Whether the required fields may be missing on load.
+        :param load_into: The class of the loaded items instead of dicts, or True for the
+            slotted `record_type` of the contract. The items are created without calling
+            `__init__` and the loaded fields are set as attributes, the missing ones are left unset.
+        """
+        self.many = many
+        self.only = only
+        self.exclude = exclude
+        self.partial = partial
+        self.load_into = load_into
+
+        if load_into is True:
+            self._target_type = type(self).record_type()
+        elif load_into is not None and load_into is not False:
+            self._target_type = load_into
+
+        self._arguments = (many, only, exclude, partial, load_into)
+
+        key = (type(self), frozenset(only) if only else None, frozenset(exclude) if exclude else None)
+
+        cdef FieldPlan plan = PLANS.get(key)
+
+        if plan is None:
+            self.fields = dict(self._declared_fields)
+            self._prepare_fields()
+
+            plan = FieldPlan(self.fields, self.only, self.exclude, self._declared_hooks)
+            plan.dump_cache = type(self).dump_cache
+            PLANS.set(key, plan)
+
+        plan.resolve()
+
+        # the plan is shared by all the instances with the same options, so its
+        # fields are exposed read-only and the projections are copied.
+        self._plan = plan
+        self._hooks = plan.hooks
+
+        self.fields = MappingProxyType(plan.fields)
+        self.only = None if plan.only is None else set(plan.only)
+        self.exclude = None if plan.exclude is None else set(plan.exclude)
+
+    def __reduce__(self):
+        # contracts are rebuilt from their class, so they can be sent to other processes.
+        return type(self), self._arguments
+
+    @classmethod
+    def record_type(cls):
+        """
+        Returns a class with `__slots__` for the loaded fields of the contract,
+        created once per contract and used by `load_into=True`.
+        """
+        record_type = RECORD_TYPES.get(cls)
+
+        if record_type is None:
+            record_type = make_record_type(cls)
+            RECORD_TYPES[cls] = record_type
+
+        return record_type
+
+    cpdef object dump(self, object data, Context context=None, int workers=0, int chunk_size=10000,
+                      set only=None, set exclude=None, bint dedup=False):
+        """
+        Dumps `data`, when the contract is `many` and `workers` is greater than 1
+        the items are dumped in chunks of `chunk_size` by a pool of worker processes.
+
+        `only` and `exclude` project the fields for this call only, the same as
+        dumping with a new instance of the contract created with these options.
+
+        `dedup` dumps each object referenced by nested fields only once, by identity,
+        and the following references share the dumped result, so the results must
+        not be mutated. Each projection of the nested contracts is dumped apart.
+        """
+        if context is None:
+            context = new_context()
+
+        if dedup and context._dumped is None:
+            context._dumped = {}
+
+            try:
+                return self.dump(data, context, workers, chunk_size, only, exclude)
+            finally:
+                context._dumped = None
+
+        cdef FieldPlan plan = self._get_plan(only, exclude)
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self.many and workers > 1:
+            if plan is not self._plan:
+                # workers rebuild the contract from its options.
+                only, exclude = self._merge_projection(only, exclude)
+                contract = type(self)(many=self.many, only=only, exclude=exclude, partial=self.partial,
+                                      load_into=self.load_into)
+            else:
+                contract = self
+
+            data = parallel.dump_many(contract, data, context, workers, chunk_size)
+        elif self.many:
+            data = self._dump_many(data, context, plan)
+        elif plan.dump_cache is not None:
+            data = self._dump_cached(data, context, plan)
+        else:
+            data = self._dump_single(data, context, plan)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        return data
+
+    cpdef object load(self, object data, Context context=None, int workers=0, int chunk_size=10000,
+                      set only=None, set exclude=None, bint fail_fast=False, int max_errors=0):
+        """
+        Loads `data`, when the contract is `many` and `workers` is greater than 1
+        the items are loaded in chunks of `chunk_size` by a pool of worker processes,
+        in which case the errors of all items are raised together keyed by item index.
+
+        `only` and `exclude` project the fields for this call only, the same as
+        loading with a new instance of the contract created with these options.
+
+        `max_errors` stops loading once that many errors are found, and `many` contracts
+        then raise the errors of the failed items keyed by item index. `fail_fast` stops at the first error.
+        """
+        if context is None:
+            context = new_context()
+
+        cdef int previous_max_errors = context.max_errors
+        cdef int previous_error_count = context.error_count
+
+        if fail_fast or max_errors > 0:
+            context.max_errors = 1 if fail_fast else max_errors
+            context.error_count = 0
+
+            try:
+                return self.load(data, context, workers, chunk_size, only, exclude)
+            finally:
+                context.max_errors = previous_max_errors
+                context.error_count = previous_error_count
+
+        cdef FieldPlan plan = self._get_plan(only, exclude)
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self.many and workers > 1:
+            if plan is not self._plan:
+                # workers rebuild the contract from its options.
+                only, exclude = self._merge_projection(only, exclude)
+                contract = type(self)(many=self.many, only=only, exclude=exclude, partial=self.partial,
+                                      load_into=self.load_into)
+            else:
+                contract = self
+
+            data = parallel.load_many(contract, data, context, workers, chunk_size)
+        elif self.many:
+            data = self._load_many(data, context, plan)
+        else:
+            data = self._load_single(data, context, plan)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        return data
+
+    cpdef bytes dump_json(self, object data, Context context=None):
+        """
+        Dumps `data` straight to UTF-8 encoded JSON, without building the intermediate dicts.
+        """
+        cdef bytearray buffer = bytearray()
+
+        self.dump_json_into(data, buffer, context)
+
+        return bytes(buffer)
+
+    cpdef dump_json_into(self, object data, bytearray buffer, Context context=None):
+        """
+        Dumps `data` as UTF-8 encoded JSON appending it to the given `buffer`.
+        """
+        if context is None:
+            context = new_context()
+
+        if PROFILER is not None:
+            # dumps as usual so the fields are profiled.
+            jsoncodec.write_value(self.dump(data, context), buffer)
+            return
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self.many:
+            jsoncodec.write_many(self, data, buffer, context)
+        else:
+            jsoncodec.write_single(self, data, buffer, context)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+    cpdef object load_json(self, object data, Context context=None):
+        """
+        Loads UTF-8 encoded JSON parsing it straight into the fields,
+        without building the intermediate dicts. Unknown keys are skipped
+        and `context.contract_data` is None while the fields are loaded.
+
+        Contracts with pre load hooks fall back to `json.loads`,
+        since the hooks need the parsed data, as well as any contract while profiling.
+        """
+        if context is None:
+            context = new_context()
+
+        if self._hooks[PRE_LOAD_INDEX] == 1 or self._hooks[PRE_LOAD_MANY_INDEX] == 1 or PROFILER is not None:
+            return self.load(json.loads(data), context)
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = None
+
+        data = jsoncodec.read_document(self, data, context)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        return data
+
+    cpdef bytes dump_binary(self, object data, Context context=None):
+        """
+        Dumps `data` to the compact binary format of the contract, see `contracts.bincodec`.
+        The format has no keys, so it can only be loaded by `load_binary` of the same contract.
+        Contracts with post dump hooks are not supported, since the hooks reshape the dumped dicts.
+        """
+        if context is None:
+            context = new_context()
+
+        cdef bytearray buffer = bytearray()
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        try:
+            bincodec.write_document(self, data, buffer, context)
+        finally:
+            context.contract = previous_contract
+            context.contract_data = previous_contract_data
+
+        return bytes(buffer)
+
+    cpdef object load_binary(self, object data, Context context=None):
+        """
+        Loads data dumped by `dump_binary`, from `bytes` or any object supporting
+        the buffer protocol, e.g. a `memoryview`, which is read without being copied.
+        Data encoded by another version of the contract is rejected with a `ValueError`,
+        as well as malformed data. `context.contract_data` is None while the fields are loaded.
+        Contracts with pre load hooks are not supported, since the hooks need the input dicts.
+        """
+        if context is None:
+            context = new_context()
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = None
+
+        try:
+            data = bincodec.read_document(self, data, context)
+        finally:
+            context.contract = previous_contract
+            context.contract_data = previous_contract_data
+
+        return data
+
+    def dump_columns(self, object data, Context context=None):
+        """
+        Dumps the items of `data` into columns, returned as two dicts keyed by `dump_to`,
+        the columns and their validity masks. The Integer, Float and Boolean fields are
+        dumped into typed `array.array` buffers, or NumPy arrays when NumPy is installed,
+        and the other fields into lists, without building a dict per item.
+
+        The masks are false where the item had no value or None, which is stored as 0
+        in the typed columns and as None in the lists. An Integer column with values
+        out of the 64-bit range is dumped into a list. `data` is always a collection.
+        """
+        if context is None:
+            context = new_context()
+
+        cdef FieldPlan plan = self._plan
+        cdef list fields = plan.dump_fields
+        cdef int[:] kinds = plan.dump_kinds
+        cdef Py_ssize_t count = len(fields)
+        cdef list columns = [[] for _ in range(count)]
+
+        cdef Py_ssize_t index
+        cdef Field field
+        cdef Accessor accessor
+        cdef object source
+        cdef object value
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self._hooks[POST_DUMP_INDEX] == 1 or self._hooks[POST_DUMP_MANY_INDEX] == 1 or PROFILER is not None:
+            # the hooks reshape the dumped dicts, so the columns are read from them.
+            for item in self._dump_many(data, context, plan):
+                for index in range(count):
+                    field = <Field>fields[index]
+                    (<list>columns[index]).append((<dict>item).get(field.dump_to))
+        else:
+            if self._hooks[PRE_DUMP_MANY_INDEX] == 1:
+                data = self._pre_dump_many(data, context)
+
+            for item in data:
+                context.contract_data = item
+
+                if self._hooks[PRE_DUMP_INDEX] == 1:
+                    item = self._pre_dump(item, context)
+
+                accessor = plan.dump_accessor(item)
+                source = accessor.source(item)
+
+                for index in range(count):
+                    field = <Field>fields[index]
+                    value = accessor.get(item, source, index)
+
+                    # generic fields also receive the missing and None values, like in `dump`.
+                    if kinds[index] == KIND_FIELD or (value is not None and value is not missing):
+                        value = dump_value(field, kinds[index], value, context)
+
+                    if value is missing:
+                        value = None
+
+                    (<list>columns[index]).append(value)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        cdef list masks = [_column_mask(<list>column) for column in columns]
+
+        for index in range(count):
+            columns[index] = _typed_column(<list>columns[index], kinds[index])
+
+        numpy = _import_numpy()
+
+        if numpy is not None:
+            # the arrays share the buffers of the columns instead of copying them.
+            columns = [numpy.frombuffer(column, dtype=_numpy_dtype(numpy, column.typecode))
+                       if isinstance(column, array.array) else column for column in columns]
+            masks = [numpy.frombuffer(mask, dtype=numpy.bool_) for mask in masks]
+
+        return ({(<Field>fields[index]).dump_to: columns[index] for index in range(count)},
+                {(<Field>fields[index]).dump_to: masks[index] for index in range(count)})
+
+    cpdef object load_patch(self, object previous, dict changes, Context context=None):
+        """
+        Loads the fields in `changes` and merges them into a copy of `previous`,
+        a result already loaded by this contract, then runs the post load hook
+        with the merged result. The other fields are neither loaded nor validated
+        again and the pre load hook is not called, since there is no complete input.
+
+        `changes` is keyed by the names fields are loaded from, unknown keys are ignored.
+        """
+        if self.many:
+            raise ValueError('load_patch does not support many contracts')
+
+        if context is None:
+            context = new_context()
+
+        cdef FieldPlan plan = self._plan
+        cdef int[:] kinds = plan.load_kinds
+        cdef ContractError errors = None
+        cdef bint mapping = isinstance(previous, dict)
+        cdef object result = dict(previous) if mapping else copy.copy(previous)
+        cdef Py_ssize_t index
+        cdef Field field
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = changes
+
+        try:
+            for key, value in changes.items():
+                index = plan.load_indexes.get(key, -1)
+
+                if index < 0:
+                    continue
+
+                field = <Field>plan.load_fields[index]
+
+                try:
+                    if value is None or value is missing:
+                        value = field.load(value, context)
+                    else:
+                        value = load_value(field, kinds[index], value, context)
+                except ValidationError as err:
+                    if not err.field_names:
+                        err.field_names = [field.name]
+
+                    if errors is None:
+                        errors = ContractError([err])
+                    else:
+                        errors.add_error(err)
+
+                    continue
+
+                if value is not missing:
+                    if mapping:
+                        result[field.name] = value
+                    else:
+                        PyObject_GenericSetAttr(result, field.name, value)
+                elif mapping:
+                    result.pop(field.name, None)
+                elif hasattr(result, field.name):
+                    object.__delattr__(result, field.name)
+
+            if errors:
+                raise errors
+
+            if self._hooks[POST_LOAD_INDEX] == 1:
+                try:
+                    result = self._post_load(result, context)
+                except ValidationError as err:
+                    raise ContractError([err])
+        finally:
+            context.contract = previous_contract
+            context.contract_data = previous_contract_data
+
+        return result
+
+    def iter_dump(self, object data, Context context=None):
+        """
+        Returns an iterator that dumps the items of `data` one at a time,
+        `data` can be any iterable, including generators and DB cursors.
+
+        `_pre_dump_many` is called once with the input iterable and
+        `_post_dump_many` is called once with the lazy iterator of dumped items,
+        both must return an iterable. Hooks that build a list defeat the streaming.
+        """
+        if context is None:
+            context = new_context()
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self._hooks[PRE_DUMP_MANY_INDEX] == 1:
+            data = self._pre_dump_many(data, context)
+
+        items = self._iter_dump_items(data, context)
+
+        if self._hooks[POST_DUMP_MANY_INDEX] == 1:
+            items = self._post_dump_many(items, context)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        return iter(items)
+
+    def iter_load(self, object data, Context context=None):
+        """
+        Returns an iterator that loads the items of `data` one at a time,
+        `data` can be any iterable, including generators and DB cursors.
+
+        `_pre_load_many` is called once with the input iterable and
+        `_post_load_many` is called once with the lazy iterator of loaded items,
+        both must return an iterable. Hooks that build a list defeat the streaming.
+        """
+        if context is None:
+            context = new_context()
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self._hooks[PRE_LOAD_MANY_INDEX] == 1:
+            try:
+                data = self._pre_load_many(data, context)
+            except ValidationError as err:
+                raise ContractError([err])
+
+        items = self._iter_load_items(data, context)
+
+        if self._hooks[POST_LOAD_MANY_INDEX] == 1:
+            try:
+                items = self._post_load_many(items, context)
+            except ValidationError as err:
+                raise ContractError([err])
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        return iter(items)
+
+    def load_rows(self, object rows, object columns=None, Context context=None, bint fail_fast=False,
+                  int max_errors=0):
+        """
+        Loads the rows of `rows`, sequences such as CSV rows or DB-API tuples, whose values
+        are named by `columns`, or by the first row when `columns` is None. `rows` can be
+        any iterable, the fields are mapped to the column positions once for all the rows.
+
+        The errors of all the rows are raised together keyed by row number, counted from 0
+        after the header, `max_errors` stops loading once that many errors are found and
+        `fail_fast` stops at the first error. `_pre_load` receives the row as a dict.
+        """
+        if context is None:
+            context = new_context()
+
+        cdef int previous_max_errors = context.max_errors
+        cdef int previous_error_count = context.error_count
+
+        if fail_fast or max_errors > 0:
+            context.max_errors = 1 if fail_fast else max_errors
+            context.error_count = 0
+
+            try:
+                return self.load_rows(rows, columns, context)
+            finally:
+                context.max_errors = previous_max_errors
+                context.error_count = previous_error_count
+
+        cdef FieldPlan plan = self._plan
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = rows
+
+        if self._hooks[PRE_LOAD_MANY_INDEX] == 1:
+            try:
+                rows = self._pre_load_many(rows, context) if PROFILER is None else \
+                    self._run_hook(PRE_LOAD_MANY_INDEX, rows, context)
+            except ValidationError as err:
+                raise ContractError([err])
+
+        rows = iter(rows)
+
+        if columns is None:
+            columns = next(rows, ())
+
+        columns = list(columns)
+
+        cdef Accessor accessor = plan.row_accessor(columns)
+        # the hooks and the profiler read the items as dicts.
+        cdef bint as_dicts = self._hooks[PRE_LOAD_INDEX] == 1 or PROFILER is not None
+        cdef list items = []
+        cdef ContractError errors = None
+        cdef int error_count
+
+        for index, row in enumerate(rows):
+            context.contract_data = row
+            error_count = context.error_count
+
+            try:
+                if as_dicts:
+                    items.append(self._load_single(dict(zip(columns, row)), context, plan))
+                else:
+                    items.append(self._load_accessed(row, accessor, context, plan))
+            except ValidationError as err:
+                if context.error_count == error_count:
+                    context.error_count += 1
+
+                if errors is None:
+                    errors = ContractError()
+
+                errors._messages[index] = err._messages
+
+                if 0 < context.max_errors <= context.error_count:
+                    break
+
+        if errors:
+            raise errors
+
+        if self._hooks[POST_LOAD_MANY_INDEX] == 1:
+            try:
+                items = self._post_load_many(items, context) if PROFILER is None else \
+                    self._run_hook(POST_LOAD_MANY_INDEX, items, context)
+            except ValidationError as err:
+                raise ContractError([err])
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        return items
+
+    async def adump(self, object data, Context context=None, int yield_every=1000, set only=None, set exclude=None):
+        """
+        Dumps `data` the same as `dump`, but a `many` contract yields to the event loop
+        after every `yield_every` items, so dumping a large collection does not block it.
+
+        The awaitables returned by the `Method` and `Function` fields of the contract
+        and of its nested contracts, e.g. coroutines doing lookups, are awaited
+        concurrently once per chunk of items.
+        """
+        import asyncio
+
+        if context is None:
+            context = new_context()
+
+        cdef FieldPlan plan = self._get_plan(only, exclude)
+        cdef list keys = _async_fields(plan, True, {}, set())
+
+        if not self.many:
+            result = self.dump(data, context, only=only, exclude=exclude)
+
+            if keys:
+                await _await_values([result], keys, 0, context, False)
+
+            return result
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self._hooks[PRE_DUMP_MANY_INDEX] == 1:
+            data = self._pre_dump_many(data, context) if PROFILER is None else \
+                self._run_hook(PRE_DUMP_MANY_INDEX, data, context)
+
+        cdef list items = []
+        cdef Py_ssize_t start = 0
+
+        for item in data:
+            context.contract_data = item
+
+            if plan.dump_cache is None:
+                items.append(self._dump_single(item, context, plan))
+            else:
+                items.append(self._dump_cached(item, context, plan))
+
+            if len(items) - start >= yield_every:
+                if keys:
+                    await _await_values(items[start:], keys, start, context, False)
+
+                start = len(items)
+
+                # other tasks may run meanwhile, so the context is set again afterwards.
+                await asyncio.sleep(0)
+
+                context.contract = self
+
+        if keys:
+            await _await_values(items[start:], keys, start, context, False)
+
+        if self._hooks[POST_DUMP_MANY_INDEX] == 1:
+            items = self._post_dump_many(items, context) if PROFILER is None else \
+                self._run_hook(POST_DUMP_MANY_INDEX, items, context)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+        return items
+
+    async def aload(self, object data, Context context=None, int yield_every=1000, set only=None,
+                    set exclude=None, bint fail_fast=False, int max_errors=0):
+        """
+        Loads `data` the same as `load`, but a `many` contract yields to the event loop
+        after every `yield_every` items, so validating a large collection does not block it.
+
+        The awaitables returned by the `Method` and `Function` fields of the contract
+        and of its nested contracts are awaited concurrently once per chunk of items,
+        then the validators of their fields run with the results. A `ValidationError`
+        raised by an awaitable or a validator is reported as an error of its field.
+        """
+        import asyncio
+
+        if context is None:
+            context = new_context()
+
+        cdef int previous_max_errors = context.max_errors
+        cdef int previous_error_count = context.error_count
+
+        if fail_fast or max_errors > 0:
+            context.max_errors = 1 if fail_fast else max_errors
+            context.error_count = 0
+
+            try:
+                return await self.aload(data, context, yield_every, only, exclude)
+            finally:
+                context.max_errors = previous_max_errors
+                context.error_count = previous_error_count
+
+        cdef FieldPlan plan = self._get_plan(only, exclude)
+        cdef list keys = _async_fields(plan, False, {}, set())
+        cdef ContractError errors = None
+        cdef dict value_errors
+
+        if not self.many:
+            result = self.load(data, context, only=only, exclude=exclude)
+
+            if keys:
+                value_errors = await _await_values([result], keys, 0, context, True)
+
+                if value_errors:
+                    errors = ContractError()
+                    errors._messages = value_errors[0]
+                    raise errors
+
+            return result
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = self
+        context.contract_data = data
+
+        if self._hooks[PRE_LOAD_MANY_INDEX] == 1:
+            try:
+                data = self._pre_load_many(data, context) if PROFILER is None else \
+                    self._run_hook(PRE_LOAD_MANY_INDEX, data, context)
+            except ValidationError as err:
+                raise ContractError([err])
+
+        cdef list items = []
+        cdef list indexes = []
+        cdef int error_count
+        cdef Py_ssize_t start = 0
+
+        for index, item in enumerate(data):
+            error_count = context.error_count
+
+            try:
+                items.append(self._load_single(item, context, plan))
+                indexes.append(index)
+            except ValidationError as err:
+                if context.max_errors <= 0:
+                    raise
+
+                if context.error_count == error_count:
+                    context.error_count += 1
 
+                if errors is None:
+                    errors = ContractError()
 
-cdef class Context(object):
-    def __contains__(self, key):
-        if self._data is None:
-            return False
+                errors._messages[index] = err._messages
 
-        return key in self._data
+                if context.error_count >= context.max_errors:
+                    break
 
-    def __getitem__(self, y):
-        if self._data is None:
-            return None
+            if len(items) - start >= yield_every:
+                if keys:
+                    value_errors = await _await_values(items[start:], keys, start, context, True)
+                    errors = self._merge_value_errors(errors, value_errors, indexes, context)
 
-        return self._data.get(y)
+                start = len(items)
 
-    def __setitem__(self, key, value):
-        if self._data is None:
-            self._data = {}
+                await asyncio.sleep(0)
 
-        self._data[key] = value
+                context.contract = self
 
+        if keys:
+            value_errors = await _await_values(items[start:], keys, start, context, True)
+            errors = self._merge_value_errors(errors, value_errors, indexes, context)
 
-cdef class BaseContract(object):
-    default_error_messages = {
-        'invalid': 'Invalid data. Expected a dictionary, but got {datatype}.'
-    }
+        if errors:
+            raise errors
 
-    _declared_fields = {}
-    _declared_hooks = [HOOK_ENABLED] * HOOKS_COUNT
+        if self._hooks[POST_LOAD_MANY_INDEX] == 1:
+            try:
+                items = self._post_load_many(items, context) if PROFILER is None else \
+                    self._run_hook(POST_LOAD_MANY_INDEX, items, context)
+            except ValidationError as err:
+                raise ContractError([err])
 
-    def __init__(self, bint many=False, set only=None, set exclude=None, bint partial=False):
-        self.many = many
-        self.only = only
-        self.exclude = exclude
-        self.partial = partial
-        self.fields = dict(self._declared_fields)
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
 
-        self._hooks = array.array('i', self._declared_hooks)
+        return items
 
-        self._prepare_fields()
+    cdef ContractError _merge_value_errors(self, ContractError errors, dict value_errors, list indexes,
+                                           Context context):
+        # the errors are keyed by the position in `items`, reported by the index of the input item.
+        if not value_errors:
+            return errors
 
-    cpdef object dump(self, object data, Context context=None):
-        if context is None:
-            context = Context()
+        if errors is None:
+            errors = ContractError()
 
-        previous_contract = context.contract
-        previous_contract_data = context.contract_data
+        if context.max_errors <= 0:
+            # the same as `load`, the errors of the first failed item are raised.
+            errors._messages = value_errors[min(value_errors)]
+            raise errors
 
-        context.contract = self
-        context.contract_data = data
+        for position, messages in value_errors.items():
+            errors._messages[indexes[position]] = messages
+            context.error_count += 1
 
-        if self.many:
-            data = self._dump_many(data, context)
-        else:
-            data = self._dump_single(data, context)
+        return errors
 
-        context.contract = previous_contract
-        context.contract_data = previous_contract_data
+    def _iter_dump_items(self, object data, Context context):
+        for item in data:
+            previous_contract = context.contract
+            previous_contract_data = context.contract_data
 
-        return data
+            context.contract = self
+            context.contract_data = item
 
-    cpdef object load(self, object data, Context context=None):
-        if context is None:
-            context = Context()
+            if self._plan.dump_cache is None:
+                item = self._dump_single(item, context, self._plan)
+            else:
+                item = self._dump_cached(item, context, self._plan)
 
-        previous_contract = context.contract
-        previous_contract_data = context.contract_data
+            context.contract = previous_contract
+            context.contract_data = previous_contract_data
 
-        context.contract = self
-        context.contract_data = data
+            yield item
 
-        if self.many:
-            data = self._load_many(data, context)
-        else:
-            data = self._load_single(data, context)
+    def _iter_load_items(self, object data, Context context):
+        for item in data:
+            previous_contract = context.contract
+            previous_contract_data = context.contract_data
 
-        context.contract = previous_contract
-        context.contract_data = previous_contract_data
+            context.contract = self
+            context.contract_data = item
 
-        return data
+            item = self._load_single(item, context, self._plan)
+
+            context.contract = previous_contract
+            context.contract_data = previous_contract_data
+
+            yield item
 
     cpdef _prepare_fields(self):
         cdef dict nested_fields = None
@@ -124,6 +1211,9 @@ cdef class BaseContract(object):
             self.exclude = {field_name for field_name in self.exclude if '.' not in field_name}
             field_names -= self.exclude
 
+        if len(field_names) != len(self.fields):
+            self.fields = {name: field for name, field in self.fields.items() if name in field_names}
+
         cdef Field nested
 
         if nested_fields is not None:
@@ -150,107 +1240,219 @@ cdef class BaseContract(object):
 
             options[option_index].append(nested_names)
 
-    cdef object _get_value(self, object data, str field_name):
-        cdef dict d
+    cdef inline object _new_target(self):
+        if self._target_type is None:
+            return None
+
+        return self._target_type.__new__(self._target_type)
+
+    cdef tuple _merge_projection(self, set only, set exclude):
+        """
+        Narrows the projection of the contract by the `only` and `exclude` of a call,
+        the names of both `only` are intersected and the names of both `exclude` are merged.
+        """
+        own_only = <set>self._arguments[1]
+        own_exclude = <set>self._arguments[2]
 
-        if isinstance(data, dict):
-            d = <dict>data
-            return d.get(field_name, missing)
+        if only and own_only:
+            only = _intersect_names(own_only, only)
 
-        return getattr(data, field_name, missing)
+            if not only:
+                # nothing is left, which `only` cannot express.
+                return None, set(self._declared_fields)
+        elif not only:
+            only = own_only
 
-    cdef inline object _dump_many(self, object data, Context context):
+        if exclude and own_exclude:
+            exclude = own_exclude | exclude
+        elif not exclude:
+            exclude = own_exclude
+
+        return only, exclude
+
+    cdef FieldPlan _get_plan(self, set only, set exclude):
+        if not only and not exclude:
+            return self._plan
+
+        only, exclude = self._merge_projection(only, exclude)
+
+        key = (type(self), frozenset(only) if only else None, frozenset(exclude) if exclude else None)
+
+        cdef FieldPlan plan = PLANS.get(key)
+
+        if plan is None:
+            # creating the contract prepares the plan and caches it.
+            plan = (<BaseContract>type(self)(only=only, exclude=exclude))._plan
+
+        return plan
+
+    cdef inline object _dump_many(self, object data, Context context, FieldPlan plan):
         if self._hooks[PRE_DUMP_MANY_INDEX] == 1:
-            data = self._pre_dump_many(data, context)
+            data = self._pre_dump_many(data, context) if PROFILER is None else \
+                self._run_hook(PRE_DUMP_MANY_INDEX, data, context)
 
         cdef list items = []
+        cdef DumpCache cache = plan.dump_cache
 
         for item in data:
             context.contract_data = item
 
-            items.append(self._dump_single(item, context))
+            if cache is None:
+                items.append(self._dump_single(item, context, plan))
+            else:
+                items.append(self._dump_cached(item, context, plan))
 
         if self._hooks[POST_DUMP_MANY_INDEX] == 1:
-            items = self._post_dump_many(items, context)
+            items = self._post_dump_many(items, context) if PROFILER is None else \
+                self._run_hook(POST_DUMP_MANY_INDEX, items, context)
 
         return items
 
     @cython.boundscheck(False)
-    cdef inline object _dump_single(self, object data, Context context):
+    @cython.wraparound(False)
+    cdef inline object _dump_single(self, object data, Context context, FieldPlan plan):
+        if PROFILER is not None:
+            return self._dump_single_profiled(data, context, plan)
+
         if self._hooks[PRE_DUMP_INDEX] == 1:
             data = self._pre_dump(data, context)
 
         cdef dict result = {}
-        cdef object fields = self.fields.values()
+        cdef list fields = plan.dump_fields
+        cdef int[:] kinds = plan.dump_kinds
+
+        cdef Accessor accessor = plan.dump_accessor(data)
+        cdef object source = accessor.source(data)
 
+        cdef Py_ssize_t index
         cdef Field field
-        cdef object raw, value
+        cdef object value
+
+        for index in range(len(fields)):
+            field = <Field>fields[index]
+
+            value = accessor.get(data, source, index)
+
+            # generic fields may override `dump`, so they also receive the missing and None values.
+            if kinds[index] == KIND_FIELD:
+                value = field.dump(value, context)
+
+                if value is missing:
+                    continue
 
-        for field in fields:
-            if field.load_only:
+            elif value is missing:
                 continue
 
-            raw = self._get_value(data, field.name)
+            elif value is not None:
+                value = dump_value(field, kinds[index], value, context)
 
-            value = field.dump(raw, context)
+                if value is missing:
+                    continue
 
-            if value is not missing:
-                result[field.dump_to] = value
+            result[field.dump_to] = value
 
         if self._hooks[POST_DUMP_INDEX] == 1:
             result = self._post_dump(result, context)
 
         return result
 
-    cdef inline object _load_many(self, object data, Context context):
+    cdef inline object _load_many(self, object data, Context context, FieldPlan plan):
         if self._hooks[PRE_LOAD_MANY_INDEX] == 1:
             try:
-                data = self._pre_load_many(data, context)
+                data = self._pre_load_many(data, context) if PROFILER is None else \
+                    self._run_hook(PRE_LOAD_MANY_INDEX, data, context)
             except ValidationError as err:
                 raise ContractError([err])
 
         cdef list items = []
+        cdef ContractError errors = None
+        cdef int error_count
 
-        for item in data:
-            items.append(self._load_single(item, context))
+        for index, item in enumerate(data):
+            error_count = context.error_count
+
+            try:
+                items.append(self._load_single(item, context, plan))
+            except ValidationError as err:
+                if context.max_errors <= 0:
+                    raise
+
+                if context.error_count == error_count:
+                    context.error_count += 1
+
+                if errors is None:
+                    errors = ContractError()
+
+                errors._messages[index] = err._messages
+
+                if context.error_count >= context.max_errors:
+                    break
+
+        if errors:
+            raise errors
 
         if self._hooks[POST_LOAD_MANY_INDEX] == 1:
             try:
-                items = self._post_load_many(items, context)
+                items = self._post_load_many(items, context) if PROFILER is None else \
+                    self._run_hook(POST_LOAD_MANY_INDEX, items, context)
             except ValidationError as err:
                 raise ContractError([err])
 
         return items
 
     @cython.boundscheck(False)
-    cdef inline object _load_single(self, object data, Context context):
+    @cython.wraparound(False)
+    cdef inline object _load_single(self, object data, Context context, FieldPlan plan):
+        if PROFILER is not None:
+            return self._load_single_profiled(data, context, plan)
+
         if self._hooks[PRE_LOAD_INDEX] == 1:
             try:
                 data = self._pre_load(data, context)
             except ValidationError as err:
                 raise ContractError([err])
 
+        return self._load_accessed(data, plan.load_accessor(data), context, plan)
+
+    @cython.boundscheck(False)
+    @cython.wraparound(False)
+    cdef inline object _load_accessed(self, object data, Accessor accessor, Context context, FieldPlan plan):
         cdef ContractError errors = None
         cdef dict result = {}
-        cdef object fields = self.fields.values()
+        cdef object target = self._new_target()
+        cdef list fields = plan.load_fields
+        cdef int[:] kinds = plan.load_kinds
 
+        cdef object source = accessor.source(data)
+
+        cdef Py_ssize_t index
         cdef Field field
-        cdef object raw, value
+        cdef object value
 
-        for field in fields:
-            if field.dump_only:
-                continue
+        for index in range(len(fields)):
+            field = <Field>fields[index]
 
             try:
-                raw = self._get_value(data, field.load_from)
+                value = accessor.get(data, source, index)
 
-                if self.partial and raw is missing:
-                    continue
+                if value is missing:
+                    if self.partial:
+                        continue
 
-                value = field.load(raw, context)
+                    value = field.load(value, context)
 
-                if value is not missing:
+                elif value is None:
+                    value = field.load(value, context)
+
+                else:
+                    value = load_value(field, kinds[index], value, context)
+
+                if value is missing:
+                    pass
+                elif target is None:
                     result[field.name] = value
+                else:
+                    PyObject_GenericSetAttr(target, field.name, value)
             except ValidationError as err:
                 if not err.field_names:
                     err.field_names = [field.name]
@@ -260,17 +1462,198 @@ cdef class BaseContract(object):
                 else:
                     errors.add_error(err)
 
+                if context.max_errors > 0:
+                    # nested contracts count their own errors.
+                    if not isinstance(err, ContractError):
+                        context.error_count += 1
+
+                    if context.error_count >= context.max_errors:
+                        break
+
         if errors:
             raise errors
 
+        if target is None:
+            target = result
+
         if self._hooks[POST_LOAD_INDEX] == 1:
             try:
-                result = self._post_load(result, context)
+                target = self._post_load(target, context)
             except ValidationError as err:
                 raise ContractError([err])
 
+        return target
+
+    cdef object _dump_cached(self, object data, Context context, FieldPlan plan):
+        cdef DumpCache cache = plan.dump_cache
+        key = cache.make_key(plan, data)
+
+        if key is None:
+            return self._dump_single(data, context, plan)
+
+        result = cache.lookup(key)
+
+        if result is missing:
+            result = self._dump_single(data, context, plan)
+            cache.store(key, result)
+
+        return result
+
+    cdef object _dump_single_profiled(self, object data, Context context, FieldPlan plan):
+        if self._hooks[PRE_DUMP_INDEX] == 1:
+            data = self._run_hook(PRE_DUMP_INDEX, data, context)
+
+        cdef Profiler profiler = PROFILER
+        cdef object cls = type(self)
+        cdef dict result = {}
+        cdef list fields = plan.dump_fields
+        cdef int[:] kinds = plan.dump_kinds
+
+        cdef Accessor accessor = plan.dump_accessor(data)
+        cdef object source = accessor.source(data)
+
+        cdef Py_ssize_t index
+        cdef Field field
+        cdef object value
+        cdef long long start
+
+        for index in range(len(fields)):
+            field = <Field>fields[index]
+
+            value = accessor.get(data, source, index)
+
+            if value is missing and kinds[index] != KIND_FIELD:
+                continue
+
+            if value is not None or kinds[index] == KIND_FIELD:
+                start = now()
+
+                try:
+                    value = dump_value(field, kinds[index], value, context)
+                finally:
+                    profiler.record(cls, field.name, 'convert', now() - start)
+
+                if value is missing:
+                    continue
+
+            result[field.dump_to] = value
+
+        if self._hooks[POST_DUMP_INDEX] == 1:
+            result = self._run_hook(POST_DUMP_INDEX, result, context)
+
         return result
 
+    cdef object _load_single_profiled(self, object data, Context context, FieldPlan plan):
+        if self._hooks[PRE_LOAD_INDEX] == 1:
+            try:
+                data = self._run_hook(PRE_LOAD_INDEX, data, context)
+            except ValidationError as err:
+                raise ContractError([err])
+
+        cdef Profiler profiler = PROFILER
+        cdef object cls = type(self)
+        cdef ContractError errors = None
+        cdef dict result = {}
+        cdef object target = self._new_target()
+        cdef list fields = plan.load_fields
+        cdef int[:] kinds = plan.load_kinds
+
+        cdef Accessor accessor = plan.load_accessor(data)
+        cdef object source = accessor.source(data)
+
+        cdef Py_ssize_t index
+        cdef Field field
+        cdef object value
+        cdef long long start
+        cdef bint validate
+
+        for index in range(len(fields)):
+            field = <Field>fields[index]
+
+            try:
+                value = accessor.get(data, source, index)
+
+                if value is missing and self.partial:
+                    continue
+
+                validate = False
+                start = now()
+
+                try:
+                    if value is missing or value is None:
+                        value = field.load(value, context)
+                    else:
+                        value = convert_value(field, kinds[index], value, context)
+                        validate = kinds[index] != KIND_FIELD and (field.validators or field._method_validators)
+                finally:
+                    profiler.record(cls, field.name, 'convert', now() - start)
+
+                if validate:
+                    start = now()
+
+                    try:
+                        field._validate(value, context)
+                    finally:
+                        profiler.record(cls, field.name, 'validate', now() - start)
+
+                if value is missing:
+                    pass
+                elif target is None:
+                    result[field.name] = value
+                else:
+                    PyObject_GenericSetAttr(target, field.name, value)
+            except ValidationError as err:
+                if not err.field_names:
+                    err.field_names = [field.name]
+
+                if errors is None:
+                    errors = ContractError([err])
+                else:
+                    errors.add_error(err)
+
+                if context.max_errors > 0:
+                    if not isinstance(err, ContractError):
+                        context.error_count += 1
+
+                    if context.error_count >= context.max_errors:
+                        break
+
+        if errors:
+            raise errors
+
+        if target is None:
+            target = result
+
+        if self._hooks[POST_LOAD_INDEX] == 1:
+            try:
+                target = self._run_hook(POST_LOAD_INDEX, target, context)
+            except ValidationError as err:
+                raise ContractError([err])
+
+        return target
+
+    cdef object _run_hook(self, int index, object data, Context context):
+        cdef long long start = now()
+
+        try:
+            if index == PRE_DUMP_INDEX:
+                return self._pre_dump(data, context)
+            if index == PRE_DUMP_MANY_INDEX:
+                return self._pre_dump_many(data, context)
+            if index == POST_DUMP_INDEX:
+                return self._post_dump(data, context)
+            if index == POST_DUMP_MANY_INDEX:
+                return self._post_dump_many(data, context)
+            if index == PRE_LOAD_INDEX:
+                return self._pre_load(data, context)
+            if index == PRE_LOAD_MANY_INDEX:
+                return self._pre_load_many(data, context)
+            if index == POST_LOAD_INDEX:
+                return self._post_load(data, context)
+            return self._post_load_many(data, context)
+        finally:
+            PROFILER.record(type(self), HOOK_NAMES[index], 'hook', now() - start)
+
     cpdef object _pre_dump(self, object data, Context context):
         return data
 
@@ -296,6 +1679,295 @@ cdef class BaseContract(object):
         return data
 
 
+cdef set _intersect_names(set first, set second):
+    # a name is kept when the other projection has it or one of its parents, e.g. `nested` and `nested.field`.
+    cdef set names = set()
+
+    for name in first:
+        for other in second:
+            if name == other or name.startswith(other + '.'):
+                names.add(name)
+            elif other.startswith(name + '.'):
+                names.add(other)
+
+    return names
+
+
+cdef Profiler set_profiler(Profiler profiler):
+    """
+    Sets the active profiler and returns the previous one.
+    """
+    global PROFILER
+
+    previous = PROFILER
+    PROFILER = profiler
+    return previous
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef array.array _column_mask(list values):
+    cdef Py_ssize_t index
+    cdef Py_ssize_t size = len(values)
+    cdef array.array mask = array.clone(MASK_TEMPLATE, size, zero=False)
+
+    for index in range(size):
+        mask.data.as_schars[index] = values[index] is not None
+
+    return mask
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object _typed_column(list values, int kind):
+    """
+    Copies the values of the Integer, Float and Boolean fields into a typed
+    array with 0 in place of None, the other values are kept in the list.
+    """
+    cdef Py_ssize_t index
+    cdef Py_ssize_t size = len(values)
+    cdef array.array column
+
+    typecode = COLUMN_TYPECODES.get(kind)
+
+    if typecode is None:
+        return values
+
+    column = array.clone(array.array(typecode), size, zero=True)
+
+    try:
+        for index in range(size):
+            value = values[index]
+
+            if value is None:
+                continue
+
+            if kind == KIND_INTEGER:
+                column.data.as_longlongs[index] = value
+            elif kind == KIND_FLOAT:
+                column.data.as_doubles[index] = value
+            else:
+                column.data.as_schars[index] = <bint>value
+    except OverflowError:
+        # the values out of the range of the typed column are kept in the list.
+        return values
+
+    return column
+
+
+cdef object _import_numpy():
+    global NUMPY
+
+    if NUMPY is None:
+        try:
+            import numpy
+            NUMPY = numpy
+        except ImportError:
+            NUMPY = False
+
+    return NUMPY or None
+
+
+cdef object _numpy_dtype(object numpy, str typecode):
+    if typecode == 'q':
+        return numpy.int64
+    if typecode == 'd':
+        return numpy.float64
+    return numpy.bool_
+
+
+cdef list _async_fields(FieldPlan plan, bint dump, dict found, set pending):
+    """
+    Returns the `(key, field, fields, in_list, many)` of the fields of `plan` whose values may be
+    awaitables, the `Method` and `Function` fields without nested `fields`, and the `Nested` fields,
+    or the lists of them, whose contracts have some. The results are kept by plan in `found`.
+    """
+    cdef list result = found.get(id(plan))
+    cdef list nested_fields
+    cdef Field child
+    cdef BaseContract contract
+
+    if result is not None:
+        return result
+
+    result = []
+    found[id(plan)] = result
+    pending.add(id(plan))
+
+    for field in (plan.dump_fields if dump else plan.load_fields):
+        key = (<Field>field).dump_to if dump else (<Field>field).name
+
+        if isinstance(field, (Method, Function)):
+            result.append((key, field, None, False, False))
+            continue
+
+        child = (<List>field).child if isinstance(field, List) else <Field>field
+
+        if not isinstance(child, Nested):
+            continue
+
+        contract = (<Nested>child)._get_instance()
+        nested_fields = _async_fields(contract._plan, dump, found, pending)
+
+        # the fields of a recursive contract are still being found, so it is walked anyway.
+        if nested_fields or id(contract._plan) in pending:
+            result.append((key, field, nested_fields, child is not field, contract.many))
+
+    pending.discard(id(plan))
+
+    return result
+
+
+cdef _find_awaitables(object item, list fields, tuple path, list places, list awaitables):
+    """
+    Appends the awaitables in `item` to `awaitables` and their `(item, key, field, path)`
+    to `places`, where `path` locates the errors of the field in the errors of the top item.
+    """
+    for key, field, nested_fields, in_list, many in fields:
+        value = (<dict>item).get(key) if type(item) is dict else getattr(item, key, None)
+
+        if nested_fields is None:
+            if hasattr(type(value), '__await__'):
+                places.append((item, key, field, path + (key,)))
+                awaitables.append(value)
+
+        elif value is not None and value is not missing:
+            if in_list:
+                for index, element in enumerate(value):
+                    if element is not None:
+                        _find_nested_awaitables(element, nested_fields, many, path + (key, [index]), places,
+                                                awaitables)
+            else:
+                _find_nested_awaitables(value, nested_fields, many, path + (key,), places, awaitables)
+
+
+cdef _find_nested_awaitables(object value, list fields, bint many, tuple path, list places, list awaitables):
+    if not many:
+        _find_awaitables(value, fields, path, places, awaitables)
+        return
+
+    for index, item in enumerate(value):
+        _find_awaitables(item, fields, path + (index,), places, awaitables)
+
+
+cdef _set_error(dict errors, tuple path, object messages):
+    """
+    Sets the `messages` of a field in `errors` at `path`, the way the nested contracts nest
+    their errors, the errors of a list are a dict keyed by item index within a list.
+    """
+    cdef dict target = errors
+    cdef Py_ssize_t index
+
+    for index in range(len(path) - 1):
+        step = path[index]
+
+        if type(step) is list:
+            target = (<dict>target).setdefault((<list>step)[0], {})
+        elif type(path[index + 1]) is list:
+            target = (<list>target.setdefault(step, [{}]))[0]
+        else:
+            target = (<dict>target).setdefault(step, {})
+
+    target[path[len(path) - 1]] = messages
+
+
+async def _await_values(list items, list fields, Py_ssize_t offset, Context context, bint validate):
+    """
+    Awaits concurrently the awaitable values of `fields` in the loaded or dumped `items`,
+    replaces them with their results and runs the validators of their fields when `validate`,
+    since `Field.load` leaves the awaitables unvalidated. Returns the errors keyed by item position.
+    """
+    import asyncio
+
+    cdef list places = []
+    cdef list awaitables = []
+    cdef dict errors = {}
+    cdef Field field
+
+    for position, item in enumerate(items, offset):
+        _find_awaitables(item, fields, (position,), places, awaitables)
+
+    if not awaitables:
+        return errors
+
+    for (item, key, field, path), result in zip(places, await asyncio.gather(*awaitables,
+                                                                              return_exceptions=True)):
+        if validate and not isinstance(result, BaseException) and (field.validators or field._method_validators):
+            try:
+                field._validate(result, context)
+            except ValidationError as err:
+                result = err
+
+        if isinstance(result, ValidationError):
+            _set_error(errors, path, (<ValidationError>result)._messages)
+            continue
+
+        if isinstance(result, BaseException):
+            raise result
+
+        if type(item) is dict:
+            (<dict>item)[key] = result
+        else:
+            setattr(item, key, result)
+
+    return errors
+
+
+cdef BaseContract get_instance(object cls, bint many, set only, set exclude):
+    """
+    Returns a contract instance shared by the callers with the same options,
+    contracts do not keep state between calls so they can be reused.
+    """
+    key = (cls, many, frozenset(only) if only else None, frozenset(exclude) if exclude else None)
+
+    cdef BaseContract instance = INSTANCES.get(key)
+
+    if instance is None:
+        instance = cls(many=many, only=only, exclude=exclude)
+        INSTANCES.set(key, instance)
+
+    return instance
+
+
+def make_record_type(contract_cls):
+    """
+    Creates a class with `__slots__` for the loaded fields of `contract_cls`.
+    """
+    names = tuple(name for name, field in contract_cls._declared_fields.items() if not field.dump_only)
+
+    def __init__(self, **kwargs):
+        for name, value in kwargs.items():
+            setattr(self, name, value)
+
+    def __repr__(self):
+        values = ', '.join('{0}={1!r}'.format(name, getattr(self, name)) for name in names if hasattr(self, name))
+        return '{0}({1})'.format(type(self).__name__, values)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return all(getattr(self, name, missing) == getattr(other, name, missing) for name in names)
+
+    def __reduce__(self):
+        # the record types are not importable, so they are rebuilt from the contract.
+        return _make_record, (contract_cls, {name: getattr(self, name) for name in names if hasattr(self, name)})
+
+    return type(contract_cls.__name__ + 'Record', (object,), {
+        '__slots__': names,
+        '__module__': contract_cls.__module__,
+        '__init__': __init__,
+        '__repr__': __repr__,
+        '__eq__': __eq__,
+        '__hash__': None,
+        '__reduce__': __reduce__,
+    })
+
+
+def _make_record(contract_cls, values):
+    return contract_cls.record_type()(**values)
+
+
 class ContractMeta(type):
     def __new__(mcs, name, bases, attrs):
         declared_fields = mcs.get_declared_fields(bases, attrs)
@@ -3,10 +3,21 @@ Handles exceptions raised by Contracts.
 """
 
 
+cdef class ErrorMessage(object):
+    cdef public str code
+    cdef public object template
+    cdef public dict params
+
+    cpdef object format(self)
+
+
 cdef class ValidationError(Exception):
-    cdef public object messages
+    cdef public object _messages
     cdef public list field_names
 
 
 cdef class ContractError(ValidationError):
     cpdef add_error(self, ValidationError error)
+
+
+cdef object format_messages(object messages)
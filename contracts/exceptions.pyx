@@ -3,18 +3,64 @@ Handles exceptions raised by Contracts.
 """
 
 
+cdef class ErrorMessage(object):
+    """
+    An error message formatted only when the messages of the error are read,
+    so rejecting invalid data does not pay for messages nobody reads.
+    :param str code: The key of the message in the `error_messages` dictionary.
+    :param template: The message to be formatted.
+    :param dict params: The params used to replace the message tokens.
+    """
+
+    def __init__(self, str code, object template, dict params):
+        self.code = code
+        self.template = template
+        self.params = params
+
+    def __str__(self):
+        return str(self.format())
+
+    def __repr__(self):
+        return 'ErrorMessage({0!r}, {1!r}, {2!r})'.format(self.code, self.template, self.params)
+
+    cpdef object format(self):
+        if isinstance(self.template, str):
+            return (<str>self.template).format(**self.params)
+
+        return self.template
+
+
 cdef class ValidationError(Exception):
     def __init__(self, object message, list field_names=None):
         if not isinstance(message, list):
             message = [message]
 
-        self.messages = message
+        self._messages = message
         self.field_names = field_names
 
+    def __str__(self):
+        cdef tuple args = _format_args(self.args)
+
+        if len(args) == 1:
+            return str(args[0])
+
+        return str(args) if args else ''
+
+    def __repr__(self):
+        return '{0}({1})'.format(type(self).__name__, ', '.join(repr(arg) for arg in _format_args(self.args)))
+
+    @property
+    def messages(self):
+        return format_messages(self._messages)
+
+    @messages.setter
+    def messages(self, value):
+        self._messages = value
+
 
 cdef class ContractError(ValidationError):
     def __init__(self, list errors=None):
-        self.messages = {}
+        self._messages = {}
 
         if errors:
             for error in errors:
@@ -25,16 +71,65 @@ cdef class ContractError(ValidationError):
         cdef list field_names = error.field_names or ['_contract']
 
         for field_name in field_names:
-            field_messages = self.messages.get(field_name, None)
+            field_messages = self._messages.get(field_name, None)
 
             if field_messages is None:
-                self.messages[field_name] = error.messages
+                self._messages[field_name] = error._messages
+
+            elif isinstance(error._messages, list):
+                field_messages.extend(error._messages)
+
+            elif isinstance(error._messages, dict):
+                field_messages.update(error._messages)
 
-            elif isinstance(error.messages, list):
-                field_messages.extend(error.messages)
+            else:
+                raise ValueError('Expected list or dict, got ' + str(type(error._messages)))
+
+
+cdef object format_messages(object messages):
+    """
+    Formats in place the error messages found in the given lists and dicts.
+    """
+    cdef Py_ssize_t index
+    cdef list items
+    cdef dict mapping
+
+    if isinstance(messages, list):
+        items = <list>messages
 
-            elif isinstance(error.messages, dict):
-                field_messages.update(error.messages)
+        for index in range(len(items)):
+            item = items[index]
 
+            if isinstance(item, ErrorMessage):
+                items[index] = (<ErrorMessage>item).format()
             else:
-                raise ValueError('Expected list or dict, got ' + str(type(error.messages)))
+                format_messages(item)
+
+    elif isinstance(messages, dict):
+        mapping = <dict>messages
+
+        for key, item in mapping.items():
+            if isinstance(item, ErrorMessage):
+                mapping[key] = (<ErrorMessage>item).format()
+            else:
+                format_messages(item)
+
+    return messages
+
+
+cdef tuple _format_args(tuple args):
+    # the args hold the raw messages, which are formatted for display without being replaced.
+    return tuple([_format_arg(arg) for arg in args])
+
+
+cdef object _format_arg(object arg):
+    if isinstance(arg, ErrorMessage):
+        return (<ErrorMessage>arg).format()
+
+    if isinstance(arg, list):
+        return [_format_arg(item) for item in <list>arg]
+
+    if isinstance(arg, dict):
+        return {key: _format_arg(value) for key, value in (<dict>arg).items()}
+
+    return arg
@@ -1,8 +1,23 @@
 from cpython.datetime cimport datetime
 
+from .cache cimport LRUCache
 from .contract cimport Context, BaseContract
 
 
+cdef enum:
+    KIND_FIELD = 0
+    KIND_BOOLEAN = 1
+    KIND_DATE = 2
+    KIND_DATETIME = 3
+    KIND_FLOAT = 4
+    KIND_INTEGER = 5
+    KIND_LIST = 6
+    KIND_NESTED = 7
+    KIND_STRING = 8
+    KIND_UUID = 9
+    KIND_MEMOIZED = 10
+
+
 cdef class Field(object):
     cdef public str name
     cdef public object parent
@@ -14,8 +29,13 @@ cdef class Field(object):
     cdef public str load_from
     cdef public bint required
     cdef public list validators
-    cdef public dict error_messages
+    # shared by the fields of a class until one of them reads `error_messages`, see `Field.error_messages`.
+    cdef dict _error_messages
+    cdef bint _owns_error_messages
     cdef public list _method_validators
+    cdef public LRUCache memo
+    # (validators list, validators, whether each one is built-in), replaced as a whole when recompiled.
+    cdef tuple _compiled
 
     cpdef bind(self, str name, object parent)
     cpdef Field copy(self)
@@ -29,6 +49,9 @@ cdef class Field(object):
     cpdef object _dump(self, object value, Context context)
     cpdef object _load(self, object value, Context context)
     cpdef _validate(self, object value, Context context)
+    cdef object _load_memoized(self, object value, Context context)
+    cdef tuple _compile_validators(self)
+    cdef _resolve(self)
 
 
 cdef class Boolean(Field):
@@ -65,6 +88,8 @@ cdef class List(Field):
     cdef public Field child
     cdef public bint allow_empty
 
+    cdef list _load_nested(self, object value, Context context)
+
 
 cdef class Method(Field):
     cdef public str dump_method_name
@@ -88,9 +113,84 @@ cdef class Nested(Field):
 cdef class String(Field):
     cdef public bint allow_blank
     cdef public bint trim_whitespace
+    cdef public bint intern
     cdef public object min_length
     cdef public object max_length
 
 
 cdef class UUID(Field):
     cdef public str dump_format
+
+
+cdef int field_kind(Field field)
+cdef int load_kind(Field field)
+
+
+# Converts the values of the built-in fields without dispatching through
+# `Field.dump`/`Field.load`, the generic fields (KIND_FIELD) still go through
+# them since subclasses may override them. `value` must not be None or missing.
+cdef inline object dump_value(Field field, int kind, object value, Context context):
+    if kind == KIND_INTEGER:
+        if isinstance(value, int):
+            return value
+        return int(value)
+
+    if kind == KIND_STRING:
+        if isinstance(value, str):
+            return value
+        return str(value)
+
+    if kind == KIND_FLOAT:
+        if isinstance(value, float):
+            return value
+        return float(value)
+
+    if kind == KIND_BOOLEAN and isinstance(value, bool):
+        return value
+
+    if kind == KIND_FIELD:
+        return field.dump(value, context)
+
+    return field._dump(value, context)
+
+
+cdef inline object convert_value(Field field, int kind, object value, Context context):
+    if kind == KIND_INTEGER:
+        if not isinstance(value, int):
+            value = field._load(value, context)
+
+    elif kind == KIND_STRING:
+        if not isinstance(value, str) or len(<str>value) == 0 or (<String>field).trim_whitespace:
+            value = field._load(value, context)
+
+    elif kind == KIND_FLOAT:
+        if not isinstance(value, float):
+            value = field._load(value, context)
+
+    elif kind == KIND_BOOLEAN:
+        if not isinstance(value, bool):
+            value = field._load(value, context)
+
+    elif kind == KIND_MEMOIZED:
+        value = field._load_memoized(value, context)
+
+    elif kind == KIND_FIELD:
+        # validated by `Field.load` as well.
+        value = field.load(value, context)
+
+    else:
+        value = field._load(value, context)
+
+    return value
+
+
+cdef inline object load_value(Field field, int kind, object value, Context context):
+    if kind == KIND_FIELD:
+        return field.load(value, context)
+
+    value = convert_value(field, kind, value, context)
+
+    if field.validators or field._method_validators:
+        field._validate(value, context)
+
+    return value
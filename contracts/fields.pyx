@@ -9,7 +9,9 @@ import uuid
 from cpython.datetime cimport datetime, date
 from . import timezone
 from . cimport timezone, validators
-from .exceptions cimport ValidationError
+from .cache cimport LRUCache
+from .contract cimport FieldPlan, get_instance
+from .exceptions cimport ErrorMessage, ValidationError
 from .utils cimport missing
 
 
@@ -20,10 +22,24 @@ BOOLEAN_FALSE_VALUES = {'f', 'F', 'false', 'False', 'FALSE', '0', 0, 0.0, False}
 # Default values for DateTime field
 DATETIME_DEFAULT_TIMEZONE = None
 
+# Default maximum size of the memoized conversions, see `Field(memoize=True)`
+FIELD_MEMOIZE_MAXSIZE = 1024
+
 # Default values for String field
 STRING_ALLOW_BLANK = False
 STRING_TRIM_WHITESPACE = False
 
+# The validators checked straight from C by the fields, subclasses may override `__call__`.
+cdef tuple COMPILED_VALIDATORS = (validators.Length, validators.OneOf, validators.Range, validators.Regex,
+                                  validators.UUID)
+
+# The merged `default_error_messages` of the field classes, shared by their fields.
+cdef dict ERROR_MESSAGES = {}
+
+# Strings shared by the String fields with `intern=True`, bounded by INTERN_MAXSIZE.
+cdef dict INTERNED = {}
+cdef Py_ssize_t INTERN_MAXSIZE = 65536
+
 
 cdef class Field(object):
     default_error_messages = {
@@ -32,8 +48,12 @@ cdef class Field(object):
         'validator_failed': 'Invalid value.'
     }
 
+    # Whether the loaded values are immutable and only depend on the input, so they can be memoized.
+    memoizable = False
+
     def __init__(self, bint dump_only=False, bint load_only=False, required=None, object default=missing, allow_none=None,
-                 str dump_to=None, str load_from=None, dict error_messages=None, list validators=None):
+                 str dump_to=None, str load_from=None, dict error_messages=None, list validators=None,
+                 object memoize=None):
         self.dump_only = dump_only
         self.load_only = load_only
         self.default_value = default
@@ -57,6 +77,13 @@ cdef class Field(object):
         self.name = None
         self.parent = None
 
+        # `memoize` is the maximum number of memoized string inputs, or True for the default size.
+        if memoize:
+            if not self.memoizable:
+                raise ValueError('{0} fields cannot be memoized'.format(type(self).__name__))
+
+            self.memo = LRUCache(FIELD_MEMOIZE_MAXSIZE if memoize is True else memoize)
+
         self._prepare_error_messages(error_messages)
 
     cpdef bind(self, str name, object parent):
@@ -113,8 +140,15 @@ cdef class Field(object):
 
             return self._get_default()
 
-        validated_value = self._load(value, context)
-        self._validate(validated_value, context)
+        if self.memo is None:
+            validated_value = self._load(value, context)
+        else:
+            validated_value = self._load_memoized(value, context)
+
+        # the awaitables are validated once awaited by `BaseContract.aload`.
+        if not hasattr(type(validated_value), '__await__'):
+            self._validate(validated_value, context)
+
         return validated_value
 
     cpdef object validator(self, func):
@@ -133,19 +167,35 @@ cdef class Field(object):
         field.allow_none = self.allow_none
         field.name = self.name
         field.parent = self.parent
-        field.error_messages = self.error_messages
+        field._error_messages = self._error_messages
         field._method_validators = self._method_validators
+        field.memo = self.memo
+        field._compiled = self._compiled
 
-    cdef _prepare_error_messages(self, dict error_messages):
-        cdef dict messages = {}
+    @property
+    def error_messages(self):
+        # the messages of the class are shared, so they are copied once read to be changed.
+        if not self._owns_error_messages:
+            self._error_messages = dict(self._error_messages)
+            self._owns_error_messages = True
+
+        return self._error_messages
 
-        for cls in reversed(self.__class__.__mro__):
-            messages.update(getattr(cls, 'default_error_messages', {}))
+    @error_messages.setter
+    def error_messages(self, dict value):
+        self._error_messages = value
+        self._owns_error_messages = True
 
+    cdef _prepare_error_messages(self, dict error_messages):
+        cdef dict messages = get_error_messages(type(self))
+
+        # the messages of the class are shared, so they are copied to be overridden.
         if error_messages:
+            messages = dict(messages)
             messages.update(error_messages)
+            self._owns_error_messages = True
 
-        self.error_messages = messages
+        self._error_messages = messages
 
     cpdef _get_default(self):
         if self.default_value is missing:
@@ -164,29 +214,51 @@ cdef class Field(object):
 
     def _fail(self, key, **kwargs):
         try:
-            message = self.error_messages[key]
-            if isinstance(message, str):
-                message = message.format(**kwargs)
-
-            raise ValidationError(message)
+            message = self._error_messages[key]
         except KeyError:
             raise AssertionError(
                 'ValidationError raised by `{class_name}`, but error key `{key}` does '
                 'not exist in the `error_messages` dictionary.'.format(
                     class_name=self.__class__.__name__, key=key))
 
+        if kwargs and isinstance(message, str):
+            # the message is only formatted if the errors are read.
+            message = ErrorMessage(key, message, kwargs)
+
+        raise ValidationError(message)
+
     cpdef _validate(self, object value, Context context):
         cdef list errors = None
+        cdef Py_ssize_t index
+
+        # the validators are compiled on the first call, and again when the list is replaced or grows,
+        # the compiled tuple is read once so a concurrent recompilation is never seen halfway.
+        cdef tuple compiled = self._compiled
+
+        if compiled is None or compiled[0] is not self.validators or \
+                len(<tuple>compiled[1]) != len(self.validators):
+            compiled = self._compile_validators()
+
+        cdef tuple checks = <tuple>compiled[1]
+        cdef tuple builtins = <tuple>compiled[2]
+
+        # the validators run in their declared order, the built-in ones without going through `__call__`.
+        for index in range(len(checks)):
+            validator = checks[index]
 
-        for validator in self.validators:
             try:
-                if validator(value) is False:
+                if builtins[index] is True:
+                    (<validators.Validator>validator).check(value)
+                elif validator(value) is False:
                     self._fail('validator_failed')
             except ValidationError as e:
                 if errors is None:
-                    errors = e.messages
+                    errors = e._messages
                 else:
-                    errors.extend(e.messages)
+                    errors.extend(e._messages)
+
+                if context is not None and context.max_errors == 1:
+                    raise ValidationError(errors)
 
         for validator in self._method_validators:
             try:
@@ -194,19 +266,57 @@ cdef class Field(object):
                     self._fail('validator_failed')
             except ValidationError as e:
                 if errors is None:
-                    errors = e.messages
+                    errors = e._messages
                 else:
-                    errors.extend(e.messages)
+                    errors.extend(e._messages)
+
+                if context.max_errors == 1:
+                    raise ValidationError(errors)
 
         if errors:
             raise ValidationError(errors)
 
+    cdef object _load_memoized(self, object value, Context context):
+        # only strings are memoized, the other inputs are either cheap to convert or mutable.
+        if type(value) is not str:
+            return self._load(value, context)
+
+        result = self.memo.get(value, missing)
+
+        if result is missing:
+            result = self._load(value, context)
+            self.memo.set(value, result)
+
+        return result
+
+    cdef tuple _compile_validators(self):
+        """
+        Marks the built-in validators, checked without going through `__call__`,
+        the result is bound to the current `validators` list.
+        """
+        cdef list validators_list = self.validators
+        cdef tuple checks = tuple(validators_list)
+
+        self._compiled = (validators_list, checks,
+                          tuple([type(validator) in COMPILED_VALIDATORS for validator in checks]))
+        return self._compiled
+
+    cdef _resolve(self):
+        """
+        Prepares what the field would otherwise set up on its first call,
+        so a field shared between threads is only read afterwards.
+        """
+        if self.validators:
+            self._compile_validators()
+
 
 cdef class Boolean(Field):
     default_error_messages = {
         'invalid': '"{value}" is not a valid boolean.'
     }
 
+    memoizable = True
+
     def __init__(self, **kwargs):
         super(Boolean, self).__init__(**kwargs)
 
@@ -252,6 +362,8 @@ cdef class Date(Field):
         'invalid': 'Date has wrong format.'
     }
 
+    memoizable = True
+
     cpdef object _load(self, object value, Context context):
         if isinstance(value, datetime):
             return value.date()
@@ -281,6 +393,8 @@ cdef class DateTime(Field):
         'date': 'Expected a datetime but got a date.',
     }
 
+    memoizable = True
+
     def __init__(self, default_timezone=None, **kwargs):
         super(DateTime, self).__init__(**kwargs)
 
@@ -331,13 +445,15 @@ cdef class Float(Field):
         'min_value': 'Ensure this value is greater than or equal to {min_value}.',
     }
 
+    memoizable = True
+
     def __init__(self, min_value=None, max_value=None, **kwargs):
         super(Float, self).__init__(**kwargs)
         self.min_value = min_value
         self.max_value = max_value
 
         if self.min_value is not None or self.max_value is not None:
-            self.validators.append(validators.Range(min_value, max_value, self.error_messages))
+            self.validators.append(validators.Range(min_value, max_value, self._error_messages))
 
     cpdef _copy_to(self, Field field):
         super(Float, self)._copy_to(field)
@@ -403,13 +519,15 @@ cdef class Integer(Field):
         'min_value': 'Must be at least {min_value}.'
     }
 
+    memoizable = True
+
     def __init__(self, min_value=None, max_value=None, **kwargs):
         super(Integer, self).__init__(**kwargs)
         self.min_value = min_value
         self.max_value = max_value
 
         if self.min_value is not None or self.max_value is not None:
-            self.validators.append(validators.Range(min_value, max_value, self.error_messages))
+            self.validators.append(validators.Range(min_value, max_value, self._error_messages))
 
     cpdef _copy_to(self, Field field):
         super(Integer, self)._copy_to(field)
@@ -445,6 +563,10 @@ cdef class List(Field):
         self.child = child
         self.allow_empty = allow_empty
 
+    cdef _resolve(self):
+        Field._resolve(self)
+        self.child._resolve()
+
     cpdef _copy_to(self, Field field):
         super(List, self)._copy_to(field)
 
@@ -461,17 +583,34 @@ cdef class List(Field):
         if not self.allow_empty and len(value) == 0:
             self._fail('empty')
 
+        cdef Field child = self.child
+
+        if type(child) is Nested and not (<Nested>child).many and not child.validators and \
+                not child._method_validators:
+            return self._load_nested(value, context)
+
         cdef list result = []
         cdef dict errors = None
+        cdef int error_count
+        cdef int uncounted = 0
 
         for idx, item in enumerate(value):
+            error_count = context.error_count
+
             try:
                 result.append(self.child.load(item, context))
             except ValidationError as e:
                 if errors is None:
-                    errors = {idx: e.messages}
+                    errors = {idx: e._messages}
                 else:
-                    errors.update({idx: e.messages})
+                    errors.update({idx: e._messages})
+
+                # nested contracts count their own errors, the other items are counted here.
+                if context.error_count == error_count:
+                    uncounted += 1
+
+                if 0 < context.max_errors <= context.error_count + uncounted:
+                    break
 
         if errors:
             raise ValidationError(errors)
@@ -484,6 +623,55 @@ cdef class List(Field):
         """
         return [self.child.dump(item, context) for item in value]
 
+    cdef list _load_nested(self, object value, Context context):
+        """
+        Loads the items straight through the nested contract, swapping
+        the context once for all of them instead of once per item.
+        """
+        cdef Nested child = <Nested>self.child
+        cdef BaseContract contract = child._get_instance()
+        cdef FieldPlan plan = contract._plan
+        cdef list result = []
+        cdef dict errors = None
+        cdef int error_count
+        cdef int uncounted = 0
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = contract
+
+        try:
+            for idx, item in enumerate(value):
+                error_count = context.error_count
+
+                try:
+                    if item is None:
+                        result.append(child.load(item, context))
+                    else:
+                        context.contract_data = item
+                        result.append(contract._load_single(item, context, plan))
+                except ValidationError as e:
+                    if errors is None:
+                        errors = {idx: e._messages}
+                    else:
+                        errors.update({idx: e._messages})
+
+                    # the nested contract counts the errors of the items, not the null items.
+                    if context.error_count == error_count:
+                        uncounted += 1
+
+                    if 0 < context.max_errors <= context.error_count + uncounted:
+                        break
+        finally:
+            context.contract = previous_contract
+            context.contract_data = previous_contract_data
+
+        if errors:
+            raise ValidationError(errors)
+
+        return result
+
 
 cdef class Method(Field):
     def __init__(self, str dump_method_name=None, str load_method_name=None, **kwargs):
@@ -551,9 +739,13 @@ cdef class Nested(Field):
 
     cdef inline BaseContract _get_instance(self):
         if not self._instance:
-            self._instance = self.nested(many=self.many, only=self.only, exclude=self.exclude)
+            self._instance = get_instance(self.nested, self.many, self.only, self.exclude)
         return self._instance
 
+    cdef _resolve(self):
+        Field._resolve(self)
+        self._get_instance()
+
     cpdef _copy_to(self, Field field):
         super(Nested, self)._copy_to(field)
 
@@ -567,7 +759,21 @@ cdef class Nested(Field):
         return self._get_instance().load(value, context)
 
     cpdef object _dump(self, object value, Context context):
-        return self._get_instance().dump(value, context)
+        cdef BaseContract instance = self._get_instance()
+
+        if context._dumped is None:
+            return instance.dump(value, context)
+
+        # the instance and the value are kept alive so their ids are not reused during the dump.
+        key = (id(instance), id(value))
+        entry = context._dumped.get(key)
+
+        if entry is not None:
+            return (<tuple>entry)[2]
+
+        result = instance.dump(value, context)
+        context._dumped[key] = (instance, value, result)
+        return result
 
 
 cdef class String(Field):
@@ -577,9 +783,16 @@ cdef class String(Field):
         'min_length': 'Shorter than minimum length {min_length}.'
     }
 
-    def __init__(self, allow_blank=None, trim_whitespace=None, min_length=None, max_length=None, **kwargs):
+    memoizable = True
+
+    def __init__(self, allow_blank=None, trim_whitespace=None, min_length=None, max_length=None, bint intern=False,
+                 **kwargs):
         super(String, self).__init__(**kwargs)
 
+        # equal loaded values share a single object, which saves memory for large
+        # results with repeated values.
+        self.intern = intern
+
         if allow_blank is None:
             self.allow_blank = STRING_ALLOW_BLANK
         else:
@@ -595,13 +808,14 @@ cdef class String(Field):
 
         if self.min_length is not None or self.max_length is not None:
             self.validators.append(
-                validators.Length(self.min_length, self.max_length, error_messages=self.error_messages))
+                validators.Length(self.min_length, self.max_length, error_messages=self._error_messages))
 
     cpdef _copy_to(self, Field field):
         super(String, self)._copy_to(field)
 
         field.allow_blank = self.allow_blank
         field.trim_whitespace = self.trim_whitespace
+        field.intern = self.intern
         field.min_length = self.min_length
         field.max_length = self.max_length
 
@@ -621,6 +835,9 @@ cdef class String(Field):
                 return None
             self._fail('blank')
 
+        if self.intern:
+            return intern_string(s)
+
         return s
 
     cpdef object _dump(self, object value, Context context):
@@ -634,6 +851,8 @@ cdef class UUID(Field):
         'invalid': '"{value}" is not a valid UUID.',
     }
 
+    memoizable = True
+
     default_options = {
         'dump_format': 'hex_verbose'
     }
@@ -684,3 +903,94 @@ cdef class UUID(Field):
             return value.int
 
         return str(value)
+
+
+cdef int field_kind(Field field):
+    """
+    Returns the kind of the given field, used by the contract plans to
+    convert values of the built-in fields without dispatching through
+    `Field.dump`/`Field.load`. Subclasses are considered generic fields
+    because they may override the conversion methods.
+    """
+    cdef type field_type = type(field)
+
+    if field_type is Boolean:
+        return KIND_BOOLEAN
+
+    if field_type is Date:
+        return KIND_DATE
+
+    if field_type is DateTime:
+        return KIND_DATETIME
+
+    if field_type is Float:
+        return KIND_FLOAT
+
+    if field_type is Integer:
+        return KIND_INTEGER
+
+    if field_type is List:
+        return KIND_LIST
+
+    if field_type is Nested:
+        return KIND_NESTED
+
+    if field_type is String:
+        return KIND_STRING
+
+    if field_type is UUID:
+        return KIND_UUID
+
+    return KIND_FIELD
+
+
+cdef int load_kind(Field field):
+    """
+    Returns the kind of the given field on load, memoized fields
+    are loaded through `Field._load_memoized` and interned strings
+    through `String._load`.
+    """
+    cdef int kind = field_kind(field)
+
+    # the generic fields are loaded through `Field.load`, which memoizes as well.
+    if kind == KIND_FIELD:
+        return KIND_FIELD
+
+    if field.memo is not None:
+        return KIND_MEMOIZED
+
+    if kind == KIND_STRING and (<String>field).intern:
+        return KIND_FIELD
+
+    return kind
+
+
+cdef dict get_error_messages(object cls):
+    """
+    Returns the `default_error_messages` of `cls` merged with the ones of its bases,
+    computed once per class, the result must not be mutated.
+    """
+    messages = ERROR_MESSAGES.get(cls)
+
+    if messages is None:
+        messages = {}
+
+        for base in reversed(cls.__mro__):
+            messages.update(getattr(base, 'default_error_messages', {}))
+
+        ERROR_MESSAGES[cls] = messages
+
+    return <dict>messages
+
+
+cdef str intern_string(str value):
+    interned = INTERNED.get(value)
+
+    if interned is not None:
+        return <str>interned
+
+    if len(INTERNED) >= INTERN_MAXSIZE:
+        INTERNED.clear()
+
+    INTERNED[value] = value
+    return value
@@ -0,0 +1,27 @@
+"""
+Encodes and decodes JSON straight from the contract plans.
+"""
+
+from .contract cimport BaseContract, Context
+from .fields cimport Field, List
+
+
+cdef class JsonReader(object):
+    cdef bytes source
+    cdef const unsigned char* data
+    cdef Py_ssize_t length
+    cdef Py_ssize_t position
+
+
+cdef write_many(BaseContract contract, object data, bytearray buffer, Context context)
+cdef write_single(BaseContract contract, object data, bytearray buffer, Context context)
+cdef write_field(Field field, int kind, object value, bytearray buffer, Context context)
+cdef write_value(object value, bytearray buffer)
+
+cdef object read_document(BaseContract contract, object data, Context context)
+cdef object read_many(BaseContract contract, JsonReader reader, Context context)
+cdef object read_single(BaseContract contract, JsonReader reader, Context context)
+cdef object read_field(Field field, int kind, JsonReader reader, Context context)
+cdef object read_list(List field, JsonReader reader, Context context)
+cdef object read_value(JsonReader reader)
+cdef skip_value(JsonReader reader)
@@ -0,0 +1,950 @@
+"""
+Encodes and decodes JSON straight from the contract plans.
+"""
+
+cimport cython
+
+from cpython.bytearray cimport PyByteArray_AS_STRING, PyByteArray_GET_SIZE, PyByteArray_Resize
+from cpython.conversion cimport PyOS_double_to_string, Py_DTSF_ADD_DOT_0
+from cpython.long cimport PyLong_AsLongLongAndOverflow
+from cpython.mem cimport PyMem_Free
+from cpython.object cimport PyObject_GenericSetAttr
+from cpython.unicode cimport PyUnicode_1BYTE_DATA, PyUnicode_GET_LENGTH
+from cpython.conversion cimport PyOS_string_to_double
+from cpython.unicode cimport PyUnicode_DecodeUTF8
+from json.decoder import JSONDecodeError, scanstring
+from json.encoder import encode_basestring
+from libc.stdio cimport snprintf
+from libc.string cimport memcmp, memcpy, strlen
+
+from .contract cimport Accessor, BaseContract, Context, FieldPlan
+from .contract cimport PRE_DUMP_INDEX, PRE_DUMP_MANY_INDEX, POST_DUMP_INDEX, POST_DUMP_MANY_INDEX
+from .contract cimport PRE_LOAD_INDEX, PRE_LOAD_MANY_INDEX, POST_LOAD_INDEX, POST_LOAD_MANY_INDEX
+from .exceptions cimport ContractError, ValidationError
+from .fields cimport Field, List, Nested, field_kind, load_kind, load_value
+from .fields cimport KIND_FIELD, KIND_BOOLEAN, KIND_DATE, KIND_DATETIME, KIND_FLOAT, KIND_INTEGER, KIND_LIST
+from .fields cimport KIND_NESTED, KIND_STRING, KIND_UUID
+from .utils cimport missing
+
+
+cdef extern from "Python.h":
+    bint PyUnicode_IS_ASCII(object o)
+
+
+cdef write_many(BaseContract contract, object data, bytearray buffer, Context context):
+    # the post hook needs the dumped items, so the items are dumped as usual.
+    if contract._hooks[POST_DUMP_MANY_INDEX] == 1:
+        write_value(contract._dump_many(data, context, contract._plan), buffer)
+        return
+
+    if contract._hooks[PRE_DUMP_MANY_INDEX] == 1:
+        data = contract._pre_dump_many(data, context)
+
+    cdef bint first = True
+
+    _write(buffer, b'[', 1)
+
+    for item in data:
+        if first:
+            first = False
+        else:
+            _write(buffer, b',', 1)
+
+        context.contract_data = item
+
+        write_single(contract, item, buffer, context)
+
+    _write(buffer, b']', 1)
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef write_single(BaseContract contract, object data, bytearray buffer, Context context):
+    # the cached results are dicts, so they are written as they are.
+    if contract._plan.dump_cache is not None:
+        write_value(contract._dump_cached(data, context, contract._plan), buffer)
+        return
+
+    # the post hook needs the dumped dict, so the item is dumped as usual.
+    if contract._hooks[POST_DUMP_INDEX] == 1:
+        write_value(contract._dump_single(data, context, contract._plan), buffer)
+        return
+
+    if contract._hooks[PRE_DUMP_INDEX] == 1:
+        data = contract._pre_dump(data, context)
+
+    cdef FieldPlan plan = contract._plan
+    cdef list fields = plan.dump_fields
+    cdef list keys = plan.dump_keys
+    cdef int[:] kinds = plan.dump_kinds
+
+    cdef Accessor accessor = plan.dump_accessor(data)
+    cdef object source = accessor.source(data)
+
+    cdef Py_ssize_t index
+    cdef Field field
+    cdef object value
+    cdef int kind
+    cdef bint first = True
+
+    _write(buffer, b'{', 1)
+
+    for index in range(len(fields)):
+        field = <Field>fields[index]
+        kind = kinds[index]
+
+        value = accessor.get(data, source, index)
+
+        # generic fields may skip the value, so it is dumped before writing the key.
+        # they may also override `dump`, so they receive the missing and None values too.
+        if kind == KIND_FIELD:
+            value = field.dump(value, context)
+
+            if value is missing:
+                continue
+
+        elif value is missing:
+            continue
+
+        if first:
+            first = False
+        else:
+            _write(buffer, b',', 1)
+
+        _write_bytes(buffer, <bytes>keys[index])
+
+        if value is None:
+            _write(buffer, b'null', 4)
+        elif kind == KIND_FIELD:
+            write_value(value, buffer)
+        else:
+            write_field(field, kind, value, buffer, context)
+
+    _write(buffer, b'}', 1)
+
+
+cdef write_field(Field field, int kind, object value, bytearray buffer, Context context):
+    cdef BaseContract contract
+    cdef Field child
+    cdef int child_kind
+    cdef bint first
+
+    if kind == KIND_INTEGER:
+        if not isinstance(value, int):
+            value = int(value)
+
+        write_value(value, buffer)
+
+    elif kind == KIND_STRING:
+        if not isinstance(value, str):
+            value = str(value)
+
+        _write_str(buffer, <str>value)
+
+    elif kind == KIND_FLOAT:
+        if not isinstance(value, float):
+            value = float(value)
+
+        write_value(value, buffer)
+
+    elif kind == KIND_BOOLEAN:
+        if field._dump(value, context):
+            _write(buffer, b'true', 4)
+        else:
+            _write(buffer, b'false', 5)
+
+    elif kind == KIND_DATE or kind == KIND_DATETIME or kind == KIND_UUID:
+        # the ISO formats and the uuid representations never need escaping.
+        value = field._dump(value, context)
+
+        if isinstance(value, str):
+            _write_ascii(buffer, <str>value)
+        else:
+            write_value(value, buffer)
+
+    elif kind == KIND_NESTED:
+        contract = (<Nested>field)._get_instance()
+
+        previous_contract = context.contract
+        previous_contract_data = context.contract_data
+
+        context.contract = contract
+        context.contract_data = value
+
+        if contract.many:
+            write_many(contract, value, buffer, context)
+        else:
+            write_single(contract, value, buffer, context)
+
+        context.contract = previous_contract
+        context.contract_data = previous_contract_data
+
+    elif kind == KIND_LIST:
+        child = (<List>field).child
+        child_kind = field_kind(child)
+        first = True
+
+        _write(buffer, b'[', 1)
+
+        for item in value:
+            if first:
+                first = False
+            else:
+                _write(buffer, b',', 1)
+
+            if child_kind == KIND_FIELD:
+                item = child.dump(item, context)
+
+            if item is None or item is missing:
+                _write(buffer, b'null', 4)
+            elif child_kind == KIND_FIELD:
+                write_value(item, buffer)
+            else:
+                write_field(child, child_kind, item, buffer, context)
+
+        _write(buffer, b']', 1)
+
+    else:
+        write_value(field._dump(value, context), buffer)
+
+
+cdef write_value(object value, bytearray buffer):
+    """
+    Writes a dumped value, following the same rules of `json.dumps`.
+    """
+    cdef bint first
+
+    if value is None:
+        _write(buffer, b'null', 4)
+
+    elif value is True:
+        _write(buffer, b'true', 4)
+
+    elif value is False:
+        _write(buffer, b'false', 5)
+
+    elif isinstance(value, str):
+        _write_str(buffer, <str>value)
+
+    elif isinstance(value, int):
+        _write_int(buffer, value)
+
+    elif isinstance(value, float):
+        _write_float(buffer, value)
+
+    elif isinstance(value, dict):
+        first = True
+
+        _write(buffer, b'{', 1)
+
+        for key, item in (<dict>value).items():
+            if first:
+                first = False
+            else:
+                _write(buffer, b',', 1)
+
+            _write_str(buffer, _key_repr(key))
+            _write(buffer, b':', 1)
+
+            write_value(item, buffer)
+
+        _write(buffer, b'}', 1)
+
+    elif isinstance(value, (list, tuple)):
+        first = True
+
+        _write(buffer, b'[', 1)
+
+        for item in value:
+            if first:
+                first = False
+            else:
+                _write(buffer, b',', 1)
+
+            write_value(item, buffer)
+
+        _write(buffer, b']', 1)
+
+    else:
+        raise TypeError('Object of type {0} is not JSON serializable'.format(value.__class__.__name__))
+
+
+cdef inline _write(bytearray buffer, const char* data, Py_ssize_t size):
+    cdef Py_ssize_t length = PyByteArray_GET_SIZE(buffer)
+
+    # bytearray over-allocates when resized, appending is amortized O(1).
+    PyByteArray_Resize(buffer, length + size)
+    memcpy(PyByteArray_AS_STRING(buffer) + length, data, size)
+
+
+cdef inline _write_bytes(bytearray buffer, bytes value):
+    _write(buffer, value, len(value))
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef inline _write_str(bytearray buffer, str value):
+    cdef Py_ssize_t length = PyUnicode_GET_LENGTH(value)
+    cdef Py_ssize_t index
+    cdef unsigned char* data
+    cdef unsigned char c
+
+    if PyUnicode_IS_ASCII(value):
+        data = PyUnicode_1BYTE_DATA(value)
+
+        for index in range(length):
+            c = data[index]
+
+            if c < 0x20 or c == b'"' or c == b'\\':
+                break
+        else:
+            _write(buffer, b'"', 1)
+            _write(buffer, <char*>data, length)
+            _write(buffer, b'"', 1)
+            return
+
+    _write_bytes(buffer, (<str>encode_basestring(value)).encode('utf-8'))
+
+
+cdef inline _write_ascii(bytearray buffer, str value):
+    _write(buffer, b'"', 1)
+    _write(buffer, <char*>PyUnicode_1BYTE_DATA(value), PyUnicode_GET_LENGTH(value))
+    _write(buffer, b'"', 1)
+
+
+cdef inline _write_int(bytearray buffer, object value):
+    cdef char[32] data
+    cdef int overflow = 0
+    cdef long long number = PyLong_AsLongLongAndOverflow(value, &overflow)
+
+    if overflow != 0:
+        _write_bytes(buffer, int.__repr__(value).encode('ascii'))
+        return
+
+    _write(buffer, data, snprintf(data, 32, "%lld", number))
+
+
+cdef inline _write_float(bytearray buffer, double value):
+    cdef char* data
+
+    if value != value:
+        _write(buffer, b'NaN', 3)
+    elif value == float('inf'):
+        _write(buffer, b'Infinity', 8)
+    elif value == float('-inf'):
+        _write(buffer, b'-Infinity', 9)
+    else:
+        data = PyOS_double_to_string(value, b'r', 0, Py_DTSF_ADD_DOT_0, NULL)
+        _write(buffer, data, strlen(data))
+        PyMem_Free(data)
+
+
+cdef inline str _float_repr(double value):
+    if value != value:
+        return 'NaN'
+
+    if value == float('inf'):
+        return 'Infinity'
+
+    if value == float('-inf'):
+        return '-Infinity'
+
+    return float.__repr__(value)
+
+
+cdef inline str _key_repr(object key):
+    if isinstance(key, str):
+        return key
+
+    if key is True:
+        return 'true'
+
+    if key is False:
+        return 'false'
+
+    if key is None:
+        return 'null'
+
+    if isinstance(key, int):
+        return int.__repr__(key)
+
+    if isinstance(key, float):
+        return _float_repr(key)
+
+    raise TypeError('keys must be str, int, float, bool or None, not {0}'.format(key.__class__.__name__))
+
+
+# Marks the fields not found while reading an object.
+cdef object UNSEEN = object()
+
+
+cdef class JsonReader(object):
+    """
+    Keeps the position while reading a JSON document.
+    """
+
+    def __init__(self, object source):
+        if isinstance(source, str):
+            source = (<str>source).encode('utf-8')
+        elif not isinstance(source, bytes):
+            source = bytes(source)
+
+        # bytes are always null terminated, what `PyOS_string_to_double` relies on.
+        self.source = source
+        self.data = self.source
+        self.length = len(self.source)
+        self.position = 0
+
+    def fail(self, str message):
+        raise JSONDecodeError(message, self.source.decode('utf-8', 'replace'), self.position)
+
+
+cdef object read_document(BaseContract contract, object data, Context context):
+    cdef JsonReader reader = JsonReader(data)
+
+    if contract.many:
+        data = read_many(contract, reader, context)
+    else:
+        data = read_single(contract, reader, context)
+
+    _skip_whitespaces(reader)
+
+    if reader.position != reader.length:
+        reader.fail('Extra data')
+
+    return data
+
+
+cdef object read_many(BaseContract contract, JsonReader reader, Context context):
+    if _peek(reader) != b'[':
+        _fail_datatype(contract, read_value(reader))
+
+    cdef list items = []
+
+    reader.position += 1
+
+    if _peek(reader) == b']':
+        reader.position += 1
+    else:
+        while True:
+            items.append(read_single(contract, reader, context))
+
+            if _next_separator(reader, b']'):
+                break
+
+    if contract._hooks[POST_LOAD_MANY_INDEX] == 1:
+        try:
+            items = contract._post_load_many(items, context)
+        except ValidationError as err:
+            raise ContractError([err])
+
+    return items
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cdef object read_single(BaseContract contract, JsonReader reader, Context context):
+    if _peek(reader) != b'{':
+        _fail_datatype(contract, read_value(reader))
+
+    cdef FieldPlan plan = contract._plan
+    cdef list fields = plan.load_fields
+    cdef int[:] kinds = plan.load_kinds
+    cdef Py_ssize_t count = len(fields)
+    cdef list values = [UNSEEN] * count
+
+    cdef ContractError errors = None
+    cdef dict result = {}
+    cdef object target = contract._new_target()
+    cdef Py_ssize_t index = -1
+    cdef Field field
+    cdef object value
+
+    reader.position += 1
+
+    if _peek(reader) == b'}':
+        reader.position += 1
+    else:
+        while True:
+            if _peek(reader) != b'"':
+                reader.fail('Expecting property name enclosed in double quotes')
+
+            # keys are usually in the same order of the fields, so the next field is tried first.
+            index = _read_key(plan, reader, index + 1)
+
+            if _peek(reader) != b':':
+                reader.fail("Expecting ':' delimiter")
+
+            reader.position += 1
+
+            if index < 0:
+                skip_value(reader)
+            else:
+                field = <Field>fields[index]
+
+                try:
+                    values[index] = read_field(field, kinds[index], reader, context)
+                except ValidationError as err:
+                    values[index] = missing
+
+                    if not err.field_names:
+                        err.field_names = [field.name]
+
+                    if errors is None:
+                        errors = ContractError([err])
+                    else:
+                        errors.add_error(err)
+
+            if _next_separator(reader, b'}'):
+                break
+
+    for index in range(count):
+        field = <Field>fields[index]
+        value = values[index]
+
+        if value is UNSEEN:
+            if contract.partial:
+                continue
+
+            try:
+                value = field.load(missing, context)
+            except ValidationError as err:
+                if not err.field_names:
+                    err.field_names = [field.name]
+
+                if errors is None:
+                    errors = ContractError([err])
+                else:
+                    errors.add_error(err)
+
+                continue
+
+        if value is missing:
+            pass
+        elif target is None:
+            result[field.name] = value
+        else:
+            PyObject_GenericSetAttr(target, field.name, value)
+
+    if errors:
+        raise errors
+
+    if target is None:
+        target = result
+
+    if contract._hooks[POST_LOAD_INDEX] == 1:
+        try:
+            target = contract._post_load(target, context)
+        except ValidationError as err:
+            raise ContractError([err])
+
+    return target
+
+
+cdef object read_field(Field field, int kind, JsonReader reader, Context context):
+    """
+    Reads and loads the value of the given field, the value is always
+    consumed before any validation error is raised.
+    """
+    cdef BaseContract contract
+    cdef unsigned char c = _peek(reader)
+    cdef object value
+
+    if kind == KIND_NESTED:
+        contract = (<Nested>field)._get_instance()
+
+        if (contract._hooks[PRE_LOAD_INDEX] == 0 and contract._hooks[PRE_LOAD_MANY_INDEX] == 0 and
+                c == (b'[' if contract.many else b'{')):
+            previous_contract = context.contract
+            previous_contract_data = context.contract_data
+
+            context.contract = contract
+            context.contract_data = None
+
+            try:
+                if contract.many:
+                    value = read_many(contract, reader, context)
+                else:
+                    value = read_single(contract, reader, context)
+            finally:
+                context.contract = previous_contract
+                context.contract_data = previous_contract_data
+
+            if field.validators or field._method_validators:
+                field._validate(value, context)
+
+            return value
+
+    elif kind == KIND_LIST and c == b'[':
+        return read_list(<List>field, reader, context)
+
+    value = read_value(reader)
+
+    if value is None:
+        return field.load(value, context)
+
+    return load_value(field, kind, value, context)
+
+
+cdef object read_list(List field, JsonReader reader, Context context):
+    cdef Field child = field.child
+    cdef int child_kind = load_kind(child)
+    cdef list result = []
+    cdef dict errors = None
+    cdef Py_ssize_t index = 0
+
+    reader.position += 1
+
+    if _peek(reader) == b']':
+        reader.position += 1
+    else:
+        while True:
+            try:
+                result.append(read_field(child, child_kind, reader, context))
+            except ValidationError as e:
+                if errors is None:
+                    errors = {index: e._messages}
+                else:
+                    errors[index] = e._messages
+
+            index += 1
+
+            if _next_separator(reader, b']'):
+                break
+
+    if index == 0 and not field.allow_empty:
+        field._fail('empty')
+
+    if errors:
+        raise ValidationError(errors)
+
+    if field.validators or field._method_validators:
+        field._validate(result, context)
+
+    return result
+
+
+cdef object read_value(JsonReader reader):
+    """
+    Reads any JSON value, following the same rules of `json.loads`.
+    """
+    cdef unsigned char c = _peek(reader)
+    cdef dict obj
+    cdef list array
+
+    if c == b'"':
+        return _read_string(reader)
+
+    if c == b'-' or (b'0' <= c <= b'9'):
+        return _read_number(reader)
+
+    if c == b'{':
+        obj = {}
+        reader.position += 1
+
+        if _peek(reader) == b'}':
+            reader.position += 1
+            return obj
+
+        while True:
+            if _peek(reader) != b'"':
+                reader.fail('Expecting property name enclosed in double quotes')
+
+            key = _read_string(reader)
+
+            if _peek(reader) != b':':
+                reader.fail("Expecting ':' delimiter")
+
+            reader.position += 1
+
+            obj[key] = read_value(reader)
+
+            if _next_separator(reader, b'}'):
+                return obj
+
+    if c == b'[':
+        array = []
+        reader.position += 1
+
+        if _peek(reader) == b']':
+            reader.position += 1
+            return array
+
+        while True:
+            array.append(read_value(reader))
+
+            if _next_separator(reader, b']'):
+                return array
+
+    if _read_literal(reader, b'null', 4):
+        return None
+
+    if _read_literal(reader, b'true', 4):
+        return True
+
+    if _read_literal(reader, b'false', 5):
+        return False
+
+    if _read_literal(reader, b'NaN', 3):
+        return float('nan')
+
+    if _read_literal(reader, b'Infinity', 8):
+        return float('inf')
+
+    reader.fail('Expecting value')
+
+
+cdef skip_value(JsonReader reader):
+    """
+    Skips any JSON value without creating Python objects.
+    """
+    cdef unsigned char c = _peek(reader)
+
+    if c == b'"':
+        _scan_string(reader)
+
+    elif c == b'{':
+        reader.position += 1
+
+        if _peek(reader) == b'}':
+            reader.position += 1
+            return
+
+        while True:
+            if _peek(reader) != b'"':
+                reader.fail('Expecting property name enclosed in double quotes')
+
+            _scan_string(reader)
+
+            if _peek(reader) != b':':
+                reader.fail("Expecting ':' delimiter")
+
+            reader.position += 1
+
+            skip_value(reader)
+
+            if _next_separator(reader, b'}'):
+                return
+
+    elif c == b'[':
+        reader.position += 1
+
+        if _peek(reader) == b']':
+            reader.position += 1
+            return
+
+        while True:
+            skip_value(reader)
+
+            if _next_separator(reader, b']'):
+                return
+
+    elif c == b'-' or (b'0' <= c <= b'9'):
+        _scan_number(reader)
+
+    elif not (_read_literal(reader, b'null', 4) or _read_literal(reader, b'true', 4) or
+              _read_literal(reader, b'false', 5) or _read_literal(reader, b'NaN', 3) or
+              _read_literal(reader, b'Infinity', 8)):
+        reader.fail('Expecting value')
+
+
+cdef inline void _skip_whitespaces(JsonReader reader):
+    cdef unsigned char c
+
+    while reader.position < reader.length:
+        c = reader.data[reader.position]
+
+        if c != b' ' and c != b'\n' and c != b'\r' and c != b'\t':
+            return
+
+        reader.position += 1
+
+
+cdef inline unsigned char _peek(JsonReader reader):
+    """
+    Skips the whitespaces and returns the next char, or 0 at the end of the document.
+    """
+    _skip_whitespaces(reader)
+
+    if reader.position < reader.length:
+        return reader.data[reader.position]
+
+    return 0
+
+
+cdef inline bint _next_separator(JsonReader reader, unsigned char end) except -1:
+    """
+    Consumes the separator between items, returns True if the container has ended.
+    """
+    cdef unsigned char c = _peek(reader)
+
+    reader.position += 1
+
+    if c == b',':
+        return False
+
+    if c == end:
+        return True
+
+    reader.position -= 1
+    reader.fail("Expecting ',' delimiter")
+
+
+cdef inline bint _read_literal(JsonReader reader, const char* literal, Py_ssize_t size):
+    if reader.position + size <= reader.length and memcmp(reader.data + reader.position, literal, size) == 0:
+        reader.position += size
+        return True
+
+    return False
+
+
+cdef inline bint _scan_string(JsonReader reader) except -1:
+    """
+    Moves after the closing quote, returns True if the string has escape sequences.
+    """
+    cdef bint escaped = False
+    cdef unsigned char c
+
+    reader.position += 1
+
+    while reader.position < reader.length:
+        c = reader.data[reader.position]
+        reader.position += 1
+
+        if c == b'"':
+            return escaped
+
+        if c == b'\\':
+            escaped = True
+            reader.position += 1
+
+        elif c < 0x20:
+            reader.position -= 1
+            reader.fail('Invalid control character')
+
+    reader.fail('Unterminated string')
+
+
+cdef str _read_string(JsonReader reader):
+    cdef Py_ssize_t start = reader.position + 1
+    cdef bint escaped = _scan_string(reader)
+
+    if not escaped:
+        return PyUnicode_DecodeUTF8(<char*>reader.data + start, reader.position - start - 1, NULL)
+
+    # the string with its closing quote is decoded by the json module.
+    return scanstring(PyUnicode_DecodeUTF8(<char*>reader.data + start, reader.position - start, NULL), 0)[0]
+
+
+cdef Py_ssize_t _read_key(FieldPlan plan, JsonReader reader, Py_ssize_t hint) except -2:
+    """
+    Reads the key and returns the index of its field, or -1 if the key is unknown.
+    """
+    cdef Py_ssize_t start = reader.position + 1
+    cdef bint escaped = _scan_string(reader)
+    cdef Py_ssize_t size = reader.position - start - 1
+    cdef list keys = plan.load_keys
+    cdef Py_ssize_t count = len(keys)
+    cdef Py_ssize_t index
+
+    if escaped:
+        name = _read_string_at(reader, start)
+
+        for index in range(count):
+            if (<Field>plan.load_fields[index]).load_from == name:
+                return index
+
+        return -1
+
+    if hint < count and _key_equals(<bytes>keys[hint], reader.data + start, size):
+        return hint
+
+    for index in range(count):
+        if _key_equals(<bytes>keys[index], reader.data + start, size):
+            return index
+
+    return -1
+
+
+cdef str _read_string_at(JsonReader reader, Py_ssize_t start):
+    return scanstring(PyUnicode_DecodeUTF8(<char*>reader.data + start, reader.position - start, NULL), 0)[0]
+
+
+cdef inline bint _key_equals(bytes key, const unsigned char* data, Py_ssize_t size):
+    return len(key) == size and memcmp(<char*>key, data, size) == 0
+
+
+cdef inline bint _scan_number(JsonReader reader) except -1:
+    """
+    Moves after the number, returns True if the number is a float.
+    """
+    cdef bint is_float = False
+    cdef const unsigned char* data = reader.data
+
+    if data[reader.position] == b'-':
+        reader.position += 1
+
+    if reader.position < reader.length and data[reader.position] == b'0':
+        reader.position += 1
+    elif reader.position < reader.length and b'1' <= data[reader.position] <= b'9':
+        _scan_digits(reader)
+    elif _read_literal(reader, b'Infinity', 8):
+        return True
+    else:
+        reader.fail('Expecting value')
+
+    if reader.position < reader.length and data[reader.position] == b'.':
+        is_float = True
+        reader.position += 1
+
+        if _scan_digits(reader) == 0:
+            reader.fail('Expecting value')
+
+    if reader.position < reader.length and (data[reader.position] == b'e' or data[reader.position] == b'E'):
+        is_float = True
+        reader.position += 1
+
+        if reader.position < reader.length and (data[reader.position] == b'+' or data[reader.position] == b'-'):
+            reader.position += 1
+
+        if _scan_digits(reader) == 0:
+            reader.fail('Expecting value')
+
+    return is_float
+
+
+cdef inline Py_ssize_t _scan_digits(JsonReader reader):
+    cdef Py_ssize_t start = reader.position
+
+    while reader.position < reader.length and b'0' <= reader.data[reader.position] <= b'9':
+        reader.position += 1
+
+    return reader.position - start
+
+
+cdef object _read_number(JsonReader reader):
+    cdef Py_ssize_t start = reader.position
+    cdef bint is_float = _scan_number(reader)
+    cdef Py_ssize_t index
+    cdef long long number = 0
+    cdef bint negative
+    cdef char* end
+
+    if is_float:
+        return PyOS_string_to_double(<char*>reader.data + start, &end, NULL)
+
+    # up to 18 digits always fit in a long long.
+    if reader.position - start > 18:
+        return int(reader.source[start:reader.position])
+
+    negative = reader.data[start] == b'-'
+
+    for index in range(start + negative, reader.position):
+        number = number * 10 + (reader.data[index] - c'0')
+
+    return -number if negative else number
+
+
+cdef inline _fail_datatype(BaseContract contract, object value):
+    message = contract.default_error_messages['invalid'].format(datatype=type(value).__name__)
+    raise ContractError([ValidationError(message)])
@@ -0,0 +1,9 @@
+"""
+Dumps and loads many items across a pool of worker processes.
+"""
+
+from .contract cimport BaseContract, Context
+
+
+cdef object dump_many(BaseContract contract, object data, Context context, int workers, int chunk_size)
+cdef object load_many(BaseContract contract, object data, Context context, int workers, int chunk_size)
@@ -0,0 +1,197 @@
+"""
+Dumps and loads many items across a pool of worker processes.
+"""
+
+from collections import deque
+from itertools import islice, repeat
+
+from .contract cimport BaseContract, Context
+from .contract cimport PRE_DUMP_MANY_INDEX, POST_DUMP_MANY_INDEX, PRE_LOAD_MANY_INDEX, POST_LOAD_MANY_INDEX
+from .exceptions cimport ContractError, ValidationError
+
+
+cdef object dump_many(BaseContract contract, object data, Context context, int workers, int chunk_size):
+    if contract._hooks[PRE_DUMP_MANY_INDEX] == 1:
+        data = contract._pre_dump_many(data, context)
+
+    cdef list items = []
+
+    with _executor(workers) as executor:
+        for chunk in _map(executor, workers, _dump_chunk, repeat(contract), _chunks(data, chunk_size),
+                          repeat(context)):
+            items.extend(chunk)
+
+    if contract._hooks[POST_DUMP_MANY_INDEX] == 1:
+        items = contract._post_dump_many(items, context)
+
+    return items
+
+
+cdef object load_many(BaseContract contract, object data, Context context, int workers, int chunk_size):
+    if contract._hooks[PRE_LOAD_MANY_INDEX] == 1:
+        try:
+            data = contract._pre_load_many(data, context)
+        except ValidationError as err:
+            raise ContractError([err])
+
+    cdef list items = []
+    cdef ContractError errors = None
+    cdef list chunk_errors
+    cdef bint stopped = False
+
+    with _executor(workers) as executor:
+        results = _map(executor, workers, _load_chunk, repeat(contract), _chunks(data, chunk_size),
+                       repeat(context), _offsets(chunk_size))
+
+        for chunk, chunk_errors in results:
+            if chunk_errors:
+                if errors is None:
+                    errors = ContractError()
+
+                for index, item, messages, error_count, count in chunk_errors:
+                    if context.max_errors > 0 and context.error_count != error_count:
+                        # the workers count the errors of their own chunk only, so the items failing
+                        # after other chunks failed are loaded again to stop their nested errors
+                        # where the serial load does.
+                        messages = _reload(contract, item, messages, count, context)
+                    else:
+                        context.error_count += count
+
+                    errors._messages[index] = messages
+
+                    if 0 < context.max_errors <= context.error_count:
+                        stopped = True
+                        break
+            elif errors is None:
+                items.extend(chunk)
+
+            if stopped:
+                # cancels the chunks not started yet.
+                results.close()
+                break
+
+    if errors:
+        raise errors
+
+    if contract._hooks[POST_LOAD_MANY_INDEX] == 1:
+        try:
+            items = contract._post_load_many(items, context)
+        except ValidationError as err:
+            raise ContractError([err])
+
+    return items
+
+
+def _dump_chunk(BaseContract contract, list chunk, Context context):
+    cdef list items = []
+
+    context.contract = contract
+
+    for item in chunk:
+        context.contract_data = item
+
+        items.append(contract._dump_single(item, context, contract._plan))
+
+    return items
+
+
+def _load_chunk(BaseContract contract, list chunk, Context context, Py_ssize_t offset):
+    """
+    Loads a chunk, returning the loaded items and the `(index, item, messages, error_count, count)`
+    of the failed ones, where `error_count` is the number of errors counted in the chunk before the item
+    and `count` the number of errors counted for it.
+    """
+    cdef list items = []
+    cdef list errors = None
+    cdef int error_count
+
+    context.contract = contract
+
+    for index, item in enumerate(chunk, offset):
+        context.contract_data = item
+        error_count = context.error_count
+
+        try:
+            items.append(contract._load_single(item, context, contract._plan))
+        except ValidationError as err:
+            if context.error_count == error_count:
+                context.error_count += 1
+
+            if errors is None:
+                errors = []
+
+            errors.append((index, item, err._messages, error_count, context.error_count - error_count))
+
+            if 0 < context.max_errors <= context.error_count:
+                break
+
+    return items, errors
+
+
+cdef object _reload(BaseContract contract, object item, object messages, int count, Context context):
+    """
+    Loads a failed item again with the errors counted so far and returns its messages,
+    or the `messages` and `count` of the worker when the item does not fail again.
+    """
+    cdef int error_count = context.error_count
+
+    context.contract = contract
+    context.contract_data = item
+
+    try:
+        contract._load_single(item, context, contract._plan)
+    except ValidationError as err:
+        if context.error_count == error_count:
+            context.error_count += 1
+
+        return err._messages
+
+    context.error_count += count
+
+    return messages
+
+
+def _chunks(object data, int chunk_size):
+    iterator = iter(data)
+
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _map(executor, int workers, function, *iterables):
+    # unlike `executor.map`, the calls are submitted as their results are consumed,
+    # so closing the results stops submitting and cancels the calls not started yet.
+    pending = deque()
+
+    try:
+        for arguments in zip(*iterables):
+            if len(pending) >= workers * 2:
+                yield pending.popleft().result()
+
+            pending.append(executor.submit(function, *arguments))
+
+        while pending:
+            yield pending.popleft().result()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+def _offsets(int chunk_size):
+    cdef Py_ssize_t offset = 0
+
+    while True:
+        yield offset
+        offset += chunk_size
+
+
+cdef object _executor(int workers):
+    # multiprocessing is slow to import, so it is only imported by the callers using workers.
+    from concurrent.futures import ProcessPoolExecutor
+
+    return ProcessPoolExecutor(max_workers=workers)
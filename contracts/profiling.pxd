@@ -0,0 +1,18 @@
+"""
+Profiles the fields of the contracts.
+"""
+
+
+cdef class ProfileEntry(object):
+    cdef public Py_ssize_t calls
+    cdef public long long elapsed
+
+
+cdef class Profiler(object):
+    cdef dict _entries
+    cdef list _previous
+
+    cdef record(self, object contract, str name, str phase, long long elapsed)
+
+
+cdef long long now() except? -1
@@ -0,0 +1,100 @@
+"""
+Profiles the fields of the contracts.
+"""
+
+from time import perf_counter_ns
+
+from .contract cimport set_profiler
+
+
+cdef long long now() except? -1:
+    # a monotonic clock in nanoseconds, `perf_counter_ns` is portable unlike `clock_gettime`.
+    return perf_counter_ns()
+
+
+cdef class ProfileEntry(object):
+    def __repr__(self):
+        return '<ProfileEntry(calls={0}, elapsed={1})>'.format(self.calls, self.elapsed)
+
+
+cdef class Profiler(object):
+    """
+    Records the calls and the time spent by the fields of every contract
+    dumped or loaded while the profiler is active.
+
+    The time is recorded per (contract class, field name, phase), where the phase
+    is `convert`, `validate` or `hook`, hooks are recorded under their method names.
+    The time of a nested field includes the time of its nested contract.
+
+    The profiler is active within a `with` block, for every thread,
+    and contracts only check whether a profiler is active once per item.
+    """
+
+    def __init__(self):
+        self._entries = {}
+        self._previous = []
+
+    def __enter__(self):
+        self._previous.append(set_profiler(self))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        set_profiler(self._previous.pop())
+
+    cdef record(self, object contract, str name, str phase, long long elapsed):
+        key = (contract, name, phase)
+
+        cdef ProfileEntry entry = self._entries.get(key)
+
+        if entry is None:
+            entry = ProfileEntry()
+            self._entries[key] = entry
+
+        entry.calls += 1
+        entry.elapsed += elapsed
+
+    def reset(self):
+        self._entries.clear()
+
+    def stats(self):
+        """
+        Returns the recorded stats as a dict keyed by (contract class, field name, phase),
+        with the number of `calls` and the cumulative `time` in seconds.
+        """
+        cdef ProfileEntry entry
+
+        return {key: {'calls': entry.calls, 'time': entry.elapsed / 1e9}
+                for key, entry in self._entries.items()}
+
+    def table(self, int limit=0):
+        """
+        Returns the recorded stats as a text table sorted by the cumulative time,
+        showing the first `limit` rows if greater than 0.
+        """
+        cdef ProfileEntry entry
+
+        rows = sorted(self._entries.items(), key=lambda item: item[1].elapsed, reverse=True)
+
+        if limit > 0:
+            rows = rows[:limit]
+
+        lines = ['{0:<30} {1:<30} {2:<10} {3:>10} {4:>14} {5:>12}'.format(
+            'contract', 'field', 'phase', 'calls', 'time (ms)', 'per call (ns)')]
+
+        for (contract, name, phase), entry in rows:
+            lines.append('{0:<30} {1:<30} {2:<10} {3:>10} {4:>14.3f} {5:>12.0f}'.format(
+                contract.__name__, name, phase, entry.calls, entry.elapsed / 1e6, entry.elapsed / entry.calls))
+
+        return '\n'.join(lines)
+
+
+def profile():
+    """
+    Returns a profiler to be used as a context manager, e.g.
+
+        with contracts.profile() as profiler:
+            contract.load(data)
+
+        print(profiler.table())
+    """
+    return Profiler()
@@ -7,7 +7,10 @@ cdef class Validator:
     A base class from which all validator classes should inherit.
     :param dict error_messages: The error messages for various kinds of errors.
     """
-    cdef public dict error_messages
+    cdef dict _error_messages
+    cdef bint _owns_error_messages
+
+    cdef check(self, object value)
 
 
 cdef class Length(Validator):
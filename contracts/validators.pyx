@@ -4,9 +4,16 @@ Provides various validators.
 
 import uuid
 
-from .exceptions import ValidationError
+from .cache cimport LRUCache
+from .exceptions cimport ErrorMessage, ValidationError
 
 
+# The merged `default_error_messages` of the validator classes, shared by their validators.
+cdef dict ERROR_MESSAGES = {}
+
+# The messages merged with the ones given to the validators, keyed by (class, id of the given messages).
+cdef LRUCache MERGED_ERROR_MESSAGES = LRUCache(1024)
+
 MISSING_ERROR_MESSAGE = 'ValidationError raised by `{class_name}`, but error key `{key}` does ' \
                         'not exist in the `error_messages` dictionary.'
 
@@ -20,11 +27,51 @@ cdef class Validator(object):
     default_error_messages = {}
 
     def __init__(self, error_messages=None):
-        messages = {}
-        for cls in reversed(self.__class__.__mro__):
-            messages.update(getattr(cls, 'default_error_messages', {}))
-        messages.update(error_messages or {})
-        self.error_messages = messages
+        cls = type(self)
+        messages = ERROR_MESSAGES.get(cls)
+
+        if messages is None:
+            messages = {}
+            for base in reversed(cls.__mro__):
+                messages.update(getattr(base, 'default_error_messages', {}))
+            ERROR_MESSAGES[cls] = messages
+
+        if error_messages:
+            # fields pass their shared messages, so the merged ones are reused by identity.
+            key = (cls, id(error_messages))
+            entry = MERGED_ERROR_MESSAGES.get(key)
+
+            if entry is not None and entry[0] is error_messages:
+                messages = entry[1]
+            else:
+                messages = dict(messages)
+                messages.update(error_messages)
+                MERGED_ERROR_MESSAGES.set(key, (error_messages, messages))
+
+        self._error_messages = messages
+
+    @property
+    def error_messages(self):
+        # the merged messages are shared, so they are copied once read to be changed.
+        if not self._owns_error_messages:
+            self._error_messages = dict(self._error_messages)
+            self._owns_error_messages = True
+
+        return self._error_messages
+
+    @error_messages.setter
+    def error_messages(self, dict value):
+        self._error_messages = value
+        self._owns_error_messages = True
+
+    def __call__(self, value):
+        self.check(value)
+
+    cdef check(self, object value):
+        """
+        Validates `value`, called by the fields straight from C for the built-in validators.
+        """
+        pass
 
     def _fail(self, key, **kwargs):
         """
@@ -33,15 +80,18 @@ cdef class Validator(object):
         :param dict kwargs: The kwargs used to replace the messages token.
         """
         try:
-            message = self.error_messages[key]
-            if kwargs:
-                message = message.format(**kwargs)
-            raise ValidationError(message)
+            message = self._error_messages[key]
         except KeyError:
             class_name = self.__class__.__name__
             message = MISSING_ERROR_MESSAGE.format(class_name=class_name, key=key)
             raise AssertionError(message)
 
+        if kwargs and isinstance(message, str):
+            # the message is only formatted if the errors are read.
+            message = ErrorMessage(key, message, kwargs)
+
+        raise ValidationError(message)
+
 
 cdef class Length(Validator):
     """
@@ -69,8 +119,8 @@ cdef class Length(Validator):
         self.max_length = max_length
         self.equal_length = equal_length
 
-    def __call__(self, value):
-        length = len(value)
+    cdef check(self, object value):
+        cdef Py_ssize_t length = len(value)
 
         if self.equal_length is not None:
             if length != self.equal_length:
@@ -100,7 +150,7 @@ cdef class OneOf(Validator):
 
         self.choices = set(choices)
 
-    def __call__(self, value):
+    cdef check(self, object value):
         if value not in self.choices:
             self._fail('invalid', input=value)
 
@@ -125,7 +175,7 @@ cdef class Range(Validator):
         self.min_value = min_value
         self.max_value = max_value
 
-    def __call__(self, value):
+    cdef check(self, object value):
         if self.min_value is not None and value < self.min_value:
             self._fail('min_value', min_value=self.min_value)
 
@@ -149,9 +199,12 @@ cdef class Regex(Validator):
         self.regex = regex
 
     def __call__(self, value):
+        self.check(value)
+        return value
+
+    cdef check(self, object value):
         if self.regex.match(value) is None:
             self._fail('invalid', value=value, regex=self.regex.pattern)
-        return value
 
 
 cdef class UUID(Validator):
@@ -164,7 +217,7 @@ cdef class UUID(Validator):
         'invalid': 'Not a valid uuid.'
     }
 
-    def __call__(self, value):
+    cdef check(self, object value):
         try:
             uuid.UUID(hex=value)
         except (AttributeError, ValueError):
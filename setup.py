@@ -15,9 +15,14 @@ USE_CYTHON = has_option('cython')
 ext = '.pyx' if USE_CYTHON else '.c'
 
 extensions = [
+    Extension('contracts.bincodec', ['contracts/bincodec'+ext]),
+    Extension('contracts.cache', ['contracts/cache'+ext]),
     Extension('contracts.contract', ['contracts/contract'+ext]),
     Extension('contracts.exceptions', ['contracts/exceptions'+ext]),
     Extension('contracts.fields', ['contracts/fields'+ext]),
+    Extension('contracts.jsoncodec', ['contracts/jsoncodec'+ext]),
+    Extension('contracts.parallel', ['contracts/parallel'+ext]),
+    Extension('contracts.profiling', ['contracts/profiling'+ext]),
     Extension('contracts.timezone', ['contracts/timezone'+ext]),
     Extension('contracts.validators', ['contracts/validators'+ext]),
     Extension('contracts.utils', ['contracts/utils'+ext]),
@@ -0,0 +1,893 @@
+import asyncio
+import json
+import pickle
+import time
+import uuid
+
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+
+from contracts import Contract, Context, DumpCache, fields, validators
+from contracts.exceptions import ContractError, ErrorMessage, ValidationError
+from contracts.utils import missing
+from datetime import date, datetime, timezone
+from unittest import TestCase, skipUnless
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class NestedContract(Contract):
+    property1 = fields.String()
+    property2 = fields.Integer()
+
+
+class MyContract(Contract):
+    boolean = fields.Boolean()
+    float = fields.Float()
+    integer = fields.Integer(min_value=0)
+    string = fields.String(dump_to='str', load_from='str')
+    load_only = fields.String(load_only=True, required=False)
+    dump_only = fields.String(dump_only=True)
+    nested = fields.Nested(NestedContract, required=False)
+
+
+class TestContract(TestCase):
+    def test_dump(self):
+        data = {'boolean': 'true', 'float': 1, 'integer': '12', 'string': 12, 'load_only': 'a', 'dump_only': 'b'}
+
+        self.assertEqual(MyContract().dump(data), {
+            'boolean': True, 'float': 1.0, 'integer': 12, 'str': '12', 'dump_only': 'b'})
+
+    def test_dump_none_and_missing(self):
+        self.assertEqual(MyContract().dump({'boolean': None}), {'boolean': None})
+
+    def test_load(self):
+        data = {'boolean': 'true', 'float': 1, 'integer': '12', 'str': 'abc', 'load_only': 'a', 'dump_only': 'b'}
+
+        self.assertEqual(MyContract().load(data), {
+            'boolean': True, 'float': 1.0, 'integer': 12, 'string': 'abc', 'load_only': 'a'})
+
+    def test_load_errors(self):
+        data = {'boolean': 'abc', 'float': None, 'integer': -1, 'str': ''}
+
+        with self.assertRaises(ContractError) as e:
+            MyContract().load(data)
+
+        self.assertEqual(e.exception.messages, {
+            'boolean': ['"abc" is not a valid boolean.'],
+            'float': ['This field may not be null.'],
+            'integer': ['Must be at least 0.'],
+            'string': ['This field may not be blank.']})
+
+    def test_load_partial(self):
+        self.assertEqual(MyContract(partial=True).load({'integer': 1}), {'integer': 1})
+
+    def test_only(self):
+        contract = MyContract(only={'integer', 'nested.property1'})
+        data = {'integer': 1, 'float': 1.0, 'nested': {'property1': 'a', 'property2': 2}}
+
+        self.assertEqual(contract.dump(data), {'integer': 1, 'nested': {'property1': 'a'}})
+
+    def test_exclude(self):
+        contract = MyContract(exclude={'boolean', 'float', 'string', 'dump_only', 'nested.property1'})
+        data = {'integer': 1, 'float': 1.0, 'nested': {'property1': 'a', 'property2': 2}}
+
+        self.assertEqual(contract.dump(data), {'integer': 1, 'nested': {'property2': 2}})
+
+    def test_call_projection(self):
+        contract = MyContract(many=True)
+        data = [{'integer': 1, 'float': 1.0, 'nested': {'property1': 'a', 'property2': 2}}]
+
+        self.assertEqual(contract.dump(data, only={'integer', 'nested.property1'}),
+                         [{'integer': 1, 'nested': {'property1': 'a'}}])
+        self.assertEqual(contract.dump(data, exclude={'boolean', 'integer', 'string', 'dump_only', 'nested'}),
+                         [{'float': 1.0}])
+        self.assertEqual(contract.load(data, only={'float', 'nested.property2'}),
+                         [{'float': 1.0, 'nested': {'property2': 2}}])
+        self.assertEqual(contract.dump(data, only={'integer'}, workers=2), [{'integer': 1}])
+        self.assertEqual(contract.dump(data), data)
+
+    def test_instance_and_call_projection(self):
+        contract = MyContract(exclude={'float'}, only={'integer', 'float', 'nested', 'string'})
+        data = {'integer': 1, 'float': 1.0, 'string': 'a', 'nested': {'property1': 'a', 'property2': 2}}
+
+        self.assertEqual(contract.dump(data, only={'float', 'integer', 'nested.property1'}),
+                         {'integer': 1, 'nested': {'property1': 'a'}})
+        self.assertEqual(contract.dump(data, exclude={'integer'}), {'str': 'a', 'nested': data['nested']})
+        self.assertEqual(contract.dump(data, only={'boolean'}), {})
+        self.assertEqual(MyContract(many=True, exclude={'float'}).dump([data], only={'float', 'integer'}, workers=2),
+                         [{'integer': 1}])
+
+    def test_shared_preparation(self):
+        contract1 = MyContract(only={'integer', 'nested.property1'})
+        contract2 = MyContract(many=True, only={'nested.property1', 'integer'})
+
+        self.assertEqual(contract1.fields, contract2.fields)
+        self.assertIs(contract1.fields['nested'], contract2.fields['nested'])
+        self.assertIsNot(contract1.fields['nested'], MyContract().fields['nested'])
+        with self.assertRaises(TypeError):
+            del contract1.fields['integer']
+        self.assertIn('integer', contract2.fields)
+
+        contract1.dump({'nested': {}})
+        MyContract(only={'nested.property1'}).dump({'nested': {}})
+        self.assertIs(contract1.fields['nested']._instance, MyContract(only={'nested.property1'}).fields['nested']._instance)
+
+    def test_field_overriding_dump_and_load(self):
+        class UpperField(fields.Field):
+            def dump(self, value, context):
+                return value.upper()
+
+            def load(self, value, context):
+                return 'D:' + value
+
+        class CustomContract(Contract):
+            value = UpperField()
+
+        self.assertEqual(CustomContract().dump({'value': 'x'}), {'value': 'X'})
+        self.assertEqual(CustomContract().load({'value': 'x'}), {'value': 'D:x'})
+        self.assertEqual(CustomContract().dump_json({'value': 'x'}), b'{"value":"X"}')
+        self.assertEqual(CustomContract().load_json(b'{"value": "x"}'), {'value': 'D:x'})
+
+    def test_field_overriding_dump_of_missing_and_none(self):
+        class ConstField(fields.Field):
+            def dump(self, value, context):
+                return 'const' if value is missing else 'none' if value is None else value
+
+        class ConstContract(Contract):
+            value = ConstField()
+            values = fields.List(ConstField())
+
+        self.assertEqual(ConstContract().dump({}), {'value': 'const'})
+        self.assertEqual(ConstContract().dump({'value': None, 'values': [None, 'a']}),
+                         {'value': 'none', 'values': ['none', 'a']})
+        self.assertEqual(ConstContract().dump_json({}), b'{"value":"const"}')
+        self.assertEqual(ConstContract().dump_json({'value': None, 'values': [None, 'a']}),
+                         b'{"value":"none","values":["none","a"]}')
+        self.assertEqual(ConstContract(many=True).dump_columns([{}, {'value': None}])[0]['value'], ['const', 'none'])
+
+    def test_lazy_error_messages(self):
+        with self.assertRaises(ContractError) as e:
+            MyContract(only={'integer'}).load({'integer': -1})
+
+        message = e.exception._messages['integer'][0]
+        self.assertIsInstance(message, ErrorMessage)
+        self.assertEqual((message.code, message.params), ('min_value', {'min_value': 0}))
+        self.assertEqual(e.exception.messages, {'integer': ['Must be at least 0.']})
+
+    def test_max_errors_nested_list(self):
+        class ListContract(Contract):
+            items = fields.List(fields.Nested(NestedContract))
+            values = fields.List(fields.Integer())
+
+        data = {'items': [{'property1': 'a', 'property2': 'a'}] * 6}
+
+        with self.assertRaises(ContractError) as e:
+            ListContract(partial=True).load(data, max_errors=4)
+
+        self.assertEqual(len(e.exception.messages['items'][0]), 4)
+
+        with self.assertRaises(ContractError) as e:
+            ListContract(partial=True).load({'values': ['a'] * 6}, max_errors=4)
+
+        self.assertEqual(len(e.exception.messages['values'][0]), 4)
+
+    def test_fail_fast(self):
+        data = {'boolean': 'abc', 'float': None, 'integer': -1, 'str': ''}
+
+        with self.assertRaises(ContractError) as e:
+            MyContract().load(data, fail_fast=True)
+        self.assertEqual(len(e.exception.messages), 1)
+
+        with self.assertRaises(ContractError) as e:
+            MyContract().load(data, max_errors=3)
+        self.assertEqual(len(e.exception.messages), 3)
+
+    def test_max_errors_many(self):
+        data = [{'integer': 'a' if i % 2 else i} for i in range(10)]
+
+        with self.assertRaises(ContractError) as e:
+            MyContract(many=True, only={'integer'}).load(data, max_errors=2)
+
+        self.assertEqual(e.exception.messages, {1: {'integer': ['A valid integer is required.']},
+                                                3: {'integer': ['A valid integer is required.']}})
+
+    def test_dump_objects(self):
+        class SlotsData(object):
+            __slots__ = ('integer', 'float')
+
+        class PlainData(object):
+            float = 1.5
+
+            def __init__(self):
+                self.integer = 1
+
+            @property
+            def string(self):
+                return 'abc'
+
+        class DynamicData(object):
+            def __getattr__(self, name):
+                if name == 'integer':
+                    return 1
+                raise AttributeError(name)
+
+        TupleData = namedtuple('TupleData', 'integer float')
+
+        slots = SlotsData()
+        slots.integer = 1
+        contract = MyContract(many=True, only={'integer', 'float', 'string'})
+
+        self.assertEqual(contract.dump([slots, PlainData(), TupleData(1, 1.5), DynamicData(), {'integer': 1}]), [
+            {'integer': 1}, {'integer': 1, 'float': 1.5, 'str': 'abc'}, {'integer': 1, 'float': 1.5},
+            {'integer': 1}, {'integer': 1}])
+        self.assertEqual(json.loads(contract.dump_json([slots, TupleData(1, 1.5)])),
+                         [{'integer': 1}, {'integer': 1, 'float': 1.5}])
+
+    def test_load_into(self):
+        @dataclass(frozen=True)
+        class Data(object):
+            integer: int
+            float: float
+
+        contract = MyContract(many=True, only={'integer', 'float'}, load_into=Data)
+
+        self.assertEqual(contract.load([{'integer': '1', 'float': 2}]), [Data(1, 2.0)])
+        self.assertEqual(contract.load_json(b'[{"integer": 1, "float": 2}]'), [Data(1, 2.0)])
+
+    def test_load_into_record_type(self):
+        record = MyContract(load_into=True, partial=True).load({'integer': '1', 'str': 'abc'})
+
+        self.assertIs(type(record), MyContract.record_type())
+        self.assertEqual((record.integer, record.string, hasattr(record, 'float')), (1, 'abc', False))
+        self.assertEqual(record, MyContract.record_type()(integer=1, string='abc'))
+        self.assertEqual(pickle.loads(pickle.dumps(record)), record)
+        self.assertEqual(MyContract(only={'integer', 'string'}).dump(record), {'integer': 1, 'str': 'abc'})
+
+    def test_load_patch(self):
+        class PatchContract(Contract):
+            boolean = fields.Boolean()
+            float = fields.Float()
+            integer = fields.Integer(min_value=0)
+            string = fields.String(load_from='str', required=False)
+
+            def _post_load(self, data, context):
+                data['total'] = data['integer'] + data['float']
+                return data
+
+        contract = PatchContract()
+        previous = contract.load({'boolean': True, 'float': 1.5, 'integer': 1, 'str': 'a'})
+
+        self.assertEqual(contract.load_patch(previous, {'integer': '2', 'str': 'b', 'unknown': 1}), {
+            'boolean': True, 'float': 1.5, 'integer': 2, 'string': 'b', 'total': 3.5})
+        self.assertEqual(previous['integer'], 1)
+
+        with self.assertRaises(ContractError) as e:
+            contract.load_patch(previous, {'integer': -1, 'float': 'a'})
+
+        self.assertEqual(e.exception.messages, {'integer': ['Must be at least 0.'],
+                                                'float': ['A valid number is required.']})
+
+    def test_load_patch_into(self):
+        contract = MyContract(load_into=True, partial=True)
+        record = contract.load_patch(contract.load({'integer': 1, 'str': 'a'}), {'integer': '2'})
+
+        self.assertEqual(record, MyContract.record_type()(integer=2, string='a'))
+
+    def test_dump_dedup(self):
+        class OrderContract(Contract):
+            customer = fields.Nested(NestedContract)
+            summary = fields.Nested(NestedContract, only={'property1'})
+            related = fields.List(fields.Nested(NestedContract))
+
+        customer = {'property1': 'a', 'property2': 1}
+        data = [{'customer': customer, 'summary': customer, 'related': [customer]}] * 2
+
+        items = OrderContract(many=True).dump(data, dedup=True)
+
+        self.assertEqual(items, OrderContract(many=True).dump(data))
+        self.assertIs(items[0]['customer'], items[1]['customer'])
+        self.assertIs(items[0]['customer'], items[1]['related'][0])
+        self.assertEqual(items[1]['summary'], {'property1': 'a'})
+        self.assertIsNot(OrderContract().dump(data[0])['customer'], OrderContract().dump(data[0])['customer'])
+
+    def test_dump_cache(self):
+        class Product(object):
+            def __init__(self, id, version, name):
+                self.id = id
+                self.version = version
+                self.name = name
+
+        class ProductContract(Contract):
+            id = fields.Integer()
+            name = fields.String()
+
+            dump_cache = DumpCache(lambda obj: (obj.id, obj.version), maxsize=2)
+
+        class CartContract(Contract):
+            products = fields.Nested(ProductContract, many=True)
+
+        cache = ProductContract.dump_cache
+        product = Product(1, 1, 'a')
+        result = ProductContract().dump(product)
+
+        self.assertIs(ProductContract().dump(product), result)
+        self.assertIs(CartContract().dump({'products': [product]})['products'][0], result)
+        self.assertEqual(json.loads(ProductContract().dump_json(product)), {'id': 1, 'name': 'a'})
+        self.assertEqual(ProductContract(only={'id'}).dump(product), {'id': 1})
+
+        product.version, product.name = 2, 'b'
+        self.assertEqual(ProductContract().dump(product), {'id': 1, 'name': 'b'})
+
+        # an equal version key of another object, e.g. re-fetched, is a hit.
+        self.assertEqual(ProductContract().dump(Product(1, 2, 'c')), {'id': 1, 'name': 'b'})
+
+        cache.invalidate(product)
+        self.assertEqual(cache.stats(), {'hits': 4, 'misses': 3, 'size': 1, 'maxsize': 2})
+
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+    def test_dump_cache_ttl(self):
+        class TTLContract(Contract):
+            property1 = fields.String()
+
+            dump_cache = DumpCache(lambda obj: obj['property1'], ttl=0.01)
+
+        data = {'property1': 'a'}
+        result = TTLContract().dump(data)
+
+        time.sleep(0.02)
+        self.assertIsNot(TTLContract().dump(data), result)
+        self.assertEqual(TTLContract.dump_cache.misses, 2)
+
+    def test_many(self):
+        contract = MyContract(many=True, only={'integer'})
+
+        self.assertEqual(contract.dump([{'integer': 1}, {'integer': '2'}]), [{'integer': 1}, {'integer': 2}])
+        self.assertEqual(contract.load([{'integer': 1}, {'integer': '2'}]), [{'integer': 1}, {'integer': 2}])
+
+
+class TestLoadRows(TestCase):
+    def test_load_rows(self):
+        rows = [('1', 'true', 'abc', 'x'), ['2', 'false', 'def', 'y']]
+
+        self.assertEqual(MyContract(partial=True).load_rows(iter(rows), ['integer', 'boolean', 'str', 'unknown']), [
+            {'integer': 1, 'boolean': True, 'string': 'abc'}, {'integer': 2, 'boolean': False, 'string': 'def'}])
+
+    def test_header_row(self):
+        rows = [['integer', 'float'], ['1', '1.5'], ['2']]
+        contract = MyContract(only={'integer', 'float'}, partial=True)
+
+        self.assertEqual(contract.load_rows(rows), [{'integer': 1, 'float': 1.5}, {'integer': 2}])
+
+    def test_load_into(self):
+        items = MyContract(only={'integer'}, load_into=True).load_rows([(1,), (2,)], ['integer'])
+        self.assertEqual([item.integer for item in items], [1, 2])
+
+    def test_errors(self):
+        rows = [('a',), (1,), (-1,), ('b',)]
+        contract = MyContract(only={'integer'})
+
+        with self.assertRaises(ContractError) as e:
+            contract.load_rows(rows, ['integer'])
+
+        self.assertEqual(e.exception.messages, {0: {'integer': ['A valid integer is required.']},
+                                                2: {'integer': ['Must be at least 0.']},
+                                                3: {'integer': ['A valid integer is required.']}})
+
+        with self.assertRaises(ContractError) as e:
+            contract.load_rows(rows, ['integer'], max_errors=2)
+
+        self.assertEqual(list(e.exception.messages), [0, 2])
+
+        with self.assertRaises(ContractError) as e:
+            MyContract(only={'integer', 'float'}).load_rows([('x',)], ['integer'])
+
+        self.assertEqual(e.exception.messages, {0: {'integer': ['A valid integer is required.'],
+                                                    'float': ['This field is required.']}})
+
+    def test_hooks(self):
+        class RowContract(Contract):
+            value = fields.Integer()
+
+            def _pre_load(self, data, context):
+                return {'value': data['value'] * 2}
+
+        self.assertEqual(RowContract().load_rows([('1',)], ['value']), [{'value': 11}])
+
+
+class TestDumpColumns(TestCase):
+    def test_dump_columns(self):
+        data = [{'boolean': 1, 'float': '1.5', 'integer': 1, 'string': 'a', 'nested': {'property2': '2'}},
+                {'boolean': None, 'integer': 2 ** 70, 'dump_only': 'b'}]
+
+        columns, masks = MyContract(many=True).dump_columns(iter(data))
+
+        self.assertEqual({name: list(column) for name, column in columns.items()}, {
+            'boolean': [True, False], 'float': [1.5, 0.0], 'integer': [1, 2 ** 70], 'str': ['a', None],
+            'dump_only': [None, 'b'], 'nested': [{'property2': 2}, None]})
+        self.assertEqual({name: list(mask) for name, mask in masks.items()}, {
+            'boolean': [1, 0], 'float': [1, 0], 'integer': [1, 1], 'str': [1, 0], 'dump_only': [0, 1], 'nested': [1, 0]})
+        self.assertEqual(len(columns['float']), 2)
+        self.assertIsInstance(columns['integer'], list)
+
+    @skipUnless(numpy, 'NumPy is not installed')
+    def test_numpy_columns(self):
+        data = [{'boolean': True, 'float': 1.5, 'integer': 1, 'string': 'a'}, {'integer': 2}]
+
+        columns, masks = MyContract(many=True).dump_columns(data)
+
+        self.assertEqual(columns['integer'].dtype, numpy.int64)
+        self.assertEqual(columns['float'].dtype, numpy.float64)
+        self.assertEqual(columns['boolean'].dtype, numpy.bool_)
+        self.assertEqual(masks['float'].dtype, numpy.bool_)
+        self.assertEqual(columns['integer'].tolist(), [1, 2])
+        self.assertEqual(columns['float'].tolist(), [1.5, 0.0])
+        self.assertEqual(masks['float'].tolist(), [True, False])
+        self.assertEqual(columns['str'], ['a', None])
+
+    def test_hooks(self):
+        class HookContract(Contract):
+            value = fields.Integer()
+
+            def _post_dump(self, data, context):
+                if 'value' in data:
+                    data['value'] += 1
+                return data
+
+        columns, masks = HookContract().dump_columns([{'value': 1}, {}])
+        self.assertEqual((list(columns['value']), list(masks['value'])), ([2, 0], [1, 0]))
+
+
+class TestIterContract(TestCase):
+    def test_iter_dump(self):
+        items = MyContract(only={'integer'}).iter_dump({'integer': str(i)} for i in range(3))
+
+        self.assertEqual(next(items), {'integer': 0})
+        self.assertEqual(list(items), [{'integer': 1}, {'integer': 2}])
+
+    def test_iter_load(self):
+        items = MyContract(only={'integer'}).iter_load(iter([{'integer': '1'}, {'integer': 'a'}]))
+
+        self.assertEqual(next(items), {'integer': 1})
+
+        with self.assertRaises(ContractError):
+            next(items)
+
+    def test_iter_hooks(self):
+        class HookContract(Contract):
+            value = fields.Integer()
+
+            def _pre_load_many(self, data, context):
+                return (item for item in data if item['value'] != '0')
+
+            def _post_load_many(self, data, context):
+                return (dict(item, loaded=True) for item in data)
+
+        items = HookContract().iter_load({'value': str(i)} for i in range(3))
+
+        self.assertEqual(list(items), [{'value': 1, 'loaded': True}, {'value': 2, 'loaded': True}])
+
+
+class TestDumpJson(TestCase):
+    def _assert_json(self, contract, data):
+        expected = json.dumps(contract.dump(data), separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+        self.assertEqual(contract.dump_json(data), expected)
+        self.assertEqual(json.loads(contract.dump_json(data)), json.loads(expected))
+
+    def test_dump_json(self):
+        class JsonContract(Contract):
+            boolean = fields.Boolean()
+            date = fields.Date()
+            datetime = fields.DateTime()
+            float = fields.Float()
+            integer = fields.Integer(dump_to='int')
+            list = fields.List(fields.Nested(NestedContract))
+            method = fields.Method('dump_method')
+            nested = fields.Nested(NestedContract, many=True)
+            string = fields.String()
+            uuid = fields.UUID()
+
+            def dump_method(self, value, context):
+                return {'value': value, 1: [None, 1.5]} if value else missing
+
+        data = {
+            'boolean': 1, 'date': date(2001, 1, 20), 'datetime': datetime(2001, 1, 20, 13, 0, 1),
+            'float': '1.5', 'integer': True, 'list': [{'property1': 'a'}, None], 'method': 'abc',
+            'nested': [{'property2': '2'}], 'string': 'ação "\n', 'uuid': uuid.uuid4()
+        }
+
+        self._assert_json(JsonContract(), data)
+        self._assert_json(JsonContract(), {'method': '', 'string': None})
+        self._assert_json(JsonContract(), dict(data, boolean=False))
+        self._assert_json(JsonContract(), dict(data, boolean='false'))
+        self._assert_json(JsonContract(many=True), [data, {}])
+
+    def test_dump_json_with_post_dump(self):
+        class HookContract(Contract):
+            value = fields.Integer()
+
+            def _post_dump(self, data, context):
+                data['extra'] = True
+                return data
+
+        self._assert_json(HookContract(), {'value': 1})
+
+    def test_dump_json_into(self):
+        buffer = bytearray(b'data=')
+        NestedContract().dump_json_into({'property2': 1}, buffer)
+        self.assertEqual(buffer, b'data={"property2":1}')
+
+
+class TestLoadJson(TestCase):
+    class JsonContract(Contract):
+        boolean = fields.Boolean()
+        float = fields.Float()
+        integer = fields.Integer(load_from='int', min_value=0)
+        list = fields.List(fields.Nested(NestedContract), required=False)
+        nested = fields.Nested(NestedContract, many=True, required=False)
+        string = fields.String()
+        uuid = fields.UUID(required=False)
+
+    def _assert_same(self, contract, data):
+        try:
+            expected = contract.load(json.loads(data))
+        except ContractError as e:
+            with self.assertRaises(ContractError) as e2:
+                contract.load_json(data)
+            self.assertEqual(e2.exception.messages, e.messages)
+        else:
+            self.assertEqual(contract.load_json(data), expected)
+
+    def test_load_json(self):
+        data = (b' {"boolean": "true", "float": 1, "int": 12345678901234567890, "string": "a\\u00e7\\"o",'
+                b' "unknown": {"a": [1, 2.5e3, null, true, "x"]}, "uuid": "825d7aeb-05a9-45b5-a5b7-05df87923cda",'
+                b' "list": [{"property1": "a"}, {"property2": "2"}], "nested": [{"property1": "\xc3\xa7"}],'
+                b' "boolean": false} ')
+
+        self._assert_same(self.JsonContract(), data)
+        self._assert_same(self.JsonContract(many=True), b'[' + data + b', {"boolean": false, "float": -1.5,'
+                                                          b' "int": 0, "string": "b"}]')
+
+    def test_load_json_errors(self):
+        data = (b'{"boolean": 1, "float": "abc", "int": -1, "list": [{"property2": "x"}, null],'
+                b' "nested": [{"property2": 1}, {"property1": ""}], "string": null}')
+
+        self._assert_same(self.JsonContract(), data)
+    def test_load_json_invalid_datatype(self):
+        with self.assertRaises(ContractError) as e:
+            self.JsonContract().load_json(b'[1, 2]')
+
+        self.assertEqual(e.exception.messages, {'_contract': ['Invalid data. Expected a dictionary, but got list.']})
+        self._assert_same(self.JsonContract(), b'{"list": [], "nested": {}}')
+
+    def test_load_json_memoized(self):
+        class MemoContract(Contract):
+            uuid = fields.UUID(memoize=True)
+            list = fields.List(fields.UUID(memoize=True))
+
+        data = b'{"uuid": "825d7aeb-05a9-45b5-a5b7-05df87923cda", "list": ["825d7aeb-05a9-45b5-a5b7-05df87923cda"]}'
+
+        self._assert_same(MemoContract(many=True), b'[' + data + b', ' + data + b']')
+        self.assertEqual(MemoContract().fields['uuid'].memo.hits, 3)
+
+    def test_load_json_interned(self):
+        class InternContract(Contract):
+            string = fields.String(intern=True)
+            list = fields.List(fields.String(intern=True))
+
+        items = InternContract(many=True).load_json(b'[{"string": "abc", "list": ["abc"]}, {"string": "abc", "list": []}]')
+
+        self.assertIs(items[0]['string'], items[1]['string'])
+        self.assertIs(items[0]['string'], items[0]['list'][0])
+
+    def test_load_json_partial(self):
+        self._assert_same(self.JsonContract(partial=True), b'{"int": 1}')
+
+    def test_invalid_json(self):
+        for data in (b'', b'{', b'{"a" 1}', b'{"a": 1,}', b'[1, 2', b'{} 1', b'{"a": tru}', b'{"a": "\x01"}'):
+            with self.assertRaises(ValueError):
+                NestedContract(partial=True).load_json(data)
+
+
+class TestBinary(TestCase):
+    class BinaryContract(Contract):
+        boolean = fields.Boolean()
+        date = fields.Date()
+        datetime = fields.DateTime()
+        float = fields.Float()
+        integer = fields.Integer(min_value=-10)
+        list = fields.List(fields.Nested(NestedContract, allow_none=True))
+        method = fields.Method('dump_method', 'load_method', required=False)
+        nested = fields.Nested(NestedContract, many=True)
+        string = fields.String(allow_none=True)
+        uuid = fields.UUID()
+        dump_only = fields.String(dump_only=True)
+        load_only = fields.String(load_only=True, required=False)
+
+        def dump_method(self, value, context):
+            return {'value': value, 'big': 2 ** 70, 'list': [None, True, 1.5]}
+
+        def load_method(self, value, context):
+            return value['value']
+
+    def test_dump_and_load(self):
+        data = {
+            'boolean': 1, 'date': date(2001, 1, 20), 'datetime': datetime(1969, 1, 20, 13, 0, 1, 5),
+            'float': '1.5', 'integer': -5, 'list': [{'property1': 'a', 'property2': 2}, None], 'method': 'abc',
+            'nested': [{'property1': 1, 'property2': 2}], 'string': 'ação "\n', 'uuid': uuid.uuid4(), 'dump_only': 'a',
+            'load_only': 'b'
+        }
+
+        contract = self.BinaryContract(partial=True)
+        expected = dict(data, boolean=True, float=1.5, nested=[{'property1': '1', 'property2': 2}])
+        del expected['dump_only'], expected['load_only']
+
+        self.assertEqual(contract.load_binary(contract.dump_binary(data)), expected)
+        self.assertEqual(contract.load_binary(memoryview(contract.dump_binary({'string': None}))), {'string': None})
+
+        contract = self.BinaryContract(many=True, partial=True)
+        self.assertEqual(contract.load_binary(bytearray(contract.dump_binary(iter([data, {}])))), [expected, {}])
+
+    def test_aware_datetime(self):
+        contract = self.BinaryContract(only={'datetime'})
+        value = datetime(2001, 1, 20, 13, 0, 1, tzinfo=timezone.utc)
+
+        self.assertEqual(contract.load_binary(contract.dump_binary({'datetime': value})),
+                         {'datetime': datetime(2001, 1, 20, 13, 0, 1)})
+
+    def test_date_in_datetime(self):
+        contract = self.BinaryContract(only={'datetime'})
+
+        self.assertEqual(contract.load_binary(contract.dump_binary({'datetime': date(2001, 1, 20)})),
+                         {'datetime': datetime(2001, 1, 20)})
+
+    def test_big_integers(self):
+        class BigContract(Contract):
+            integer = fields.Integer()
+            integers = fields.List(fields.Integer(allow_none=True))
+            skipped = fields.Integer(dump_only=True)
+
+        contract = BigContract()
+        data = {'integer': 2 ** 70, 'integers': [1, -2 ** 64, None], 'skipped': 2 ** 64}
+
+        self.assertEqual(contract.load_binary(contract.dump_binary(data)), {'integer': 2 ** 70, 'integers': [1, -2 ** 64, None]})
+
+    def test_load_errors(self):
+        contract = self.BinaryContract(many=True, only={'integer', 'list'})
+        data = contract.dump_binary([{'integer': 1, 'list': []}, {'integer': -20, 'list': [{'property2': 1}]}])
+
+        with self.assertRaises(ContractError) as e:
+            contract.load_binary(data)
+
+        self.assertEqual(e.exception.messages, {1: {
+            'integer': ['Must be at least -10.'], 'list': [{0: {'property1': ['This field is required.']}}]}})
+
+    def test_invalid_data(self):
+        contract = self.BinaryContract(only={'integer', 'string'})
+        data = contract.dump_binary({'integer': 1, 'string': 'abc'})
+
+        self.assertRaises(ValueError, self.BinaryContract(only={'integer'}).load_binary, data)
+        self.assertRaises(ValueError, contract.load_binary, data[:-1])
+        self.assertRaises(ValueError, contract.load_binary, data + b'\0')
+
+    def test_invalid_dates(self):
+        # the largest zigzag varint, out of the range of the dates.
+        value = b'\xff' * 9 + b'\x01'
+
+        contract = self.BinaryContract(only={'datetime'})
+        data = contract.dump_binary({'datetime': datetime(2001, 1, 20)})
+        self.assertRaises(ValueError, contract.load_binary, data[:10] + value)
+
+        contract = self.BinaryContract(only={'date'})
+        data = contract.dump_binary({'date': date(2001, 1, 20)})
+        self.assertRaises(ValueError, contract.load_binary, data[:9] + value)
+
+    def test_unsupported_hooks(self):
+        class HookContract(Contract):
+            value = fields.Integer()
+
+            def _pre_load(self, data, context):
+                return data
+
+        self.assertRaises(ValueError, HookContract().load_binary, HookContract().dump_binary({'value': 1}))
+
+
+class TestParallelContract(TestCase):
+    class ValuesContract(Contract):
+        values = fields.List(fields.Integer())
+
+    def test_pickle(self):
+        contract = pickle.loads(pickle.dumps(MyContract(many=True, only={'integer', 'nested.property1'})))
+        self.assertEqual(contract.dump([{'integer': 1, 'float': 1.0, 'nested': {'property1': 'a', 'property2': 2}}]),
+                         [{'integer': 1, 'nested': {'property1': 'a'}}])
+
+        field = pickle.loads(pickle.dumps(MyContract._declared_fields['integer']))
+        self.assertEqual((field.name, field.parent, field.min_value), ('integer', MyContract, 0))
+
+        validator = pickle.loads(pickle.dumps(validators.Length(1, 2)))
+        self.assertEqual((validator.min_length, validator.max_length), (1, 2))
+
+        context = Context()
+        context['key'] = 'value'
+        context.contract = MyContract()
+        context = pickle.loads(pickle.dumps(context))
+        self.assertEqual((context['key'], context.contract), ('value', None))
+
+    def test_dump(self):
+        data = [{'integer': str(i)} for i in range(10)]
+        self.assertEqual(MyContract(many=True, only={'integer'}).dump(data, workers=2, chunk_size=3),
+                         [{'integer': i} for i in range(10)])
+
+    def test_load(self):
+        data = [{'integer': str(i)} for i in range(10)]
+        self.assertEqual(MyContract(many=True, only={'integer'}).load(data, workers=2, chunk_size=3),
+                         [{'integer': i} for i in range(10)])
+
+    def test_load_errors(self):
+        data = [{'integer': 'a' if i in (1, 7) else i} for i in range(10)]
+
+        with self.assertRaises(ContractError) as e:
+            MyContract(many=True, only={'integer'}).load(iter(data), workers=2, chunk_size=3)
+
+        self.assertEqual(e.exception.messages, {1: {'integer': ['A valid integer is required.']},
+                                                7: {'integer': ['A valid integer is required.']}})
+
+    def test_max_errors(self):
+        data = [{'values': ['a'] * 3 if i in (1, 2, 7) else [i]} for i in range(10)]
+        contract = self.ValuesContract(many=True)
+
+        for options in ({'fail_fast': True}, {'max_errors': 2}, {'max_errors': 4}):
+            with self.assertRaises(ContractError) as e:
+                contract.load(data, **options)
+
+            with self.assertRaises(ContractError) as parallel_e:
+                contract.load(data, workers=2, chunk_size=2, **options)
+
+            self.assertEqual(parallel_e.exception.messages, e.exception.messages)
+
+
+class TestThreadedContract(TestCase):
+    def test_shared_contract(self):
+        class ThreadedContract(Contract):
+            dump_cache = DumpCache(key=lambda item: item['id'])
+
+            id = fields.Integer()
+            name = fields.String(validators=[validators.Length(1, 10)])
+            created = fields.DateTime(memoize=8)
+            items = fields.List(fields.Nested(NestedContract), required=False)
+
+        contract = ThreadedContract()
+        items = [{'id': i, 'name': 'name{0}'.format(i % 7), 'items': [{'property1': str(i), 'property2': i}],
+                  'created': datetime(2026, 1, i % 9 + 1, tzinfo=timezone.utc)} for i in range(200)]
+        dumped = [contract.dump(item) for item in items]
+        loaded = [contract.load(item) for item in dumped]
+
+        def run(offset):
+            for i in range(len(items)):
+                index = (i + offset) % len(items)
+
+                if contract.dump(items[index]) != dumped[index] or contract.load(dumped[index]) != loaded[index]:
+                    return False
+
+                if index % 50 == 0:
+                    ThreadedContract.dump_cache.invalidate()
+
+                with self.assertRaises(ContractError):
+                    contract.load({'id': 'a', 'name': ''})
+
+            return True
+
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            self.assertTrue(all(executor.map(run, range(0, 400, 25))))
+
+    def test_nested_resolved(self):
+        contract = MyContract()
+        self.assertIsNotNone(contract.fields['nested']._instance)
+
+
+class TestAsyncContract(TestCase):
+    def test_adump(self):
+        data = [{'integer': str(i)} for i in range(10)]
+        self.assertEqual(asyncio.run(MyContract(many=True, only={'integer'}).adump(data, yield_every=3)),
+                         [{'integer': i} for i in range(10)])
+        self.assertEqual(asyncio.run(MyContract().adump({'integer': '1'})), {'integer': 1})
+
+    def test_aload(self):
+        data = [{'integer': str(i)} for i in range(10)]
+        self.assertEqual(asyncio.run(MyContract(many=True, only={'integer'}).aload(iter(data), yield_every=3)),
+                         [{'integer': i} for i in range(10)])
+
+    def test_aload_errors(self):
+        data = [{'integer': 'a' if i in (1, 7) else i} for i in range(10)]
+
+        with self.assertRaises(ContractError) as e:
+            asyncio.run(MyContract(many=True, only={'integer'}).aload(data, yield_every=3, max_errors=5))
+
+        self.assertEqual(e.exception.messages, {1: {'integer': ['A valid integer is required.']},
+                                                7: {'integer': ['A valid integer is required.']}})
+
+    def test_yields_to_event_loop(self):
+        ticks = []
+
+        async def tick():
+            while True:
+                ticks.append(len(ticks))
+                await asyncio.sleep(0)
+
+        async def main():
+            task = asyncio.ensure_future(tick())
+            await asyncio.sleep(0)
+            await MyContract(many=True, only={'integer'}).aload([{'integer': i} for i in range(100)], yield_every=10)
+            task.cancel()
+            return len(ticks)
+
+        self.assertGreaterEqual(asyncio.run(main()), 10)
+
+    def test_awaitable_fields(self):
+        class LookupContract(Contract):
+            id = fields.Integer()
+            name = fields.Method('get_name', 'load_name')
+
+            async def get_name(self, value, context):
+                await asyncio.sleep(0)
+                return 'name{0}'.format(value)
+
+            async def load_name(self, value, context):
+                if value == 'invalid':
+                    raise ValidationError('Unknown name.')
+                return value.upper()
+
+        contract = LookupContract(many=True)
+        self.assertEqual(asyncio.run(contract.adump([{'id': 1, 'name': 1}, {'id': 2, 'name': 2}], yield_every=1)),
+                         [{'id': 1, 'name': 'name1'}, {'id': 2, 'name': 'name2'}])
+        self.assertEqual(asyncio.run(contract.aload([{'id': 1, 'name': 'a'}])), [{'id': 1, 'name': 'A'}])
+
+        with self.assertRaises(ContractError) as e:
+            asyncio.run(contract.aload([{'id': 1, 'name': 'a'}, {'id': 2, 'name': 'invalid'}], max_errors=5))
+
+        self.assertEqual(e.exception.messages, {1: {'name': ['Unknown name.']}})
+
+    def test_nested_awaitable_fields(self):
+        async def lookup(value, context):
+            if value == 'invalid':
+                raise ValidationError('Unknown name.')
+            return value.upper()
+
+        class NameContract(Contract):
+            name = fields.Function(lookup, lookup)
+
+        class ParentContract(Contract):
+            child = fields.Nested(NameContract)
+            children = fields.Nested(NameContract, many=True)
+            items = fields.List(fields.Nested(NameContract))
+
+        data = {'child': {'name': 'a'}, 'children': [{'name': 'b'}], 'items': [{'name': 'c'}, {'name': 'd'}]}
+        expected = {'child': {'name': 'A'}, 'children': [{'name': 'B'}], 'items': [{'name': 'C'}, {'name': 'D'}]}
+
+        self.assertEqual(asyncio.run(ParentContract().adump(data)), expected)
+        self.assertEqual(asyncio.run(ParentContract(many=True).aload([data])), [expected])
+
+        with self.assertRaises(ContractError) as e:
+            asyncio.run(ParentContract().aload(dict(data, items=[{'name': 'c'}, {'name': 'invalid'}])))
+
+        self.assertEqual(e.exception.messages, {'items': [{1: {'name': ['Unknown name.']}}]})
+
+    def test_awaitable_field_validators(self):
+        async def double(value, context):
+            return value * 2
+
+        class DoubleContract(Contract):
+            value = fields.Function(load_func=double, validators=[validators.Range(0, 5)])
+
+        self.assertEqual(asyncio.run(DoubleContract().aload({'value': 2})), {'value': 4})
+
+        with self.assertRaises(ContractError) as e:
+            asyncio.run(DoubleContract().aload({'value': 3}))
+
+        self.assertEqual(e.exception.messages, {'value': ['Must be at most 5.']})
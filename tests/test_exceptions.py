@@ -1,4 +1,4 @@
-from contracts.exceptions import ContractError, ValidationError
+from contracts.exceptions import ContractError, ErrorMessage, ValidationError
 from unittest import TestCase
 
 
@@ -15,6 +15,15 @@ class TestValidationError(TestCase):
         error = ValidationError(['error'])
         self.assertEqual(error.messages, ['error'])
 
+    def test_str_and_repr_format_messages(self):
+        error = ValidationError(ErrorMessage('min_value', 'Must be at least {min_value}.', {'min_value': 5}))
+        self.assertEqual(str(error), 'Must be at least 5.')
+        self.assertEqual(repr(error), "ValidationError('Must be at least 5.')")
+        self.assertIsInstance(error._messages[0], ErrorMessage)
+
+        error = ContractError([error])
+        self.assertEqual(str(error), "[ValidationError('Must be at least 5.')]")
+
 
 class TestContractError(TestCase):
     def test_error_with_field(self):
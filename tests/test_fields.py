@@ -1,6 +1,6 @@
 import uuid
 
-from contracts import Contract, Context, fields, timezone
+from contracts import Contract, Context, fields, timezone, validators
 from contracts.exceptions import ValidationError
 from contracts.utils import missing
 from datetime import datetime, date
@@ -121,6 +121,37 @@ class TestField(BaseTestCase):
         field = fields.Field(validators=[validator])
         self.assertRaises(ValueError, field.load, 123, None)
 
+    def test_builtin_validators(self):
+        class EvenRange(validators.Range):
+            def __call__(self, value):
+                super().__call__(value)
+
+                if value % 2:
+                    raise ValidationError('Must be even.')
+
+        field = fields.Integer(validators=[validators.OneOf([1, 2, 3, 4, 12])])
+        field.validators.append(EvenRange(max_value=10))
+
+        self._load_equal(field, 2, 2)
+        self._load_raises(field, 3, ['Must be even.'])
+        self._load_raises(field, 5, ['Not a valid choice.', 'Must be even.'])
+        self._load_raises(field, 12, ['Must be at most 10.'])
+
+    def test_validators_order(self):
+        def positive(value):
+            if value <= 0:
+                raise ValidationError('Must be positive.')
+
+        field = fields.Integer(validators=[positive, validators.Range(max_value=-5), validators.OneOf([1])])
+        self._load_raises(field, -10, ['Must be positive.', 'Not a valid choice.'])
+
+    def test_validators_replaced(self):
+        field = fields.Integer(validators=[validators.Range(0, 10)])
+        self._load_equal(field, 5, 5)
+
+        field.validators = [validators.Range(0, 1)]
+        self._load_raises(field, 5, ['Must be at most 1.'])
+
     def test_null_error_message(self):
         field = fields.Field()
 
@@ -143,6 +174,22 @@ class TestField(BaseTestCase):
 
         self.assertEqual(e.exception.messages, ['custom fail'])
 
+    def test_shared_error_messages(self):
+        field = fields.Integer(min_value=1)
+        custom = fields.Integer(min_value=1, error_messages={'min_value': 'custom fail'})
+
+        self.assertIsNot(custom.error_messages, field.error_messages)
+        self.assertEqual(field.error_messages['min_value'], 'Must be at least {min_value}.')
+        self._load_raises(custom, 0, ['custom fail'])
+
+        # changing the messages of a field does not change the other fields of its class.
+        field.error_messages['invalid'] = 'changed'
+        field.validators[0].error_messages['min_value'] = 'changed'
+        self._load_raises(field, 'a', ['changed'])
+        self._load_raises(field, 0, ['changed'])
+        self._load_raises(fields.Integer(), 'a', ['A valid integer is required.'])
+        self._load_raises(fields.Integer(min_value=1), 0, ['Must be at least 1.'])
+
     def test_dict_error_message(self):
         field = fields.Field(error_messages={'invalid': {'message': 'error message', 'code': 123}})
 
@@ -444,6 +491,22 @@ class TestListField(BaseTestCase):
         field = fields.List(fields.Integer(), allow_empty=False)
         self._load_raises(field, [], ['This list may not be empty.'])
 
+    def test_nested_inputs(self):
+        class ItemContract(Contract):
+            value = fields.Integer()
+
+            def _post_load(self, data, context):
+                data['contract'] = type(context.contract).__name__
+                return data
+
+        field = fields.List(fields.Nested(ItemContract, allow_none=True))
+        self._load_equal(field, [{'value': '1'}, None], [{'value': 1, 'contract': 'ItemContract'}, None])
+        self._load_raises(field, [{'value': 1}, {'value': 'a'}, {}, None], [{
+            1: {'value': ['A valid integer is required.']}, 2: {'value': ['This field is required.']}}])
+
+        field = fields.List(fields.Nested(ItemContract))
+        self._load_raises(field, [None], [{0: ['This field may not be null.']}])
+
 
 class TestMethod(BaseTestCase):
     """
@@ -519,6 +582,14 @@ class TestString(BaseTestCase):
         self._dump_equal(field, 1.0, '1.0')
         self._dump_equal(field, 'abc', 'abc')
 
+    def test_intern(self):
+        field = fields.String(intern=True)
+        value = field.load(1234567, Context())
+
+        self.assertIs(field.load(1234567, Context()), value)
+        self.assertIs(fields.String(intern=True, trim_whitespace=True).load(' 1234567 ', Context()), value)
+        self.assertIsNot(fields.String().load(1234567, Context()), value)
+
     def test_trim_whitespace(self):
         field = fields.String(trim_whitespace=True)
         self._load_equal(field, ' abc ', 'abc')
@@ -574,6 +645,20 @@ class TestUUID(BaseTestCase):
         self._load_raises(field, (1, 2, 3), ['"(1, 2, 3)" is not a valid UUID.'])
         self._load_raises(field, 123, ['"123" is not a valid UUID.'])
 
+    def test_memoize(self):
+        field = fields.UUID(memoize=2)
+        value = '825d7aeb-05a9-45b5-a5b7-05df87923cda'
+
+        self.assertIs(field.load(value, Context()), field.load(value, Context()))
+        self._load_raises(field, '825d7aeb', ['"825d7aeb" is not a valid UUID.'])
+        self._load_raises(field, '825d7aeb', ['"825d7aeb" is not a valid UUID.'])
+        self.assertEqual((field.memo.hits, field.memo.misses, len(field.memo)), (1, 3, 1))
+
+        self.assertEqual(fields.UUID(memoize=True).memo.maxsize, fields.FIELD_MEMOIZE_MAXSIZE)
+
+        with self.assertRaises(ValueError):
+            fields.List(fields.UUID(), memoize=True)
+
     def test_valid_outputs(self):
         field = fields.UUID()
         self._dump_equal(field, uuid.UUID('825d7aeb-05a9-45b5-a5b7-05df87923cda'), '825d7aeb-05a9-45b5-a5b7-05df87923cda')
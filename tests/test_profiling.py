@@ -0,0 +1,56 @@
+from contracts import Contract, fields, profile, validators
+from contracts.exceptions import ContractError
+from unittest import TestCase
+
+
+class NestedContract(Contract):
+    value = fields.Integer()
+
+
+class MyContract(Contract):
+    integer = fields.Integer(validators=[validators.Range(0, 10)])
+    string = fields.String()
+    nested = fields.Nested(NestedContract, required=False)
+
+    def _post_load(self, data, context):
+        return data
+
+
+class TestProfiler(TestCase):
+    def test_profile_load(self):
+        with profile() as profiler:
+            MyContract(many=True).load([{'integer': '1', 'string': 'a', 'nested': {'value': 2}}] * 3)
+
+        stats = profiler.stats()
+
+        self.assertEqual(stats[(MyContract, 'integer', 'convert')]['calls'], 3)
+        self.assertEqual(stats[(MyContract, 'integer', 'validate')]['calls'], 3)
+        self.assertEqual(stats[(MyContract, 'string', 'convert')]['calls'], 3)
+        self.assertEqual(stats[(MyContract, '_post_load', 'hook')]['calls'], 3)
+        self.assertEqual(stats[(NestedContract, 'value', 'convert')]['calls'], 3)
+        self.assertGreaterEqual(stats[(MyContract, 'nested', 'convert')]['time'],
+                                stats[(NestedContract, 'value', 'convert')]['time'])
+        self.assertNotIn((MyContract, 'string', 'validate'), stats)
+
+    def test_profile_dump(self):
+        with profile() as profiler:
+            MyContract().dump_json({'integer': 1, 'string': 'a'})
+
+        self.assertEqual(set(profiler.stats()), {(MyContract, 'integer', 'convert'), (MyContract, 'string', 'convert')})
+        self.assertIn('integer', profiler.table())
+
+    def test_profile_errors(self):
+        with profile() as profiler:
+            with self.assertRaises(ContractError):
+                MyContract().load({'integer': 20, 'string': 'a'})
+
+        self.assertEqual(profiler.stats()[(MyContract, 'integer', 'validate')]['calls'], 1)
+
+    def test_inactive(self):
+        profiler = profile()
+
+        with profiler:
+            pass
+
+        MyContract().load({'integer': 1, 'string': 'a'})
+        self.assertEqual(profiler.stats(), {})